@@ -1,8 +1,10 @@
 import sys
 import os
 import numpy as np
+#dadi 1.x imports matplotlib (dadi.Plotting imports pylab) as soon as it is imported,
+#pick the non-interactive backend before that so no display is needed
+os.environ.setdefault("MPLBACKEND", "Agg")
 import dadi
-import pylab
 import Models_2D
 import Optimize_Functions
 from datetime import datetime
@@ -45,7 +47,7 @@ print "sample sizes", fs_1.sample_sizes
 print "Segregating sites",fs_1.S(), '\n', '\n'
 
 #======================================================================================
-# Prepare settings to run the optimization round 2 function defined in the 
+# Prepare settings to run the optimization round 1 function defined in the 
 # script 'Optimize_Functions.py'.
 
 #**************
@@ -60,13 +62,13 @@ maxiter = int(20)
 # Call the function with the relevant arguments.
 
 # Divergence with no migration
-Optimize_Functions.Optimize_Round1(pts, fs, outfile, reps, maxiter, "no_mig", no_mig_params)
+Optimize_Functions.Optimize_Round1(pts, fs, outfile, reps, maxiter, "no_mig")
 
 # Split into two populations, with continuous symmetric migration.
-Optimize_Functions.Optimize_Round1(pts, fs, outfile, reps, maxiter, "sym_mig", sym_mig_params)
+Optimize_Functions.Optimize_Round1(pts, fs, outfile, reps, maxiter, "sym_mig")
 
 # Split into two populations, with continuous asymmetric migration.
-Optimize_Functions.Optimize_Round1(pts, fs, outfile, reps, maxiter, "asym_mig", asym_mig_params)
+Optimize_Functions.Optimize_Round1(pts, fs, outfile, reps, maxiter, "asym_mig")
 
 #===========================================================================
 #clock the amount of time to complete the script
@@ -1,8 +1,10 @@
 import sys
 import os
 import numpy as np
+#dadi 1.x imports matplotlib (dadi.Plotting imports pylab) as soon as it is imported,
+#pick the non-interactive backend before that so no display is needed
+os.environ.setdefault("MPLBACKEND", "Agg")
 import dadi
-import pylab
 import Models_2D
 import Optimize_Functions
 from datetime import datetime
@@ -6,15 +6,44 @@ from dadi.Spectrum_mod import Spectrum
 Models for testing two population scenarios.
 '''
 
+#grids are identical for every model and parameter set with the same number of points,
+#so they are built once per process and shared
+_grids = {}
+
+def _default_grid(pts):
+    """
+    Numerics.default_grid(pts), computed once per number of grid points.
+    """
+    if pts not in _grids:
+        _grids[pts] = Numerics.default_grid(pts)
+    return _grids[pts]
+
+
+#the equilibrium phi every model starts from only depends on the grid as well: it is
+#computed once per number of grid points and kept read-only, so forked worker processes
+#keep sharing its memory, and each model evaluation integrates its own copy
+_phis = {}
+
+def _equilibrium_phi(pts):
+    """
+    Copy of PhiManip.phi_1D_to_2D(xx, PhiManip.phi_1D(xx)), computed once per number of grid points.
+    """
+    if pts not in _phis:
+        xx = _default_grid(pts)
+        phi = PhiManip.phi_1D_to_2D(xx, PhiManip.phi_1D(xx))
+        phi.setflags(write=False)
+        _phis[pts] = phi
+    return _phis[pts].copy()
+
+
 def no_divergence(notused, ns, pts):
     """
     Standard neutral model, populations never diverge.
     """
     
-    xx = Numerics.default_grid(pts)
+    xx = _default_grid(pts)
     
-    phi = PhiManip.phi_1D(xx)
-    phi = PhiManip.phi_1D_to_2D(xx, phi)
+    phi = _equilibrium_phi(pts)
     
     fs = Spectrum.from_phi(phi, ns, (xx,xx))
     return fs
@@ -30,10 +59,9 @@ def no_mig(params, ns, pts):
     """
     nu1, nu2, T = params
 
-    xx = Numerics.default_grid(pts)
+    xx = _default_grid(pts)
 
-    phi = PhiManip.phi_1D(xx)
-    phi = PhiManip.phi_1D_to_2D(xx, phi)
+    phi = _equilibrium_phi(pts)
 
     phi = Integration.two_pops(phi, xx, T, nu1, nu2, m12=0, m21=0)
 
@@ -52,10 +80,9 @@ def sym_mig(params, ns, pts):
     """
     nu1, nu2, m, T = params
 
-    xx = Numerics.default_grid(pts)
+    xx = _default_grid(pts)
 
-    phi = PhiManip.phi_1D(xx)
-    phi = PhiManip.phi_1D_to_2D(xx, phi)
+    phi = _equilibrium_phi(pts)
 
     phi = Integration.two_pops(phi, xx, T, nu1, nu2, m12=m, m21=m)
 
@@ -74,10 +101,9 @@ def asym_mig(params, ns, pts):
     m21: Migration from pop 1 to pop 2
 	"""
     nu1, nu2, m12, m21, T = params
-    xx = Numerics.default_grid(pts)
+    xx = _default_grid(pts)
     
-    phi = PhiManip.phi_1D(xx)
-    phi = PhiManip.phi_1D_to_2D(xx, phi)
+    phi = _equilibrium_phi(pts)
     
     phi = Integration.two_pops(phi, xx, T, nu1, nu2, m12=m12, m21=m21)
     fs = Spectrum.from_phi(phi, ns, (xx,xx))
@@ -1,8 +1,26 @@
+import os
+#dadi 1.x imports matplotlib (dadi.Plotting imports pylab) as soon as it is imported,
+#pick the non-interactive backend before that so no display is needed
+os.environ.setdefault("MPLBACKEND", "Agg")
 import dadi
 import numpy as np
-import pylab
-import Models_2D
-import matplotlib.pyplot as plt
+import scipy.optimize
+import atexit
+import collections
+import cPickle
+import errno
+import hashlib
+import imp
+import math
+import multiprocessing
+import numbers
+import re
+import shutil
+import signal
+import socket
+import sqlite3
+import tempfile
+import time
 
 '''
 Optimization_Functions used for demographic modeling in 
@@ -14,7292 +32,2510 @@ CITE: https://onlinelibrary.wiley.com/doi/abs/10.1111/mec.14266
 Patricia Wepfer
 '''
 
+#======================================================================================
+#======================================================================================
+#======================================================================================
+#======================================================================================
+#Model registry
+
+# Every model the optimization functions can run is described once here:
+# model_name: Model(module, label, param_names, lower_bound, upper_bound, start, k)
+
+# module:  file the model function lives in ("Models_2D" or "Models_3D"), the function
+#        itself has the same name as the model and is only imported when first used
+# label:  model description written in the first column of the output files
+# param_names:  names of the parameters in the order the model function expects them
+# lower_bound, upper_bound:  bounds for the parameter search
+# start:  basic starting params, perturbed in round 1
+# k:  number of parameters used for the AIC (the manuscript runs used 10 for both
+#        split_asymmig_all and starsplit, which have 13 and 9 parameters)
+
+# To run your own model, add an entry for it below.
+
+Model = collections.namedtuple("Model", ["module", "label", "param_names", "lower_bound", "upper_bound", "start", "k"])
+
+MODELS = {
+    #2D MODELS (Models_2D.py)
+    "no_divergence": Model("Models_2D", "No divergence model",
+        [],
+        [], [], [], 3),
+    "no_mig": Model("Models_2D", "Divergence with no migration",
+        ["nu1", "nu2", "T"],
+        [0.01, 0.01, 0], [30, 30, 10], [1, 1, 1], 3),
+    "sym_mig": Model("Models_2D", "Divergence with symmetric migration",
+        ["nu1", "nu2", "m", "T"],
+        [0.01, 0.01, 0.01, 0], [30, 30, 20, 10], [1, 1, 1, 1], 4),
+    "asym_mig": Model("Models_2D", "Divergence with asymmetric migration",
+        ["nu1", "nu2", "m12", "m21", "T"],
+        [0.01, 0.01, 0.01, 0.01, 0], [30, 30, 20, 20, 10], [1, 1, 1, 1, 1], 5),
+    "anc_sym_mig": Model("Models_2D", "Divergence with ancient symmetrical migration",
+        ["nu1", "nu2", "m", "T1", "T2"],
+        [0.01, 0.01, 0.01, 0, 0], [30, 30, 20, 10, 10], [1, 1, 1, 1, 1], 5),
+    "anc_asym_mig": Model("Models_2D", "Divergence with ancient asymmetrical migration",
+        ["nu1", "nu2", "m12", "m21", "T1", "T2"],
+        [0.01, 0.01, 0.01, 0.01, 0, 0], [30, 30, 20, 20, 10, 10], [1, 1, 1, 1, 1, 1], 6),
+    "sec_contact_sym_mig": Model("Models_2D", "Divergence and symmetrical secondary contact",
+        ["nu1", "nu2", "m", "T1", "T2"],
+        [0.01, 0.01, 0.01, 0, 0], [30, 30, 20, 10, 10], [1, 1, 1, 1, 1], 5),
+    "sec_contact_asym_mig": Model("Models_2D", "Divergence and asymmetrical secondary contact",
+        ["nu1", "nu2", "m12", "m21", "T1", "T2"],
+        [0.01, 0.01, 0.01, 0.01, 0, 0], [30, 30, 20, 20, 10, 10], [1, 1, 1, 1, 1, 1], 6),
+    "no_mig_size": Model("Models_2D", "Divergence with no migration, size change",
+        ["nu1a", "nu2a", "nu1b", "nu2b", "T1", "T2"],
+        [0.01, 0.01, 0.01, 0.01, 0, 0], [30, 30, 30, 30, 10, 10], [1, 1, 1, 1, 1, 1], 6),
+    "sym_mig_size": Model("Models_2D", "Divergence with symmetric migration, size change",
+        ["nu1a", "nu2a", "nu1b", "nu2b", "m", "T1", "T2"],
+        [0.01, 0.01, 0.01, 0.01, 0.01, 0, 0], [30, 30, 30, 30, 20, 10, 10], [1, 1, 1, 1, 1, 1, 1], 7),
+    "asym_mig_size": Model("Models_2D", "Divergence with asymmetric migration, size change",
+        ["nu1a", "nu2a", "nu1b", "nu2b", "m12", "m21", "T1", "T2"],
+        [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0, 0], [30, 30, 30, 30, 20, 20, 10, 10], [1, 1, 1, 1, 1, 1, 1, 1], 8),
+    "anc_sym_mig_size": Model("Models_2D", "Divergence with ancient symmetrical migration, size change",
+        ["nu1a", "nu2a", "nu1b", "nu2b", "m", "T1", "T2"],
+        [0.01, 0.01, 0.01, 0.01, 0.01, 0, 0], [30, 30, 30, 30, 20, 10, 10], [1, 1, 1, 1, 1, 1, 1], 7),
+    "anc_asym_mig_size": Model("Models_2D", "Divergence with ancient asymmetrical migration, size change",
+        ["nu1a", "nu2a", "nu1b", "nu2b", "m12", "m21", "T1", "T2"],
+        [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0, 0], [30, 30, 30, 30, 20, 20, 10, 10], [1, 1, 1, 1, 1, 1, 1, 1], 8),
+    "sec_contact_sym_mig_size": Model("Models_2D", "Divergence and symmetrical secondary contact, size change",
+        ["nu1a", "nu2a", "nu1b", "nu2b", "m", "T1", "T2"],
+        [0.01, 0.01, 0.01, 0.01, 0.01, 0, 0], [30, 30, 30, 30, 20, 10, 10], [1, 1, 1, 1, 1, 1, 1], 7),
+    "sec_contact_asym_mig_size": Model("Models_2D", "Divergence and asymmetrical secondary contact, size change",
+        ["nu1a", "nu2a", "nu1b", "nu2b", "m12", "m21", "T1", "T2"],
+        [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0, 0], [30, 30, 30, 30, 20, 20, 10, 10], [1, 1, 1, 1, 1, 1, 1, 1], 8),
+    "sym_mig_twoepoch": Model("Models_2D", "Divergence with symmetric migration, two epochs",
+        ["nu1", "nu2", "m1", "m2", "T1", "T2"],
+        [0.01, 0.01, 0.01, 0.01, 0, 0], [30, 30, 20, 20, 10, 10], [1, 1, 1, 1, 1, 1], 6),
+    "asym_mig_twoepoch": Model("Models_2D", "Divergence with asymmetric migration, two epoch",
+        ["nu1", "nu2", "m12a", "m21a", "m12b", "m21b", "T1", "T2"],
+        [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0, 0], [30, 30, 20, 20, 20, 20, 10, 10], [1, 1, 1, 1, 1, 1, 1, 1], 8),
+    "sec_contact_sym_mig_three_epoch": Model("Models_2D", "Divergence and symmetrical secondary contact, three epoch",
+        ["nu1", "nu2", "m", "T1", "T2", "T3"],
+        [0.01, 0.01, 0.01, 0, 0, 0], [30, 30, 20, 10, 10, 10], [1, 1, 1, 1, 1, 1], 6),
+    "sec_contact_asym_mig_three_epoch": Model("Models_2D", "Divergence and asymmetrical secondary contact, three epoch",
+        ["nu1", "nu2", "m12", "m21", "T1", "T2", "T3"],
+        [0.01, 0.01, 0.01, 0.01, 0, 0, 0], [30, 30, 20, 20, 10, 10, 10], [1, 1, 1, 1, 1, 1, 1], 7),
+    "sec_contact_sym_mig_size_three_epoch": Model("Models_2D", "Divergence and symmetrical secondary contact, size change, three epoch",
+        ["nu1a", "nu2a", "nu1b", "nu2b", "m", "T1", "T2", "T3"],
+        [0.01, 0.01, 0.01, 0.01, 0.01, 0, 0, 0], [30, 30, 30, 30, 20, 10, 10, 10], [1, 1, 1, 1, 1, 1, 1, 1], 8),
+    "sec_contact_asym_mig_size_three_epoch": Model("Models_2D", "Divergence and asymmetrical secondary contact, size change, three epoch",
+        ["nu1a", "nu2a", "nu1b", "nu2b", "m12", "m21", "T1", "T2", "T3"],
+        [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0, 0, 0], [30, 30, 30, 30, 20, 20, 10, 10, 10], [1, 1, 1, 1, 1, 1, 1, 1, 1], 9),
 
-#======================================================================================
-#======================================================================================
-#======================================================================================
-#======================================================================================
-#Optimizations Round 1 function (run models with basic starting params)
-
-# Optimize_Round1(pts, fs, outfile, reps, maxiter, model_name)
-
-# Argument definitions:
-# pts:  grid choice (list of three numbers, ex. [20,30,40]
-# fs:  spectrum object name
-# outfile:  prefix for output naming -> "Round1_{0}_{1}_optimized.txt".format(outfile,model_name)
-# reps:  integer to control number of replicates, ex. 10
-# maxiter:  max number of iterations per optimization step (not intuitive! see dadi user group)
-# model_name:  "no_divergence", "no_mig", "sym_mig", "asym_mig", "anc_sym_mig", "anc_asym_mig",
-#        "sec_contact_sym_mig", "sec_contact_asym_mig", "no_mig_size", "sym_mig_size",
-#        "asym_mig_size", "anc_sym_mig_size", "anc_asym_mig_size", "sec_contact_sym_mig_size",
-#        "sec_contact_asym_mig_size"
-
-def Optimize_Round1(pts, fs, outfile, reps, y, model_name):
-    print '\n',"============================================================================"
-    print "Beginning analysis of {}".format(model_name)
-    print "============================================================================"
-
-    #create output file
-    outname = "Round1_{0}_{1}_optimized.txt".format(outfile,model_name)
-    fh_out = open(outname, 'a')
-    fh_out.write("Model"+'\t'+"param_set"+'\t'+"Replicate"+'\t'+"log-likelihood"+'\t'+"theta"+'\t'+"AIC"+'\t'+"optimized_params"+'\n')
-    fh_out.close()
-    
-    #variable to control number of loops per model (1 to x)
-    x = int(reps) + int(1)
-        
-    if model_name == "no_divergence":
-        #####################################
-        #No Divergence
-        #####################################
-        print "---------------------------------------------------"
-        print "No Divergence",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.no_divergence
-        params = []
-        print "parameter set = [none]"
-        
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-        
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("No divergence model"+'\t')
-            fh_out.write("parameter set = [none]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params, fs.sample_sizes, pts)
-            
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*3)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-            
-            fh_out.write('\n')
-            fh_out.close()
-
-        print "---------------------------------------------------", '\n'
-
-        
-    elif model_name == "no_mig":
-        fh_out = open(outname, 'a')
-        #####################################
-        # Divergence with no migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with no migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.no_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0]
-        upper_bound = [30, 30, 10]
-        params = [1,1,1]
-        print "parameter set = [nu1, nu2, T]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence with no migration"+'\t')
-            fh_out.write("parameter set = [nu1, nu2, T]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=3, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*3)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-        
-    elif model_name == "sym_mig":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence with symmetric migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with symmetric migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sym_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0]
-        upper_bound = [30, 30, 20, 10]
-        params = [1,1,1,1]
-        print "parameter set = [nu1, nu2, m, T]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence with symmetric migration"+'\t')
-            fh_out.write("parameter set = [nu1, nu2, m, T]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=3, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*4)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-        
-    elif model_name == "asym_mig":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence with asymmetric migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with asymmetric migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.asym_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0]
-        upper_bound = [30, 30, 20, 20, 10]
-        params = [1,1,1,1,1]
-        print "parameter set = [nu1, nu2, m12, m21, T]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence with asymmetric migration"+'\t')
-            fh_out.write("parameter set = [nu1, nu2, m12, m21, T]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=3, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*5)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-        
-    elif model_name == "anc_sym_mig":
-        fh_out = open(outname, 'a') 
-        #####################################
-        #Divergence with ancient symmetrical migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with ancient symmetrical migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.anc_sym_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 20, 10, 10]
-        params = [1,1,1,1,1]
-        print "parameter set = [nu1, nu2, m, T1, T2]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence with ancient symmetrical migration"+'\t')
-            fh_out.write("parameter set = [nu1, nu2, m, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=3, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*5)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-        
-    elif model_name == "anc_asym_mig":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence with ancient asymmetrical migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with ancient asymmetrical migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.anc_asym_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 20, 20, 10, 10]
-        params = [1,1,1,1,1,1]
-        print "parameter set = [nu1, nu2, m12, m21, T1, T2]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence with ancient asymmetrical migration"+'\t')
-            fh_out.write("parameter set = [nu1, nu2, m12, m21, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=3, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*6)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-        
-    elif model_name == "sec_contact_sym_mig":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence and symmetrical secondary contact
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence and symmetrical secondary contact",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sec_contact_sym_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 20, 10, 10]
-        params = [1,1,1,1,1]
-        print "parameter set = [nu1, nu2, m, T1, T2]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence and symmetrical secondary contact"+'\t')
-            fh_out.write("parameter set = [nu1, nu2, m, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=3, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*5)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-        
-        
-    elif model_name == "sec_contact_asym_mig":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence and asymmetrical secondary contact
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence and asymmetrical secondary contact",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sec_contact_asym_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 20, 20, 10, 10]
-        params = [1,1,1,1,1,1]
-        print "parameter set = [nu1, nu2, m12, m21, T1, T2]"
-        
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence and asymmetrical secondary contact"+'\t')
-            fh_out.write("parameter set = [nu1, nu2, m12, m21, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=3, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*6)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-
-    ##########################################################################
-    #Similar models but with size change allowed
-    ##########################################################################
-    
-    elif model_name == "no_mig_size":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence with no migration, size change
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with no migration, size change",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.no_mig_size
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 30, 30, 10, 10]
-        params = [1,1,1,1,1,1]
-        print "parameter set = [nu1a, nu2a, nu1b, nu2b, T1, T2]"
- 
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence with no migration, size change"+'\t')
-            fh_out.write("parameter set = [nu1a, nu2a, nu1b, nu2b, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=3, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*6)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-        
-        
-    elif model_name == "sym_mig_size":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence with symmetric migration, size change
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with symmetric migration, size change",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sym_mig_size
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 30, 30, 20, 10, 10]
-        params = [1,1,1,1,1,1,1]
-        print "parameter set = [nu1a, nu2a, nu1b, nu2b, m, T1, T2]"
- 
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence with symmetric migration, size change"+'\t')
-            fh_out.write("parameter set = [nu1a, nu2a, nu1b, nu2b, m, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=3, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*7)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-        
-
-    elif model_name == "asym_mig_size":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence with asymmetric migration, size change
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with asymmetric migration, size change",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.asym_mig_size
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 30, 30, 20, 20, 10, 10]
-        params = [1,1,1,1,1,1,1,1]
-        print "parameter set = [nu1a, nu2a, nu1b, nu2b, m12, m21, T1, T2]"
- 
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence with asymmetric migration, size change"+'\t')
-            fh_out.write("parameter set = [nu1a, nu2a, nu1b, nu2b, m12, m21, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=3, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*8)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
- 
- 
-    elif model_name == "anc_sym_mig_size":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence with ancient symmetrical migration, size change
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with ancient symmetrical migration, size change",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.anc_sym_mig_size
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 30, 30, 20, 10, 10]
-        params = [1,1,1,1,1,1,1]
-        print "parameter set = [nu1a, nu2a, nu1b, nu2b, m, T1, T2]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence with ancient symmetrical migration, size change"+'\t')
-            fh_out.write("parameter set = [nu1a, nu2a, nu1b, nu2b, m, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=3, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*7)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-        
-    elif model_name == "anc_asym_mig_size":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence with ancient asymmetrical migration, size change
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with ancient asymmetrical migration, size change",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.anc_asym_mig_size
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 30, 30, 20, 20, 10, 10]
-        params = [1,1,1,1,1,1,1,1]
-        print "parameter set = [nu1a, nu2a, nu1b, nu2b, m12, m21, T1, T2]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence with ancient asymmetrical migration, size change"+'\t')
-            fh_out.write("parameter set = [nu1a, nu2a, nu1b, nu2b, m12, m21, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=3, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*8)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-
-    elif model_name == "sec_contact_sym_mig_size":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence and symmetrical secondary contact, size change
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence and symmetrical secondary contact, size change",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sec_contact_sym_mig_size
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 30, 30, 20, 10, 10]
-        params = [1,1,1,1,1,1,1]
-        print "parameter set = [nu1a, nu2a, nu1b, nu2b, m, T1, T2]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence and symmetrical secondary contact, size change"+'\t')
-            fh_out.write("parameter set = [nu1a, nu2a, nu1b, nu2b, m, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=3, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*7)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-           
-    elif model_name == "sec_contact_asym_mig_size":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence and asymmetrical secondary contact, size change
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence and asymmetrical secondary contact, size change",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sec_contact_asym_mig_size
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 30, 30, 20, 20, 10, 10]
-        params = [1,1,1,1,1,1,1,1]
-        print "parameter set = [nu1a, nu2a, nu1b, nu2b, m12, m21, T1, T2]"
-    
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence and asymmetrical secondary contact, size change"+'\t')
-            fh_out.write("parameter set = [nu1a, nu2a, nu1b, nu2b, m12, m21, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=3, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*8)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-        
-    ########################################################################################################################################
-    #Newer Models added here below
-    ########################################################################################################################################
-
-    elif model_name == "sym_mig_twoepoch":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence with symmetric migration, two epoch
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with symmetric migration, two epoch",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sym_mig_twoepoch
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 20, 20, 10, 10]
-        params = [1,1,1,1,1,1]
-        print "parameter set = [nu1, nu2, m1, m2, T1, T2]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence with symmetric migration, two epochs"+'\t')
-            fh_out.write("parameter set = [nu1, nu2, m1, m2, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=3, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*6)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-        
-    elif model_name == "asym_mig_twoepoch":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence with asymmetric migration, two epoch
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with asymmetric migration, two epoch",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.asym_mig_twoepoch
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 20, 20, 20, 20, 10, 10]
-        params = [1,1,1,1,1,1,1,1]
-        print "parameter set = [nu1, nu2, m12a, m21a, m12b, m21b, T1, T2]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence with asymmetric migration, two epoch"+'\t')
-            fh_out.write("parameter set = [nu1, nu2, m12a, m21a, m12b, m21b, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=3, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*8)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-    #####################################################################
-        
-    elif model_name == "sec_contact_sym_mig_three_epoch":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence and symmetrical secondary contact, three epoch
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence and symmetrical secondary contact, three epoch",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sec_contact_sym_mig_three_epoch
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0, 0, 0]
-        upper_bound = [30, 30, 20, 10, 10, 10]
-        params = [1,1,1,1,1,1]
-        print "parameter set = [nu1, nu2, m, T1, T2, T3]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence and symmetrical secondary contact, three epoch"+'\t')
-            fh_out.write("parameter set = [nu1, nu2, m, T1, T2, T3]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=3, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*6)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-        
-        
-    elif model_name == "sec_contact_asym_mig_three_epoch":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence and asymmetrical secondary contact, three epoch
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence and asymmetrical secondary contact, three epoch",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sec_contact_asym_mig_three_epoch
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0, 0, 0]
-        upper_bound = [30, 30, 20, 20, 10, 10, 10]
-        params = [1,1,1,1,1,1,1]
-        print "parameter set = [nu1, nu2, m12, m21, T1, T2, T3]"
-        
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence and asymmetrical secondary contact, three epoch"+'\t')
-            fh_out.write("parameter set = [nu1, nu2, m12, m21, T1, T2, T3]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=3, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*7)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-        
-    elif model_name == "sec_contact_sym_mig_size_three_epoch":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence and symmetrical secondary contact, size change, three epoch
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence and symmetrical secondary contact, size change, three epoch",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sec_contact_sym_mig_size_three_epoch
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0, 0, 0]
-        upper_bound = [30, 30, 30, 30, 20, 10, 10, 10]
-        params = [1,1,1,1,1,1,1,1]
-        print "parameter set = [nu1a, nu2a, nu1b, nu2b, m, T1, T2, T3]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence and symmetrical secondary contact, size change, three epoch"+'\t')
-            fh_out.write("parameter set = [nu1a, nu2a, nu1b, nu2b, m, T1, T2, T3]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=3, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*8)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-           
-    elif model_name == "sec_contact_asym_mig_size_three_epoch":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence and asymmetrical secondary contact, size change, three epoch
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence and asymmetrical secondary contact, size change, three epoch",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sec_contact_asym_mig_size_three_epoch
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0, 0, 0]
-        upper_bound = [30, 30, 30, 30, 20, 20, 10, 10, 10]
-        params = [1,1,1,1,1,1,1,1,1]
-        print "parameter set = [nu1a, nu2a, nu1b, nu2b, m12, m21, T1, T2, T3]"
-    
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence and asymmetrical secondary contact, size change, three epoch"+'\t')
-            fh_out.write("parameter set = [nu1a, nu2a, nu1b, nu2b, m12, m21, T1, T2, T3]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=3, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*9)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-    #####################################################################
-    #ISLAND MODELS
-    #####################################################################
-
-    elif model_name == "vic_no_mig":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Vicariance and no migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Vicariance and no migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.vic_no_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.001]
-        upper_bound = [20, 20, 20, 10, 0.99]
-        params = [1,1,1,1,0.25]
-        print "parameter set = [nuA, nu1, nu2, T, s]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Vicariance and no migration"+'\t')
-            fh_out.write("parameter set = [nuA, nu1, nu2, T, s]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=3, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*5)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-    
-    elif model_name == "vic_anc_asym_mig":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Vicariance and ancient asymmetric migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Vicariance and ancient asymmetric migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.vic_anc_asym_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.001]
-        upper_bound = [20, 20, 20, 10, 10, 10, 10, 0.99]
-        params = [1,1,1,1,1,1,1,0.25]
-        print "parameter set = [nuA, nu1, nu2, m12, m21, T1, T2, s]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Vicariance and ancient asymmetric migration"+'\t')
-            fh_out.write("parameter set = [nuA, nu1, nu2, m12, m21, T1, T2, s]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=3, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*8)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-    elif model_name == "vic_sec_contact_asym_mig":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Vicariance and secondary contact with asymmetric migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Vicariance and secondary contact with asymmetric migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.vic_sec_contact_asym_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.001]
-        upper_bound = [20, 20, 20, 10, 10, 10, 10, 0.99]
-        params = [1,1,1,1,1,1,1,0.25]
-        print "parameter set = [nuA, nu1, nu2, m12, m21, T1, T2, s]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Vicariance and secondary contact with asymmetric migration"+'\t')
-            fh_out.write("parameter set = [nuA, nu1, nu2, m12, m21, T1, T2, s]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=3, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*8)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-    elif model_name == "founder_sym":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Founder event and symmetric migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Founder event and symmetric migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.founder_sym
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0.001]
-        upper_bound = [20, 20, 20, 20, 10, 0.99]
-        params = [1,1,1,1,1,0.25]
-        print "parameter set = [nuA, nu1, nu2, m, T, s]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Founder event and symmetric migration"+'\t')
-            fh_out.write("parameter set = [nuA, nu1, nu2, m, T, s]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=3, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*6)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-        
-    elif model_name == "founder_asym":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Founder event and asymmetric migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Founder event and asymmetric migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.founder_asym
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.001]
-        upper_bound = [30, 30, 30, 20, 20, 10, 0.99]
-        params = [1,1,1,1,1,1,0.25]
-        print "parameter set = [nuA, nu1, nu2, m12, m21, T, s]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Founder event and asymmetric migration"+'\t')
-            fh_out.write("parameter set = [nuA, nu1, nu2, m12, m21, T, s]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=3, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*7)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-    elif model_name == "founder_nomig":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Founder event and no migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Founder event and no migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.founder_nomig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.001]
-        upper_bound = [30, 30, 30, 10, 0.99]
-        params = [1,1,1,1,0.25]
-        print "parameter set = [nuA, nu1, nu2, T, s]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Founder event and no migration"+'\t')
-            fh_out.write("parameter set = [nuA, nu1, nu2, T, s]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=3, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*5)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-        
-    ###########################################################################
-    #ISLAND Discrete admixture models
-    ###########################################################################
-
-    
-    elif model_name == "vic_no_mig_admix_early":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Vicariance with early discrete admixture
-        #####################################
-        print "---------------------------------------------------"
-        print "Vicariance with early discrete admixture",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.vic_no_mig_admix_early
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.001, 0.001]
-        upper_bound = [20, 20, 20, 10, 0.99, 0.99]
-        params = [1,1,1,1,0.25,0.25]
-        print "parameter set = [nuA, nu1, nu2, T, s, f]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Vicariance with early discrete admixture"+'\t')
-            fh_out.write("parameter set = [nuA, nu1, nu2, T, s, f]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=3, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*6)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-    
-    elif model_name == "vic_no_mig_admix_late":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence with late discrete admixture
-        #####################################
-        print "---------------------------------------------------"
-        print "Vicariance with late discrete admixture",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.vic_no_mig_admix_late
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.001, 0.001]
-        upper_bound = [20, 20, 20, 10, 0.99, 0.99]
-        params = [1,1,1,1,0.25,0.25]
-        print "parameter set = [nuA, nu1, nu2, T, s, f]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Vicariance with late discrete admixture"+'\t')
-            fh_out.write("parameter set = [nuA, nu1, nu2, T, s, f]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=3, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*6)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-    elif model_name == "vic_two_epoch_admix":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Vicariance with discrete admixture, two epoch
-        #####################################
-        print "---------------------------------------------------"
-        print "Vicariance with discrete admixture, two epoch",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.vic_two_epoch_admix
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0.001, 0.001]
-        upper_bound = [20, 20, 20, 10, 10, 0.99, 0.99]
-        params = [1,1,1,1,1,0.25,0.25]
-        print "parameter set = [nuA, nu1, nu2, T1, T2, s, f]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Vicariance with discrete admixture, two epoch"+'\t')
-            fh_out.write("parameter set = [nuA, nu1, nu2, T1, T2, s, f]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=3, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*7)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-
-    elif model_name == "founder_nomig_admix_early":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Founder event and discrete early admixture
-        #####################################
-        print "---------------------------------------------------"
-        print "Founder event and discrete early admixture",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.founder_nomig_admix_early
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.001, 0.001]
-        upper_bound = [20, 20, 10, 10, 0.99, 0.99]
-        params = [1,1,1,1,0.25,0.25]
-        print "parameter set = [nuA, nu1, nu2, T, s, f]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Founder event and discrete early admixture"+'\t')
-            fh_out.write("parameter set = [nuA, nu1, nu2, T, s, f]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=3, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*6)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-    elif model_name == "founder_nomig_admix_late":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Founder event and discrete late admixture
-        #####################################
-        print "---------------------------------------------------"
-        print "Founder event and discrete early admixture",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.founder_nomig_admix_late
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.001, 0.001]
-        upper_bound = [20, 20, 10, 10, 0.99, 0.99]
-        params = [1,1,1,1,0.25,0.25]
-        print "parameter set = [nuA, nu1, nu2, T, s, f]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Founder event and discrete late admixture"+'\t')
-            fh_out.write("parameter set = [nuA, nu1, nu2, T, s, f]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=3, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*6)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-    elif model_name == "founder_nomig_admix_two_epoch":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Founder event and discrete admixture, two epoch
-        #####################################
-        print "---------------------------------------------------"
-        print "Founder event and discrete admixture, two epoch",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.founder_nomig_admix_two_epoch
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0.001, 0.001]
-        upper_bound = [20, 20, 10, 10, 10, 0.99, 0.99]
-        params = [1,1,1,1,1,0.25,0.25]
-        print "parameter set = [nuA, nu1, nu2, T1, T2, s, f]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Founder event and discrete admixture, two epoch"+'\t')
-            fh_out.write("parameter set = [nuA, nu1, nu2, T1, T2, s, f]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=3, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*7)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-
-
-                
-#======================================================================================
-#======================================================================================
-#======================================================================================
-#======================================================================================
-#Optimizations Round 2 function (run models with user input parameters, presumably from best runs)
-
-# Optimize_Round2(pts, fs, outfile, reps, maxiter, model_name, params)
-
-# Argument definitions:
-# pts:  grid choice (list of three numbers, ex. [20,30,40]
-# fs:  spectrum object name
-# outfile:  prefix for output naming -> "Round1_{0}_{1}_optimized.txt".format(outfile,model_name)
-# reps:  integer to control number of replicates, ex. 10
-# maxiter:  max number of iterations per optimization step (not intuitive! see dadi user group)
-# model_name:  "no_divergence", "no_mig", "sym_mig", "asym_mig", "anc_sym_mig", "anc_asym_mig",
-#        "sec_contact_sym_mig", "sec_contact_asym_mig", "no_mig_size", "sym_mig_size",
-#        "asym_mig_size", "anc_sym_mig_size", "anc_asym_mig_size", "sec_contact_sym_mig_size",
-#        "sec_contact_asym_mig_size"
-# params:  list of best parameter values to perturb to start the optimizations from
-
-def Optimize_Round2(pts, fs, outfile, reps, y, model_name, params):
-    print '\n',"============================================================================"
-    print "Beginning analysis of {}".format(model_name)
-    print "============================================================================"
-
-    #create output file
-    outname = "Round2_{0}_{1}_optimized.txt".format(outfile,model_name)
-    fh_out = open(outname, 'a')
-    fh_out.write("Model"+'\t'+"param_set"+'\t'+"Replicate"+'\t'+"log-likelihood"+'\t'+"theta"+'\t'+"AIC"+'\t'+"optimized_params"+'\n')
-    fh_out.close()
-    
-    #variable to control number of loops per model (1 to x)
-    x = int(reps) + int(1)
-        
-    if model_name == "no_divergence":
-        #####################################
-        #No Divergence
-        #####################################
-        print "---------------------------------------------------"
-        print "No Divergence",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.no_divergence
-        params = []
-        print "parameter set = [none]"
-        
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-        
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("No divergence model"+'\t')
-            fh_out.write("parameter set = [none]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params, fs.sample_sizes, pts)
-            
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*3)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-            
-            fh_out.write('\n')
-            fh_out.close()
-
-        print "---------------------------------------------------", '\n'
-
-        
-    elif model_name == "no_mig":
-        fh_out = open(outname, 'a')
-        #####################################
-        # Divergence with no migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with no migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.no_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0]
-        upper_bound = [30, 30, 10]
-        print "parameter set = [nu1, nu2, T]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence with no migration"+'\t')
-            fh_out.write("parameter set = [nu1, nu2, T]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*3)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-        
-    elif model_name == "sym_mig":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence with symmetric migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with symmetric migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sym_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0]
-        upper_bound = [30, 30, 20, 10]
-        print "parameter set = [nu1, nu2, m, T]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence with symmetric migration"+'\t')
-            fh_out.write("parameter set = [nu1, nu2, m, T]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*4)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-        
-    elif model_name == "asym_mig":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence with asymmetric migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with asymmetric migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.asym_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0]
-        upper_bound = [30, 30, 20, 20, 10]
-        print "parameter set = [nu1, nu2, m12, m21, T]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence with asymmetric migration"+'\t')
-            fh_out.write("parameter set = [nu1, nu2, m12, m21, T]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*5)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-        
-    elif model_name == "anc_sym_mig":
-        fh_out = open(outname, 'a') 
-        #####################################
-        #Divergence with ancient symmetrical migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with ancient symmetrical migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.anc_sym_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 20, 10, 10]
-        print "parameter set = [nu1, nu2, m, T1, T2]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence with ancient symmetrical migration"+'\t')
-            fh_out.write("parameter set = [nu1, nu2, m, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*5)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-        
-    elif model_name == "anc_asym_mig":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence with ancient asymmetrical migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with ancient asymmetrical migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.anc_asym_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 20, 20, 10, 10]
-        print "parameter set = [nu1, nu2, m12, m21, T1, T2]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence with ancient asymmetrical migration"+'\t')
-            fh_out.write("parameter set = [nu1, nu2, m12, m21, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*6)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-        
-    elif model_name == "sec_contact_sym_mig":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence and symmetrical secondary contact
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence and symmetrical secondary contact",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sec_contact_sym_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 20, 10, 10]
-        print "parameter set = [nu1, nu2, m, T1, T2]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence and symmetrical secondary contact"+'\t')
-            fh_out.write("parameter set = [nu1, nu2, m, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*5)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-        
-        
-    elif model_name == "sec_contact_asym_mig":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence and asymmetrical secondary contact
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence and asymmetrical secondary contact",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sec_contact_asym_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 20, 20, 10, 10]
-        print "parameter set = [nu1, nu2, m12, m21, T1, T2]"
-        
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence and asymmetrical secondary contact"+'\t')
-            fh_out.write("parameter set = [nu1, nu2, m12, m21, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*6)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-
-    ##########################################################################
-    #Similar models but with size change allowed
-    ##########################################################################
-    
-    elif model_name == "no_mig_size":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence with no migration, size change
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with no migration, size change",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.no_mig_size
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 30, 30, 10, 10]
-        print "parameter set = [nu1a, nu2a, nu1b, nu2b, T1, T2]"
- 
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence with no migration, size change"+'\t')
-            fh_out.write("parameter set = [nu1a, nu2a, nu1b, nu2b, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*6)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-        
-        
-    elif model_name == "sym_mig_size":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence with symmetric migration, size change
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with symmetric migration, size change",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sym_mig_size
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 30, 30, 20, 10, 10]
-        print "parameter set = [nu1a, nu2a, nu1b, nu2b, m, T1, T2]"
- 
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence with symmetric migration, size change"+'\t')
-            fh_out.write("parameter set = [nu1a, nu2a, nu1b, nu2b, m, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*7)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-        
-
-    elif model_name == "asym_mig_size":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence with asymmetric migration, size change
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with asymmetric migration, size change",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.asym_mig_size
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 30, 30, 20, 20, 10, 10]
-        print "parameter set = [nu1a, nu2a, nu1b, nu2b, m12, m21, T1, T2]"
- 
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence with asymmetric migration, size change"+'\t')
-            fh_out.write("parameter set = [nu1a, nu2a, nu1b, nu2b, m12, m21, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*8)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
- 
- 
-    elif model_name == "anc_sym_mig_size":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence with ancient symmetrical migration, size change
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with ancient symmetrical migration, size change",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.anc_sym_mig_size
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 30, 30, 20, 10, 10]
-        print "parameter set = [nu1a, nu2a, nu1b, nu2b, m, T1, T2]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence with ancient symmetrical migration, size change"+'\t')
-            fh_out.write("parameter set = [nu1a, nu2a, nu1b, nu2b, m, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*7)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-        
-    elif model_name == "anc_asym_mig_size":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence with ancient asymmetrical migration, size change
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with ancient asymmetrical migration, size change",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.anc_asym_mig_size
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 30, 30, 20, 20, 10, 10]
-        print "parameter set = [nu1a, nu2a, nu1b, nu2b, m12, m21, T1, T2]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence with ancient asymmetrical migration, size change"+'\t')
-            fh_out.write("parameter set = [nu1a, nu2a, nu1b, nu2b, m12, m21, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*8)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-
-    elif model_name == "sec_contact_sym_mig_size":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence and symmetrical secondary contact, size change
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence and symmetrical secondary contact, size change",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sec_contact_sym_mig_size
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 30, 30, 20, 10, 10]
-        print "parameter set = [nu1a, nu2a, nu1b, nu2b, m, T1, T2]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence and symmetrical secondary contact, size change"+'\t')
-            fh_out.write("parameter set = [nu1a, nu2a, nu1b, nu2b, m, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*7)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-           
-    elif model_name == "sec_contact_asym_mig_size":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence and asymmetrical secondary contact, size change
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence and asymmetrical secondary contact, size change",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sec_contact_asym_mig_size
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 30, 30, 20, 20, 10, 10]
-        print "parameter set = [nu1a, nu2a, nu1b, nu2b, m12, m21, T1, T2]"
-    
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence and asymmetrical secondary contact, size change"+'\t')
-            fh_out.write("parameter set = [nu1a, nu2a, nu1b, nu2b, m12, m21, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*8)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-    ########################################################################################################################################
-    #Newer Models added here below
-    ########################################################################################################################################
-
-    elif model_name == "sym_mig_twoepoch":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence with symmetric migration, two epoch
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with symmetric migration, two epoch",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sym_mig_twoepoch
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 20, 20, 10, 10]
-        print "parameter set = [nu1, nu2, m1, m2, T1, T2]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence with symmetric migration, two epochs"+'\t')
-            fh_out.write("parameter set = [nu1, nu2, m1, m2, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*6)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-        
-    elif model_name == "asym_mig_twoepoch":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence with asymmetric migration, two epoch
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with asymmetric migration, two epoch",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.asym_mig_twoepoch
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 20, 20, 20, 20, 10, 10]
-        print "parameter set = [nu1, nu2, m12a, m21a, m12b, m21b, T1, T2]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence with asymmetric migration, two epoch"+'\t')
-            fh_out.write("parameter set = [nu1, nu2, m12a, m21a, m12b, m21b, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*8)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-        
-    #####################################################################
-        
-    elif model_name == "sec_contact_sym_mig_three_epoch":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence and symmetrical secondary contact, three epoch
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence and symmetrical secondary contact, three epoch",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sec_contact_sym_mig_three_epoch
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0, 0, 0]
-        upper_bound = [30, 30, 20, 10, 10, 10]
-        print "parameter set = [nu1, nu2, m, T1, T2, T3]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence and symmetrical secondary contact, three epoch"+'\t')
-            fh_out.write("parameter set = [nu1, nu2, m, T1, T2, T3]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*6)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-        
-        
-    elif model_name == "sec_contact_asym_mig_three_epoch":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence and asymmetrical secondary contact, three epoch
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence and asymmetrical secondary contact, three epoch",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sec_contact_asym_mig_three_epoch
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0, 0, 0]
-        upper_bound = [30, 30, 20, 20, 10, 10, 10]
-        print "parameter set = [nu1, nu2, m12, m21, T1, T2, T3]"
-        
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence and asymmetrical secondary contact, three epoch"+'\t')
-            fh_out.write("parameter set = [nu1, nu2, m12, m21, T1, T2, T3]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*7)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-        
-    elif model_name == "sec_contact_sym_mig_size_three_epoch":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence and symmetrical secondary contact, size change, three epoch
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence and symmetrical secondary contact, size change, three epoch",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sec_contact_sym_mig_size_three_epoch
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0, 0, 0]
-        upper_bound = [30, 30, 30, 30, 20, 10, 10, 10]
-        print "parameter set = [nu1a, nu2a, nu1b, nu2b, m, T1, T2, T3]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence and symmetrical secondary contact, size change, three epoch"+'\t')
-            fh_out.write("parameter set = [nu1a, nu2a, nu1b, nu2b, m, T1, T2, T3]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*8)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-           
-    elif model_name == "sec_contact_asym_mig_size_three_epoch":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence and asymmetrical secondary contact, size change, three epoch
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence and asymmetrical secondary contact, size change, three epoch",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sec_contact_asym_mig_size_three_epoch
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0, 0, 0]
-        upper_bound = [30, 30, 30, 30, 20, 20, 10, 10, 10]
-        print "parameter set = [nu1a, nu2a, nu1b, nu2b, m12, m21, T1, T2, T3]"
-    
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence and asymmetrical secondary contact, size change, three epoch"+'\t')
-            fh_out.write("parameter set = [nu1a, nu2a, nu1b, nu2b, m12, m21, T1, T2, T3]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*9)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-        
-    #####################################################################
-    #ISLAND MODELS
-    #####################################################################
-
-    elif model_name == "vic_no_mig":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Vicariance and no migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Vicariance and no migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.vic_no_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.001]
-        upper_bound = [20, 20, 20, 10, 0.99]
-        print "parameter set = [nuA, nu1, nu2, T, s]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Vicariance and no migration"+'\t')
-            fh_out.write("parameter set = [nuA, nu1, nu2, T, s]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*5)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-    
-    elif model_name == "vic_anc_asym_mig":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Vicariance and ancient asymmetric migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Vicariance and ancient asymmetric migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.vic_anc_asym_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.001]
-        upper_bound = [20, 20, 20, 10, 10, 10, 10, 0.99]
-        print "parameter set = [nuA, nu1, nu2, m12, m21, T1, T2, s]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Vicariance and ancient asymmetric migration"+'\t')
-            fh_out.write("parameter set = [nuA, nu1, nu2, m12, m21, T1, T2, s]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*8)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-    elif model_name == "vic_sec_contact_asym_mig":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Vicariance and secondary contact with asymmetric migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Vicariance and secondary contact with asymmetric migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.vic_sec_contact_asym_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.001]
-        upper_bound = [20, 20, 20, 10, 10, 10, 10, 0.99]
-        print "parameter set = [nuA, nu1, nu2, m12, m21, T1, T2, s]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Vicariance and secondary contact with asymmetric migration"+'\t')
-            fh_out.write("parameter set = [nuA, nu1, nu2, m12, m21, T1, T2, s]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*8)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-    elif model_name == "founder_sym":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Founder event and symmetric migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Founder event and symmetric migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.founder_sym
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0.001]
-        upper_bound = [20, 20, 20, 20, 10, 0.99]
-        print "parameter set = [nuA, nu1, nu2, m, T, s]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Founder event and symmetric migration"+'\t')
-            fh_out.write("parameter set = [nuA, nu1, nu2, m, T, s]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*6)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-        
-    elif model_name == "founder_asym":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Founder event and asymmetric migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Founder event and asymmetric migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.founder_asym
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.001]
-        upper_bound = [30, 30, 30, 20, 20, 10, 0.99]
-        print "parameter set = [nuA, nu1, nu2, m12, m21, T, s]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Founder event and asymmetric migration"+'\t')
-            fh_out.write("parameter set = [nuA, nu1, nu2, m12, m21, T, s]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*7)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-    elif model_name == "founder_nomig":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Founder event and no migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Founder event and no migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.founder_nomig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.001]
-        upper_bound = [30, 30, 30, 10, 0.99]
-        print "parameter set = [nuA, nu1, nu2, T, s]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Founder event and no migration"+'\t')
-            fh_out.write("parameter set = [nuA, nu1, nu2, T, s]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*5)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-        
-    ###########################################################################
-    #ISLAND Discrete admixture models
-    ###########################################################################
-
-    
-    elif model_name == "vic_no_mig_admix_early":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Vicariance with early discrete admixture
-        #####################################
-        print "---------------------------------------------------"
-        print "Vicariance with early discrete admixture",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.vic_no_mig_admix_early
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.001, 0.001]
-        upper_bound = [20, 20, 20, 10, 0.99, 0.99]
-        print "parameter set = [nuA, nu1, nu2, T, s, f]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Vicariance with early discrete admixture"+'\t')
-            fh_out.write("parameter set = [nuA, nu1, nu2, T, s, f]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*6)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-    
-    elif model_name == "vic_no_mig_admix_late":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence with late discrete admixture
-        #####################################
-        print "---------------------------------------------------"
-        print "Vicariance with late discrete admixture",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.vic_no_mig_admix_late
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.001, 0.001]
-        upper_bound = [20, 20, 20, 10, 0.99, 0.99]
-        print "parameter set = [nuA, nu1, nu2, T, s, f]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Vicariance with late discrete admixture"+'\t')
-            fh_out.write("parameter set = [nuA, nu1, nu2, T, s, f]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*6)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-    elif model_name == "vic_two_epoch_admix":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Vicariance with discrete admixture, two epoch
-        #####################################
-        print "---------------------------------------------------"
-        print "Vicariance with discrete admixture, two epoch",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.vic_two_epoch_admix
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0.001, 0.001]
-        upper_bound = [20, 20, 20, 10, 10, 0.99, 0.99]
-        print "parameter set = [nuA, nu1, nu2, T1, T2, s, f]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Vicariance with discrete admixture, two epoch"+'\t')
-            fh_out.write("parameter set = [nuA, nu1, nu2, T1, T2, s, f]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*7)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-
-    elif model_name == "founder_nomig_admix_early":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Founder event and discrete early admixture
-        #####################################
-        print "---------------------------------------------------"
-        print "Founder event and discrete early admixture",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.founder_nomig_admix_early
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.001, 0.001]
-        upper_bound = [20, 20, 10, 10, 0.99, 0.99]
-        print "parameter set = [nuA, nu1, nu2, T, s, f]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Founder event and discrete early admixture"+'\t')
-            fh_out.write("parameter set = [nuA, nu1, nu2, T, s, f]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*6)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-    elif model_name == "founder_nomig_admix_late":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Founder event and discrete late admixture
-        #####################################
-        print "---------------------------------------------------"
-        print "Founder event and discrete late admixture",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.founder_nomig_admix_late
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.001, 0.001]
-        upper_bound = [20, 20, 10, 10, 0.99, 0.99]
-        print "parameter set = [nuA, nu1, nu2, T, s, f]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Founder event and discrete late admixture"+'\t')
-            fh_out.write("parameter set = [nuA, nu1, nu2, T, s, f]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*6)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-    elif model_name == "founder_nomig_admix_two_epoch":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Founder event and discrete admixture, two epoch
-        #####################################
-        print "---------------------------------------------------"
-        print "Founder event and discrete admixture, two epoch",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.founder_nomig_admix_two_epoch
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0.001, 0.001]
-        upper_bound = [20, 20, 10, 10, 10, 0.99, 0.99]
-        print "parameter set = [nuA, nu1, nu2, T1, T2, s, f]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Founder event and discrete admixture, two epoch"+'\t')
-            fh_out.write("parameter set = [nuA, nu1, nu2, T1, T2, s, f]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*7)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-
-        
-#======================================================================================
-#======================================================================================
-#======================================================================================
-#======================================================================================
-#======================================================================================
-#Optimizations Round 3 function (run models with user input parameters, presumably from best runs)
-
-# Optimize_Round3(pts, fs, outfile, reps, maxiter, model_name, params)
-
-# Argument definitions:
-# pts:  grid choice (list of three numbers, ex. [20,30,40]
-# fs:  spectrum object name
-# outfile:  prefix for output naming -> "Round1_{0}_{1}_optimized.txt".format(outfile,model_name)
-# reps:  integer to control number of replicates, ex. 10
-# maxiter:  max number of iterations per optimization step (not intuitive! see dadi user group)
-# model_name:  "no_divergence", "no_mig", "sym_mig", "asym_mig", "anc_sym_mig", "anc_asym_mig",
-#        "sec_contact_sym_mig", "sec_contact_asym_mig", "no_mig_size", "sym_mig_size",
-#        "asym_mig_size", "anc_sym_mig_size", "anc_asym_mig_size", "sec_contact_sym_mig_size",
-#        "sec_contact_asym_mig_size"
-# params:  list of best parameter values to perturb to start the optimizations from
-
-def Optimize_Round3(pts, fs, outfile, reps, y, model_name, params):
-    print '\n',"============================================================================"
-    print "Beginning analysis of {}".format(model_name)
-    print "============================================================================"
-
-    #create output file
-    outname = "Round3_{0}_{1}_optimized.txt".format(outfile,model_name)
-    fh_out = open(outname, 'a')
-    fh_out.write("Model"+'\t'+"param_set"+'\t'+"Replicate"+'\t'+"log-likelihood"+'\t'+"theta"+'\t'+"AIC"+'\t'+"optimized_params"+'\n')
-    fh_out.close()
-    
-    #variable to control number of loops per model (1 to x)
-    x = int(reps) + int(1)
-        
-    if model_name == "no_divergence":
-        #####################################
-        #No Divergence
-        #####################################
-        print "---------------------------------------------------"
-        print "No Divergence",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.no_divergence
-        params = []
-        print "parameter set = [none]"
-        
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-        
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("No divergence model"+'\t')
-            fh_out.write("parameter set = [none]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params, fs.sample_sizes, pts)
-            
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*3)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-            
-            fh_out.write('\n')
-            fh_out.close()
-
-        print "---------------------------------------------------", '\n'
-
-        
-    elif model_name == "no_mig":
-        fh_out = open(outname, 'a')
-        #####################################
-        # Divergence with no migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with no migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.no_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0]
-        upper_bound = [30, 30, 10]
-        print "parameter set = [nu1, nu2, T]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence with no migration"+'\t')
-            fh_out.write("parameter set = [nu1, nu2, T]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=1, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*3)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-        
-    elif model_name == "sym_mig":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence with symmetric migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with symmetric migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sym_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0]
-        upper_bound = [30, 30, 20, 10]
-        print "parameter set = [nu1, nu2, m, T]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence with symmetric migration"+'\t')
-            fh_out.write("parameter set = [nu1, nu2, m, T]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=1, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*4)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-        
-    elif model_name == "asym_mig":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence with asymmetric migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with asymmetric migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.asym_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0]
-        upper_bound = [30, 30, 20, 20, 10]
-        print "parameter set = [nu1, nu2, m12, m21, T]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence with asymmetric migration"+'\t')
-            fh_out.write("parameter set = [nu1, nu2, m12, m21, T]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=1, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*5)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-        
-    elif model_name == "anc_sym_mig":
-        fh_out = open(outname, 'a') 
-        #####################################
-        #Divergence with ancient symmetrical migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with ancient symmetrical migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.anc_sym_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 20, 10, 10]
-        print "parameter set = [nu1, nu2, m, T1, T2]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence with ancient symmetrical migration"+'\t')
-            fh_out.write("parameter set = [nu1, nu2, m, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=1, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*5)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-        
-    elif model_name == "anc_asym_mig":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence with ancient asymmetrical migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with ancient asymmetrical migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.anc_asym_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 20, 20, 10, 10]
-        print "parameter set = [nu1, nu2, m12, m21, T1, T2]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence with ancient asymmetrical migration"+'\t')
-            fh_out.write("parameter set = [nu1, nu2, m12, m21, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=1, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*6)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-        
-    elif model_name == "sec_contact_sym_mig":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence and symmetrical secondary contact
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence and symmetrical secondary contact",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sec_contact_sym_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 20, 10, 10]
-        print "parameter set = [nu1, nu2, m, T1, T2]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence and symmetrical secondary contact"+'\t')
-            fh_out.write("parameter set = [nu1, nu2, m, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=1, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*5)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-        
-        
-    elif model_name == "sec_contact_asym_mig":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence and asymmetrical secondary contact
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence and asymmetrical secondary contact",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sec_contact_asym_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 20, 20, 10, 10]
-        print "parameter set = [nu1, nu2, m12, m21, T1, T2]"
-        
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence and asymmetrical secondary contact"+'\t')
-            fh_out.write("parameter set = [nu1, nu2, m12, m21, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=1, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*6)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-
-    ##########################################################################
-    #Similar models but with size change allowed
-    ##########################################################################
-    
-    elif model_name == "no_mig_size":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence with no migration, size change
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with no migration, size change",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.no_mig_size
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 30, 30, 10, 10]
-        print "parameter set = [nu1a, nu2a, nu1b, nu2b, T1, T2]"
- 
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence with no migration, size change"+'\t')
-            fh_out.write("parameter set = [nu1a, nu2a, nu1b, nu2b, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=1, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*6)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-        
-        
-    elif model_name == "sym_mig_size":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence with symmetric migration, size change
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with symmetric migration, size change",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sym_mig_size
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 30, 30, 20, 10, 10]
-        print "parameter set = [nu1a, nu2a, nu1b, nu2b, m, T1, T2]"
- 
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence with symmetric migration, size change"+'\t')
-            fh_out.write("parameter set = [nu1a, nu2a, nu1b, nu2b, m, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=1, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*7)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-        
-
-    elif model_name == "asym_mig_size":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence with asymmetric migration, size change
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with asymmetric migration, size change",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.asym_mig_size
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 30, 30, 20, 20, 10, 10]
-        print "parameter set = [nu1a, nu2a, nu1b, nu2b, m12, m21, T1, T2]"
- 
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence with asymmetric migration, size change"+'\t')
-            fh_out.write("parameter set = [nu1a, nu2a, nu1b, nu2b, m12, m21, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=1, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*8)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
- 
- 
-    elif model_name == "anc_sym_mig_size":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence with ancient symmetrical migration, size change
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with ancient symmetrical migration, size change",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.anc_sym_mig_size
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 30, 30, 20, 10, 10]
-        print "parameter set = [nu1a, nu2a, nu1b, nu2b, m, T1, T2]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence with ancient symmetrical migration, size change"+'\t')
-            fh_out.write("parameter set = [nu1a, nu2a, nu1b, nu2b, m, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=1, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*7)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-        
-    elif model_name == "anc_asym_mig_size":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence with ancient asymmetrical migration, size change
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with ancient asymmetrical migration, size change",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.anc_asym_mig_size
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 30, 30, 20, 20, 10, 10]
-        print "parameter set = [nu1a, nu2a, nu1b, nu2b, m12, m21, T1, T2]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence with ancient asymmetrical migration, size change"+'\t')
-            fh_out.write("parameter set = [nu1a, nu2a, nu1b, nu2b, m12, m21, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=1, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*8)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-
-    elif model_name == "sec_contact_sym_mig_size":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence and symmetrical secondary contact, size change
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence and symmetrical secondary contact, size change",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sec_contact_sym_mig_size
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 30, 30, 20, 10, 10]
-        print "parameter set = [nu1a, nu2a, nu1b, nu2b, m, T1, T2]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence and symmetrical secondary contact, size change"+'\t')
-            fh_out.write("parameter set = [nu1a, nu2a, nu1b, nu2b, m, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=1, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*7)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-           
-    elif model_name == "sec_contact_asym_mig_size":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence and asymmetrical secondary contact, size change
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence and asymmetrical secondary contact, size change",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sec_contact_asym_mig_size
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 30, 30, 20, 20, 10, 10]
-        print "parameter set = [nu1a, nu2a, nu1b, nu2b, m12, m21, T1, T2]"
-    
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence and asymmetrical secondary contact, size change"+'\t')
-            fh_out.write("parameter set = [nu1a, nu2a, nu1b, nu2b, m12, m21, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=1, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*8)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-    ########################################################################################################################################
-    #Newer Models added here below
-    ########################################################################################################################################
-
-    elif model_name == "sym_mig_twoepoch":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence with symmetric migration, two epoch
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with symmetric migration, two epoch",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sym_mig_twoepoch
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 20, 20, 10, 10]
-        print "parameter set = [nu1, nu2, m1, m2, T1, T2]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence with symmetric migration, two epoch"+'\t')
-            fh_out.write("parameter set = [nu1, nu2, m1, m2, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=1, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*6)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-        
-    elif model_name == "asym_mig_twoepoch":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence with asymmetric migration, two epoch
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with asymmetric migration, two epoch",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.asym_mig_twoepoch
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 20, 20, 20, 20, 10, 10]
-        print "parameter set = [nu1, nu2, m12a, m21a, m12b, m21b, T1, T2]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence with asymmetric migration, two epoch"+'\t')
-            fh_out.write("parameter set = [nu1, nu2, m12a, m21a, m12b, m21b, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=1, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*8)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-    #####################################################################
-        
-    elif model_name == "sec_contact_sym_mig_three_epoch":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence and symmetrical secondary contact, three epoch
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence and symmetrical secondary contact, three epoch",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sec_contact_sym_mig_three_epoch
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0, 0, 0]
-        upper_bound = [30, 30, 20, 10, 10, 10]
-        print "parameter set = [nu1, nu2, m, T1, T2, T3]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence and symmetrical secondary contact, three epoch"+'\t')
-            fh_out.write("parameter set = [nu1, nu2, m, T1, T2, T3]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=1, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*6)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-        
-        
-    elif model_name == "sec_contact_asym_mig_three_epoch":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence and asymmetrical secondary contact, three epoch
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence and asymmetrical secondary contact, three epoch",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sec_contact_asym_mig_three_epoch
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0, 0, 0]
-        upper_bound = [30, 30, 20, 20, 10, 10, 10]
-        print "parameter set = [nu1, nu2, m12, m21, T1, T2, T3]"
-        
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence and asymmetrical secondary contact, three epoch"+'\t')
-            fh_out.write("parameter set = [nu1, nu2, m12, m21, T1, T2, T3]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=1, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*7)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-        
-    elif model_name == "sec_contact_sym_mig_size_three_epoch":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence and symmetrical secondary contact, size change, three epoch
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence and symmetrical secondary contact, size change, three epoch",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sec_contact_sym_mig_size_three_epoch
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0, 0, 0]
-        upper_bound = [30, 30, 30, 30, 20, 10, 10, 10]
-        print "parameter set = [nu1a, nu2a, nu1b, nu2b, m, T1, T2, T3]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence and symmetrical secondary contact, size change, three epoch"+'\t')
-            fh_out.write("parameter set = [nu1a, nu2a, nu1b, nu2b, m, T1, T2, T3]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=1, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*8)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-           
-    elif model_name == "sec_contact_asym_mig_size_three_epoch":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence and asymmetrical secondary contact, size change, three epoch
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence and asymmetrical secondary contact, size change, three epoch",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sec_contact_asym_mig_size_three_epoch
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0, 0, 0]
-        upper_bound = [30, 30, 30, 30, 20, 20, 10, 10, 10]
-        print "parameter set = [nu1a, nu2a, nu1b, nu2b, m12, m21, T1, T2, T3]"
-    
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Divergence and asymmetrical secondary contact, size change, three epoch"+'\t')
-            fh_out.write("parameter set = [nu1a, nu2a, nu1b, nu2b, m12, m21, T1, T2, T3]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=1, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*9)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-        
-    #####################################################################
-    #ISLAND MODELS
-    #####################################################################
-
-    elif model_name == "vic_no_mig":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Vicariance and no migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Vicariance and no migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.vic_no_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.001]
-        upper_bound = [20, 20, 20, 10, 0.99]
-        print "parameter set = [nuA, nu1, nu2, T, s]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Vicariance and no migration"+'\t')
-            fh_out.write("parameter set = [nuA, nu1, nu2, T, s]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=1, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*5)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-    
-    elif model_name == "vic_anc_asym_mig":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Vicariance and ancient asymmetric migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Vicariance and ancient asymmetric migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.vic_anc_asym_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.001]
-        upper_bound = [20, 20, 20, 10, 10, 10, 10, 0.99]
-        print "parameter set = [nuA, nu1, nu2, m12, m21, T1, T2, s]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Vicariance and ancient asymmetric migration"+'\t')
-            fh_out.write("parameter set = [nuA, nu1, nu2, m12, m21, T1, T2, s]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=1, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*8)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-    elif model_name == "vic_sec_contact_asym_mig":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Vicariance and secondary contact with asymmetric migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Vicariance and secondary contact with asymmetric migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.vic_sec_contact_asym_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.001]
-        upper_bound = [20, 20, 20, 10, 10, 10, 10, 0.99]
-        print "parameter set = [nuA, nu1, nu2, m12, m21, T1, T2, s]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Vicariance and secondary contact with asymmetric migration"+'\t')
-            fh_out.write("parameter set = [nuA, nu1, nu2, m12, m21, T1, T2, s]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=1, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*8)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-    elif model_name == "founder_sym":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Founder event and symmetric migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Founder event and symmetric migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.founder_sym
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0.001]
-        upper_bound = [20, 20, 20, 20, 10, 0.99]
-        print "parameter set = [nuA, nu1, nu2, m, T, s]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Founder event and symmetric migration"+'\t')
-            fh_out.write("parameter set = [nuA, nu1, nu2, m, T, s]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=1, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*6)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-        
-    elif model_name == "founder_asym":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Founder event and asymmetric migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Founder event and asymmetric migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.founder_asym
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.001]
-        upper_bound = [30, 30, 30, 20, 20, 10, 0.99]
-        print "parameter set = [nuA, nu1, nu2, m12, m21, T, s]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Founder event and asymmetric migration"+'\t')
-            fh_out.write("parameter set = [nuA, nu1, nu2, m12, m21, T, s]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=1, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*7)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-    elif model_name == "founder_nomig":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Founder event and no migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Founder event and no migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.founder_nomig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.001]
-        upper_bound = [30, 30, 30, 10, 0.99]
-        print "parameter set = [nuA, nu1, nu2, T, s]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Founder event and no migration"+'\t')
-            fh_out.write("parameter set = [nuA, nu1, nu2, T, s]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=1, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*5)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-        
-    ###########################################################################
-    #ISLAND Discrete admixture models
-    ###########################################################################
-
-    
-    elif model_name == "vic_no_mig_admix_early":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Vicariance with early discrete admixture
-        #####################################
-        print "---------------------------------------------------"
-        print "Vicariance with early discrete admixture",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.vic_no_mig_admix_early
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.001, 0.001]
-        upper_bound = [20, 20, 20, 10, 0.99, 0.99]
-        print "parameter set = [nuA, nu1, nu2, T, s, f]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Vicariance with early discrete admixture"+'\t')
-            fh_out.write("parameter set = [nuA, nu1, nu2, T, s, f]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=1, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*6)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-    
-    elif model_name == "vic_no_mig_admix_late":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Divergence with late discrete admixture
-        #####################################
-        print "---------------------------------------------------"
-        print "Vicariance with late discrete admixture",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.vic_no_mig_admix_late
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.001, 0.001]
-        upper_bound = [20, 20, 20, 10, 0.99, 0.99]
-        print "parameter set = [nuA, nu1, nu2, T, s, f]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Vicariance with late discrete admixture"+'\t')
-            fh_out.write("parameter set = [nuA, nu1, nu2, T, s, f]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=1, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*6)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-    elif model_name == "vic_two_epoch_admix":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Vicariance with discrete admixture, two epoch
-        #####################################
-        print "---------------------------------------------------"
-        print "Vicariance with discrete admixture, two epoch",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.vic_two_epoch_admix
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0.001, 0.001]
-        upper_bound = [20, 20, 20, 10, 10, 0.99, 0.99]
-        print "parameter set = [nuA, nu1, nu2, T1, T2, s, f]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Vicariance with discrete admixture, two epoch"+'\t')
-            fh_out.write("parameter set = [nuA, nu1, nu2, T1, T2, s, f]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=1, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*7)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-
-    elif model_name == "founder_nomig_admix_early":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Founder event and discrete early admixture
-        #####################################
-        print "---------------------------------------------------"
-        print "Founder event and discrete early admixture",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.founder_nomig_admix_early
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.001, 0.001]
-        upper_bound = [20, 20, 10, 10, 0.99, 0.99]
-        print "parameter set = [nuA, nu1, nu2, T, s, f]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Founder event and discrete early admixture"+'\t')
-            fh_out.write("parameter set = [nuA, nu1, nu2, T, s, f]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=1, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*6)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-    elif model_name == "founder_nomig_admix_late":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Founder event and discrete late admixture
-        #####################################
-        print "---------------------------------------------------"
-        print "Founder event and discrete late admixture",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.founder_nomig_admix_late
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.001, 0.001]
-        upper_bound = [20, 20, 10, 10, 0.99, 0.99]
-        print "parameter set = [nuA, nu1, nu2, T, s, f]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Founder event and discrete late admixture"+'\t')
-            fh_out.write("parameter set = [nuA, nu1, nu2, T, s, f]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=1, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*6)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-    elif model_name == "founder_nomig_admix_two_epoch":
-        fh_out = open(outname, 'a')
-        #####################################
-        #Founder event and discrete admixture, two epoch
-        #####################################
-        print "---------------------------------------------------"
-        print "Founder event and discrete admixture, two epoch",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.founder_nomig_admix_two_epoch
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0.001, 0.001]
-        upper_bound = [20, 20, 10, 10, 10, 0.99, 0.99]
-        print "parameter set = [nuA, nu1, nu2, T1, T2, s, f]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Founder event and discrete admixture, two epoch"+'\t')
-            fh_out.write("parameter set = [nuA, nu1, nu2, T1, T2, s, f]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "base parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=1, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*7)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-        print "---------------------------------------------------", '\n'
-
-
-
-        
-#======================================================================================
-#======================================================================================
-#======================================================================================
-#======================================================================================        
-#Run models for plotting function (only runs once per model with exact input params)
-
-# Function usage:
-# returned_model_name = Optimize_Single(pts, fs, model_name, params)
-
-# Argument definitions:
-# pts:  grid choice (list of three numbers, ex. [20,30,40]
-# fs:  spectrum object name
-# model_name:  "no_divergence", "no_mig", "sym_mig", "asym_mig", "anc_sym_mig", "anc_asym_mig",
-#        "sec_contact_sym_mig", "sec_contact_asym_mig", "no_mig_size", "sym_mig_size",
-#        "asym_mig_size", "anc_sym_mig_size", "anc_asym_mig_size", "sec_contact_sym_mig_size",
-#        "sec_contact_asym_mig_size"
-# params:  list of best parameter values to optimize with
-
-def Optimize_Single(pts, fs, model_name, params):
-
-    if model_name == "no_divergence":
-        #####################################
-        #No Divergence
-        #####################################
-        print "---------------------------------------------------"
-        print "No Divergence",'\n'
-
-        #first call a predefined model
-        model_call = Models_2D.no_divergence
-        params = []
-        print "parameter set = [none]"
-        
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #simulate the model with the optimized parameters
-        sim_model = func_exec(params, fs.sample_sizes, pts)
-
-        #calculate likelihood
-        ll = dadi.Inference.ll_multinom(sim_model, fs)
-        ll = np.around(ll, 2)
-        print "likelihood = ", ll
-
-        #calculate theta
-        theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-        theta = np.around(theta, 2)
-        print "Theta = ", theta
-
-        #calculate AIC 
-        aic = ( -2*( float(ll))) + (2*3)
-        print "AIC = ", aic, '\n', '\n'
-        return sim_model
-
-        
-    elif model_name == "no_mig":
-        #####################################
-        # Divergence with no migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with no migration",'\n'
-
-        #first call a predefined model
-        model_call = Models_2D.no_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        print "base parameters = ", params
-
-        #simulate the model with the optimized parameters
-        sim_model = func_exec(params, fs.sample_sizes, pts)
-
-        #calculate likelihood
-        ll = dadi.Inference.ll_multinom(sim_model, fs)
-        ll = np.around(ll, 2)
-        print "likelihood = ", ll
-
-        #calculate theta
-        theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-        theta = np.around(theta, 2)
-        print "Theta = ", theta
-
-        #calculate AIC 
-        aic = ( -2*( float(ll))) + (2*3)
-        print "AIC = ", aic, '\n', '\n'
-        return sim_model
-
-        
-    elif model_name == "sym_mig":
-        #####################################
-        #Divergence with symmetric migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with symmetric migration",'\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sym_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        print "base parameters = ", params
-        
-        #simulate the model with the optimized parameters
-        sim_model = func_exec(params, fs.sample_sizes, pts)
-
-        #calculate likelihood
-        ll = dadi.Inference.ll_multinom(sim_model, fs)
-        ll = np.around(ll, 2)
-        print "likelihood = ", ll
-
-        #calculate AIC 
-        aic = ( -2*( float(ll))) + (2*4)
-        print "AIC = ", aic, '\n', '\n'
-        return sim_model
-
-        
-    elif model_name == "asym_mig":
-        #####################################
-        #Divergence with asymmetric migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with asymmetric migration",'\n'
-
-        #first call a predefined model
-        model_call = Models_2D.asym_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        print "base parameters = ", params
-
-        #simulate the model with the optimized parameters
-        sim_model = func_exec(params, fs.sample_sizes, pts)
-
-        #calculate likelihood
-        ll = dadi.Inference.ll_multinom(sim_model, fs)
-        ll = np.around(ll, 2)
-        print "likelihood = ", ll
-
-        #calculate AIC 
-        aic = ( -2*( float(ll))) + (2*5)
-        print "AIC = ", aic, '\n', '\n'
-        return sim_model
-
-        
-    elif model_name == "anc_sym_mig":
-        #####################################
-        #Divergence with ancient symmetrical migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with ancient symmetrical migration",'\n'
-
-        #first call a predefined model
-        model_call = Models_2D.anc_sym_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-        
-        print "base parameters = ", params
-
-        #simulate the model with the optimized parameters
-        sim_model = func_exec(params, fs.sample_sizes, pts)
-
-        #calculate likelihood
-        ll = dadi.Inference.ll_multinom(sim_model, fs)
-        ll = np.around(ll, 2)
-        print "likelihood = ", ll
-
-        #calculate AIC 
-        aic = ( -2*( float(ll))) + (2*5)
-        print "AIC = ", aic, '\n', '\n'
-        return sim_model
-
-        
-    elif model_name == "anc_asym_mig":
-        #####################################
-        #Divergence with ancient asymmetrical migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with ancient asymmetrical migration",'\n'
-
-        #first call a predefined model
-        model_call = Models_2D.anc_asym_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        print "base parameters = ", params
-
-        #simulate the model with the optimized parameters
-        sim_model = func_exec(params, fs.sample_sizes, pts)
-
-        #calculate likelihood
-        ll = dadi.Inference.ll_multinom(sim_model, fs)
-        ll = np.around(ll, 2)
-        print "likelihood = ", ll
-
-        #calculate AIC 
-        aic = ( -2*( float(ll))) + (2*6)
-        print "AIC = ", aic, '\n', '\n'
-        return sim_model
-
-        
-    elif model_name == "sec_contact_sym_mig":
-        #####################################
-        #Divergence and symmetrical secondary contact
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence and symmetrical secondary contact",'\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sec_contact_sym_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-        
-        print "base parameters = ", params
-
-        #simulate the model with the optimized parameters
-        sim_model = func_exec(params, fs.sample_sizes, pts)
-
-        #calculate likelihood
-        ll = dadi.Inference.ll_multinom(sim_model, fs)
-        ll = np.around(ll, 2)
-        print "likelihood = ", ll
-
-        #calculate AIC 
-        aic = ( -2*( float(ll))) + (2*5)
-        print "AIC = ", aic, '\n', '\n'
-        return sim_model
-        
-        
-    elif model_name == "sec_contact_asym_mig":
-        #####################################
-        #Divergence and asymmetrical secondary contact
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence and asymmetrical secondary contact",'\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sec_contact_asym_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-        
-        print "base parameters = ", params
-        
-        #simulate the model with the optimized parameters
-        sim_model = func_exec(params, fs.sample_sizes, pts)
-
-        #calculate likelihood
-        ll = dadi.Inference.ll_multinom(sim_model, fs)
-        ll = np.around(ll, 2)
-        print "likelihood = ", ll
-
-        #calculate AIC 
-        aic = ( -2*( float(ll))) + (2*6)
-        print "AIC = ", aic, '\n', '\n'
-        return sim_model
-
-
-    ##########################################################################
-    #Similar models but with size change allowed
-    ##########################################################################
-    
-    elif model_name == "no_mig_size":
-        #####################################
-        #Divergence with no migration, size change
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with no migration, size change",'\n'
-
-        #first call a predefined model
-        model_call = Models_2D.no_mig_size
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-        
-        print "base parameters = ", params
-
-        #simulate the model with the optimized parameters
-        sim_model = func_exec(params, fs.sample_sizes, pts)
-
-        #calculate likelihood
-        ll = dadi.Inference.ll_multinom(sim_model, fs)
-        ll = np.around(ll, 2)
-        print "likelihood = ", ll
-
-        #calculate AIC 
-        aic = ( -2*( float(ll))) + (2*6)
-        print "AIC = ", aic, '\n', '\n'
-        return sim_model
-        
-        
-    elif model_name == "sym_mig_size":
-        #####################################
-        #Divergence with symmetric migration, size change
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with symmetric migration, size change",'\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sym_mig_size
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-        
-        print "base parameters = ", params
-
-        #simulate the model with the optimized parameters
-        sim_model = func_exec(params, fs.sample_sizes, pts)
-
-        #calculate likelihood
-        ll = dadi.Inference.ll_multinom(sim_model, fs)
-        ll = np.around(ll, 2)
-        print "likelihood = ", ll
-
-        #calculate AIC 
-        aic = ( -2*( float(ll))) + (2*7)
-        print "AIC = ", aic, '\n', '\n'
-        return sim_model
-        
-
-    elif model_name == "asym_mig_size":
-        #####################################
-        #Divergence with asymmetric migration, size change
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with asymmetric migration, size change",'\n'
-
-        #first call a predefined model
-        model_call = Models_2D.asym_mig_size
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-        
-        print "base parameters = ", params
-
-        #simulate the model with the optimized parameters
-        sim_model = func_exec(params, fs.sample_sizes, pts)
-
-        #calculate likelihood
-        ll = dadi.Inference.ll_multinom(sim_model, fs)
-        ll = np.around(ll, 2)
-        print "likelihood = ", ll
-
-        #calculate AIC 
-        aic = ( -2*( float(ll))) + (2*8)
-        print "AIC = ", aic, '\n', '\n'
-        return sim_model
- 
- 
-    elif model_name == "anc_sym_mig_size":
-        #####################################
-        #Divergence with ancient symmetrical migration, size change
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with ancient symmetrical migration, size change",'\n'
-
-        #first call a predefined model
-        model_call = Models_2D.anc_sym_mig_size
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        print "base parameters = ", params
-
-        #simulate the model with the optimized parameters
-        sim_model = func_exec(params, fs.sample_sizes, pts)
-
-        #calculate likelihood
-        ll = dadi.Inference.ll_multinom(sim_model, fs)
-        ll = np.around(ll, 2)
-        print "likelihood = ", ll
-
-        #calculate AIC 
-        aic = ( -2*( float(ll))) + (2*7)
-        print "AIC = ", aic, '\n', '\n'
-        return sim_model
-
-        
-    elif model_name == "anc_asym_mig_size":
-        #####################################
-        #Divergence with ancient asymmetrical migration, size change
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with ancient asymmetrical migration, size change",'\n'
-
-        #first call a predefined model
-        model_call = Models_2D.anc_asym_mig_size
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-        
-        print "base parameters = ", params
-
-        #simulate the model with the optimized parameters
-        sim_model = func_exec(params, fs.sample_sizes, pts)
-
-        #calculate likelihood
-        ll = dadi.Inference.ll_multinom(sim_model, fs)
-        ll = np.around(ll, 2)
-        print "likelihood = ", ll
-
-        #calculate AIC 
-        aic = ( -2*( float(ll))) + (2*8)
-        print "AIC = ", aic, '\n', '\n'
-        return sim_model
-
-
-    elif model_name == "sec_contact_sym_mig_size":
-        #####################################
-        #Divergence and symmetrical secondary contact, size change
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence and symmetrical secondary contact, size change",'\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sec_contact_sym_mig_size
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-        
-        print "base parameters = ", params
-
-        #simulate the model with the optimized parameters
-        sim_model = func_exec(params, fs.sample_sizes, pts)
-
-        #calculate likelihood
-        ll = dadi.Inference.ll_multinom(sim_model, fs)
-        ll = np.around(ll, 2)
-        print "likelihood = ", ll
-
-        #calculate AIC 
-        aic = ( -2*( float(ll))) + (2*7)
-        print "AIC = ", aic, '\n', '\n'
-        return sim_model
-
-           
-    elif model_name == "sec_contact_asym_mig_size":
-        #####################################
-        #Divergence and asymmetrical secondary contact, size change
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence and asymmetrical secondary contact, size change",'\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sec_contact_asym_mig_size
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-        
-        print "base parameters = ", params
-
-        #simulate the model with the optimized parameters
-        sim_model = func_exec(params, fs.sample_sizes, pts)
-
-        #calculate likelihood
-        ll = dadi.Inference.ll_multinom(sim_model, fs)
-        ll = np.around(ll, 2)
-        print "likelihood = ", ll
-
-        #calculate AIC 
-        aic = ( -2*( float(ll))) + (2*8)
-        print "AIC = ", aic, '\n', '\n'
-        return sim_model
-
-        print "base parameters = ", params
-
-        #simulate the model with the optimized parameters
-        sim_model = func_exec(params, fs.sample_sizes, pts)
-
-        #calculate likelihood
-        ll = dadi.Inference.ll_multinom(sim_model, fs)
-        ll = np.around(ll, 2)
-        print "likelihood = ", ll
-
-        #calculate AIC 
-        aic = ( -2*( float(ll))) + (2*5)
-        print "AIC = ", aic, '\n', '\n'
-        return sim_model
-    
-    elif model_name == "sym_mig_twoepoch":
-        #####################################
-        #Divergence with symmetric migration, two epoch
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with symmetric migration, two epoch",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sym_mig_twoepoch
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        print "base parameters = ", params
-
-        #simulate the model with the optimized parameters
-        sim_model = func_exec(params, fs.sample_sizes, pts)
-
-        #calculate likelihood
-        ll = dadi.Inference.ll_multinom(sim_model, fs)
-        ll = np.around(ll, 2)
-        print "likelihood = ", ll
-
-        #calculate AIC 
-        aic = ( -2*( float(ll))) + (2*6)
-        print "AIC = ", aic, '\n', '\n'
-        return sim_model
-        
-    elif model_name == "asym_mig_twoepoch":
-        #####################################
-        #Divergence with asymmetric migration, two epoch
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence with asymmetric migration, two epoch",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.asym_mig_twoepoch
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        print "base parameters = ", params
-
-        #simulate the model with the optimized parameters
-        sim_model = func_exec(params, fs.sample_sizes, pts)
-
-        #calculate likelihood
-        ll = dadi.Inference.ll_multinom(sim_model, fs)
-        ll = np.around(ll, 2)
-        print "likelihood = ", ll
-
-        #calculate AIC 
-        aic = ( -2*( float(ll))) + (2*8)
-        print "AIC = ", aic, '\n', '\n'
-        return sim_model
-        
-    #####################################################################
-        
-    elif model_name == "sec_contact_sym_mig_three_epoch":
-        #####################################
-        #Divergence and symmetrical secondary contact, three epoch
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence and symmetrical secondary contact, three epoch",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sec_contact_sym_mig_three_epoch
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        print "base parameters = ", params
-
-        #simulate the model with the optimized parameters
-        sim_model = func_exec(params, fs.sample_sizes, pts)
-
-        #calculate likelihood
-        ll = dadi.Inference.ll_multinom(sim_model, fs)
-        ll = np.around(ll, 2)
-        print "likelihood = ", ll
-
-        #calculate AIC 
-        aic = ( -2*( float(ll))) + (2*6)
-        print "AIC = ", aic, '\n', '\n'
-        return sim_model
-        
-        
-    elif model_name == "sec_contact_asym_mig_three_epoch":
-        #####################################
-        #Divergence and asymmetrical secondary contact, three epoch
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence and asymmetrical secondary contact, three epoch",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sec_contact_asym_mig_three_epoch
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        print "base parameters = ", params
-
-        #simulate the model with the optimized parameters
-        sim_model = func_exec(params, fs.sample_sizes, pts)
-
-        #calculate likelihood
-        ll = dadi.Inference.ll_multinom(sim_model, fs)
-        ll = np.around(ll, 2)
-        print "likelihood = ", ll
-
-        #calculate AIC 
-        aic = ( -2*( float(ll))) + (2*7)
-        print "AIC = ", aic, '\n', '\n'
-        return sim_model
-        
-    elif model_name == "sec_contact_sym_mig_size_three_epoch":
-        #####################################
-        #Divergence and symmetrical secondary contact, size change, three epoch
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence and symmetrical secondary contact, size change, three epoch",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sec_contact_sym_mig_size_three_epoch
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        print "base parameters = ", params
-
-        #simulate the model with the optimized parameters
-        sim_model = func_exec(params, fs.sample_sizes, pts)
-
-        #calculate likelihood
-        ll = dadi.Inference.ll_multinom(sim_model, fs)
-        ll = np.around(ll, 2)
-        print "likelihood = ", ll
-
-        #calculate AIC 
-        aic = ( -2*( float(ll))) + (2*8)
-        print "AIC = ", aic, '\n', '\n'
-        return sim_model
-
-           
-    elif model_name == "sec_contact_asym_mig_size_three_epoch":
-        #####################################
-        #Divergence and asymmetrical secondary contact, size change, three epoch
-        #####################################
-        print "---------------------------------------------------"
-        print "Divergence and asymmetrical secondary contact, size change, three epoch",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.sec_contact_asym_mig_size_three_epoch
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        print "base parameters = ", params
-
-        #simulate the model with the optimized parameters
-        sim_model = func_exec(params, fs.sample_sizes, pts)
-
-        #calculate likelihood
-        ll = dadi.Inference.ll_multinom(sim_model, fs)
-        ll = np.around(ll, 2)
-        print "likelihood = ", ll
-
-        #calculate AIC 
-        aic = ( -2*( float(ll))) + (2*9)
-        print "AIC = ", aic, '\n', '\n'
-        return sim_model
-
-    #####################################################################
     #ISLAND MODELS
-    #####################################################################
-
-    elif model_name == "vic_no_mig":
-        #####################################
-        #Vicariance and no migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Vicariance and no migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.vic_no_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-        print "base parameters = ", params
-
-        #simulate the model with the optimized parameters
-        sim_model = func_exec(params, fs.sample_sizes, pts)
-
-        #calculate likelihood
-        ll = dadi.Inference.ll_multinom(sim_model, fs)
-        ll = np.around(ll, 2)
-        print "likelihood = ", ll
-
-        #calculate theta
-        theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-        theta = np.around(theta, 2)
-        print "Theta = ", theta
-
-        #calculate AIC 
-        aic = ( -2*( float(ll))) + (2*5)
-        print "AIC = ", aic, '\n', '\n'
-        return sim_model
-
-    
-    elif model_name == "vic_anc_asym_mig":
-        #####################################
-        #Vicariance and ancient asymmetric migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Vicariance and ancient asymmetric migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.vic_anc_asym_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-        print "base parameters = ", params
-        
-        #simulate the model with the optimized parameters
-        sim_model = func_exec(params, fs.sample_sizes, pts)
-
-        #calculate likelihood
-        ll = dadi.Inference.ll_multinom(sim_model, fs)
-        ll = np.around(ll, 2)
-        print "likelihood = ", ll
-
-        #calculate theta
-        theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-        theta = np.around(theta, 2)
-        print "Theta = ", theta
-
-        #calculate AIC 
-        aic = ( -2*( float(ll))) + (2*8)
-        print "AIC = ", aic, '\n', '\n'
+    "vic_no_mig": Model("Models_2D", "Vicariance and no migration",
+        ["nuA", "nu1", "nu2", "T", "s"],
+        [0.01, 0.01, 0.01, 0.01, 0.001], [20, 20, 20, 10, 0.99], [1, 1, 1, 1, 0.25], 5),
+    "vic_anc_asym_mig": Model("Models_2D", "Vicariance and ancient asymmetric migration",
+        ["nuA", "nu1", "nu2", "m12", "m21", "T1", "T2", "s"],
+        [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.001], [20, 20, 20, 10, 10, 10, 10, 0.99], [1, 1, 1, 1, 1, 1, 1, 0.25], 8),
+    "vic_sec_contact_asym_mig": Model("Models_2D", "Vicariance and secondary contact with asymmetric migration",
+        ["nuA", "nu1", "nu2", "m12", "m21", "T1", "T2", "s"],
+        [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.001], [20, 20, 20, 10, 10, 10, 10, 0.99], [1, 1, 1, 1, 1, 1, 1, 0.25], 8),
+    "founder_sym": Model("Models_2D", "Founder event and symmetric migration",
+        ["nuA", "nu1", "nu2", "m", "T", "s"],
+        [0.01, 0.01, 0.01, 0.01, 0.01, 0.001], [20, 20, 20, 20, 10, 0.99], [1, 1, 1, 1, 1, 0.25], 6),
+    "founder_asym": Model("Models_2D", "Founder event and asymmetric migration",
+        ["nuA", "nu1", "nu2", "m12", "m21", "T", "s"],
+        [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.001], [30, 30, 30, 20, 20, 10, 0.99], [1, 1, 1, 1, 1, 1, 0.25], 7),
+    "founder_nomig": Model("Models_2D", "Founder event and no migration",
+        ["nuA", "nu1", "nu2", "T", "s"],
+        [0.01, 0.01, 0.01, 0.01, 0.001], [30, 30, 30, 10, 0.99], [1, 1, 1, 1, 0.25], 5),
+    "vic_no_mig_admix_early": Model("Models_2D", "Vicariance with early discrete admixture",
+        ["nuA", "nu1", "nu2", "T", "s", "f"],
+        [0.01, 0.01, 0.01, 0.01, 0.001, 0.001], [20, 20, 20, 10, 0.99, 0.99], [1, 1, 1, 1, 0.25, 0.25], 6),
+    "vic_no_mig_admix_late": Model("Models_2D", "Vicariance with late discrete admixture",
+        ["nuA", "nu1", "nu2", "T", "s", "f"],
+        [0.01, 0.01, 0.01, 0.01, 0.001, 0.001], [20, 20, 20, 10, 0.99, 0.99], [1, 1, 1, 1, 0.25, 0.25], 6),
+    "vic_two_epoch_admix": Model("Models_2D", "Vicariance with discrete admixture, two epoch",
+        ["nuA", "nu1", "nu2", "T1", "T2", "s", "f"],
+        [0.01, 0.01, 0.01, 0.01, 0.01, 0.001, 0.001], [20, 20, 20, 10, 10, 0.99, 0.99], [1, 1, 1, 1, 1, 0.25, 0.25], 7),
+    "founder_nomig_admix_early": Model("Models_2D", "Founder event and discrete early admixture",
+        ["nuA", "nu1", "nu2", "T", "s", "f"],
+        [0.01, 0.01, 0.01, 0.01, 0.001, 0.001], [20, 20, 10, 10, 0.99, 0.99], [1, 1, 1, 1, 0.25, 0.25], 6),
+    "founder_nomig_admix_late": Model("Models_2D", "Founder event and discrete late admixture",
+        ["nuA", "nu1", "nu2", "T", "s", "f"],
+        [0.01, 0.01, 0.01, 0.01, 0.001, 0.001], [20, 20, 10, 10, 0.99, 0.99], [1, 1, 1, 1, 0.25, 0.25], 6),
+    "founder_nomig_admix_two_epoch": Model("Models_2D", "Founder event and discrete admixture, two epoch",
+        ["nuA", "nu1", "nu2", "T1", "T2", "s", "f"],
+        [0.01, 0.01, 0.01, 0.01, 0.01, 0.001, 0.001], [20, 20, 10, 10, 10, 0.99, 0.99], [1, 1, 1, 1, 1, 0.25, 0.25], 7),
+
+    #3D MODELS (Models_3D.py)
+    "split_nomig": Model("Models_3D", "Split with No Migration",
+        ["nu1", "nuA", "nu2", "nu3", "T1", "T2"],
+        [0.01, 0.01, 0.01, 0.01, 0, 0], [30, 30, 30, 30, 10, 10], [1, 1, 1, 1, 1, 1], 6),
+    "split_symmig_all": Model("Models_3D", "Split with Symmetric Migration",
+        ["nu1", "nuA", "nu2", "nu3", "mA", "m1", "m2", "m3", "T1", "T2"],
+        [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0, 0], [30, 30, 30, 30, 20, 20, 20, 20, 10, 10], [1, 1, 1, 1, 1, 1, 1, 1, 1, 1], 10),
+    "split_asymmig_all": Model("Models_3D", "Split with Asymmetric Migration",
+        ["nu1", "nuA", "nu2", "nu3", "mA1", "mA2", "m12", "m21", "m13", "m31", "m3", "T1", "T2"],
+        [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0, 0], [30, 30, 30, 30, 20, 20, 20, 20, 20, 20, 20, 10, 10], [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], 13),
+    "split_symmig_adjacent": Model("Models_3D", "Split with Adjacent Symmetric Migration",
+        ["nu1", "nuA", "nu2", "nu3", "mA", "m1", "m2", "T1", "T2"],
+        [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0, 0], [30, 30, 30, 30, 20, 20, 20, 10, 10], [1, 1, 1, 1, 1, 1, 1, 1, 1], 9),
+    "starsplit": Model("Models_3D", "Starsplit",
+        ["nu1", "nu2", "nu3", "m12", "m21", "m13", "m31", "m3", "T"],
+        [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0], [30, 30, 30, 20, 20, 20, 20, 20, 10], [1, 1, 1, 1, 1, 1, 1, 1, 1], 9),
+}
+
+
+#MODELS lists the models of both folders, each folder only has the functions of its own
+#module (Models_2D or Models_3D): model_name -> None if it can be run here, else the reason
+_defined = {}
+
+#files that hold a model module under a name Python can't import, the 2D folder has
+#Models_2D as 2D_Models.py
+MODEL_FILES = {"Models_2D": "2D_Models.py"}
+
+def import_models(name):
+    '''
+    Import the model module name (ex. Models_2D), loading it from its file in MODEL_FILES
+    (looked for in the current folder, then next to this script) if there is no name.py.
+    '''
+    try:
+        return __import__(name)
+    except ImportError:
+        if name not in MODEL_FILES:
+            raise
+        for folder in (os.getcwd(), os.path.dirname(os.path.abspath(__file__))):
+            path = os.path.join(folder, MODEL_FILES[name])
+            if os.path.exists(path):
+                #registered in sys.modules as name, so a later 'import Models_2D' finds it too
+                return imp.load_source(name, path)
+        raise
+
+
+def get_model(model_name):
+    '''
+    Return the registry entry for model_name, checking that its model function can be
+    imported from this folder.
+    '''
+    model = _registry(model_name)
+    reason = _not_defined(model_name)
+    if reason is not None:
+        raise ValueError("Model_name '{0}' can't be run here, {1}. Choose one of: {2}".format(model_name, reason, ", ".join(available_models())))
+    return model
+
+
+def available_models():
+    '''
+    Names of the models whose function can be imported from this folder.
+    '''
+    return [model_name for model_name in sorted(MODELS) if _not_defined(model_name) is None]
+
+
+def _not_defined(model_name):
+    if model_name not in _defined:
+        model = MODELS[model_name]
+        try:
+            module = import_models(model.module)
+            _defined[model_name] = None if hasattr(module, model_name) else "{0}.py has no function {1}".format(model.module, model_name)
+        except ImportError as e:
+            _defined[model_name] = "{0}.py can't be imported ({1})".format(model.module, e)
+    return _defined[model_name]
+
+
+def _registry(model_name):
+    #registry entry without the import check, for reading outputs of the other folder
+    try:
+        return MODELS[model_name]
+    except KeyError:
+        raise ValueError("Unknown model_name '{0}', choose one of: {1}".format(model_name, ", ".join(available_models())))
+
+
+def get_model_function(model_name):
+    '''
+    Return the model function for model_name, importing its module on first use.
+    '''
+    model = get_model(model_name)
+    module = import_models(model.module)
+    return getattr(module, model_name)
+
+
+#extrapolating functions are built once per (model, grids) in each process and reused
+#by every round and replicate
+_func_execs = {}
+
+def get_func_exec(model_name, pts):
+    '''
+    Return the extrapolating function of model_name for the grids pts. With a single
+    grid (ex. [20]) the model is run on that grid only, without extrapolation.
+    '''
+    key = (model_name, tuple(pts))
+    if key not in _func_execs:
+        if len(pts) == 1:
+            model_func = get_model_function(model_name)
+            _func_execs[key] = lambda params, ns, pts: model_func(params, ns, pts[0])
+        else:
+            _func_execs[key] = dadi.Numerics.make_extrap_log_func(get_model_function(model_name))
+    return _func_execs[key]
+
+
+#xtol of scipy.optimize.fmin (used by dadi's optimize_log_fmin) on the log params: points
+#closer than this are the same point to the optimizer, and Nelder-Mead only comes back
+#near a point it has tried (a contracted simplex, replicates ending in the same optimum)
+#within about this distance. set_model_cache(tol=FMIN_XTOL) gets those hits with
+#log_fmin, at the price of every objective becoming a step function of this width: keep
+#the default exact keys (tol=0) with the gradient optimizers, whose finite difference
+#steps are about that size
+FMIN_XTOL = 1e-4
+
+class ModelCache(object):
+    '''
+    Least-recently-used cache of simulated model spectra, keyed on the model, grids,
+    sample sizes and the parameter vector (exactly, or rounded to the relative tolerance
+    tol if it is above 0). At most max_size spectra are kept in memory. With a cache_dir the spectra are
+    also written to disk, so other worker processes and later runs can reuse them.
+    '''
+    def __init__(self, max_size=100, tol=0, cache_dir=None):
+        self.max_size = int(max_size)
+        self.tol = float(tol)
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+        if cache_dir is not None and not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+
+    @property
+    def enabled(self):
+        return self.max_size > 0 or self.cache_dir is not None
+
+    def key(self, model_name, params, ns, pts):
+        params = np.asarray(params, dtype=float)
+        if self.tol > 0:
+            #params are positive, round them on a log scale so tol is relative
+            with np.errstate(divide='ignore'):
+                params = np.round(np.log(params) / np.log1p(self.tol))
+        return (model_name, tuple(pts), tuple(int(n) for n in ns), tuple(params))
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, hashlib.sha1(repr(key)).hexdigest() + ".pkl")
+
+    def _store(self, key, sim_model):
+        self._entries[key] = sim_model
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def get(self, key):
+        if key in self._entries:
+            #move to the most recently used end
+            sim_model = self._entries.pop(key)
+            self._entries[key] = sim_model
+            self.hits += 1
+            return sim_model
+        if self.cache_dir is not None and os.path.exists(self._path(key)):
+            try:
+                fh = open(self._path(key), 'rb')
+                sim_model = cPickle.load(fh)
+                fh.close()
+            except (IOError, EOFError, cPickle.UnpicklingError):
+                sim_model = None
+            if sim_model is not None:
+                self._store(key, sim_model)
+                self.hits += 1
+                return sim_model
+        self.misses += 1
+        return None
+
+    def put(self, key, sim_model):
+        self._store(key, sim_model)
+        if self.cache_dir is not None:
+            #write to a temporary file first so concurrent readers never see half a file
+            path = self._path(key)
+            tmp = "{0}.{1}.tmp".format(path, os.getpid())
+            fh = open(tmp, 'wb')
+            cPickle.dump(sim_model, fh, 2)
+            fh.close()
+            os.rename(tmp, path)
+
+    def wrap(self, model_name, func_exec):
+        '''
+        Return func_exec with this cache in front of it.
+        '''
+        def cached_func_exec(params, ns, pts):
+            key = self.key(model_name, params, ns, pts)
+            sim_model = self.get(key)
+            if sim_model is None:
+                sim_model = func_exec(params, ns, pts)
+                self.put(key, sim_model)
+            return sim_model
+        return cached_func_exec
+
+
+#the cache shared by all replicates run in this process (and inherited by forked workers)
+_model_cache = ModelCache()
+
+def set_model_cache(max_size=100, tol=0, cache_dir=None):
+    '''
+    Replace the model cache used by the optimization rounds. max_size=0 turns
+    caching off, tol is the relative difference below which two parameter values
+    are treated as equal (default 0, only identical params; FMIN_XTOL gets many more
+    hits with log_fmin but makes the likelihood a step function, see FMIN_XTOL) and cache_dir
+    optionally keeps the spectra on disk. The hits and misses are printed per model
+    after every round.
+    '''
+    global _model_cache
+    _model_cache = ModelCache(max_size=max_size, tol=tol, cache_dir=cache_dir)
+    #workers forked earlier still hold the old cache
+    close_pool()
+    return _model_cache
+
+
+#seconds between checkpoints of a replicate's best params, a replicate killed without
+#warning (ex. by the cluster) loses at most this much of its progress
+CHECKPOINT_INTERVAL = 30
+
+class _BestSpectrum(object):
+    '''
+    Wraps an extrapolating function during an optimization and keeps the model
+    spectrum with the best log-likelihood it has produced, so the optimized params
+    can be scored without simulating the model again. With a checkpoint path the
+    best params are also saved there (at most every CHECKPOINT_INTERVAL seconds, and
+    by save_checkpoint when the optimization is interrupted), so an interrupted
+    replicate can be resumed from them.
+    '''
+    #model evaluations requested by optimizations in this process
+    evaluations = 0
+
+    def __init__(self, func_exec, fs, checkpoint=None):
+        self.func_exec = func_exec
+        self.fs = fs
+        self.checkpoint = checkpoint
+        self.params = None
+        self.sim_model = None
+        self.ll = None
+        self._saved = time.time()
+        self._unsaved = False
+
+    def __call__(self, params, ns, pts):
+        _BestSpectrum.evaluations += 1
+        sim_model = self.func_exec(params, ns, pts)
+        ll = dadi.Inference.ll_multinom(sim_model, self.fs)
+        if self.ll is None or ll > self.ll:
+            self.params = np.array(params, dtype=float)
+            self.sim_model = sim_model
+            self.ll = ll
+            self._unsaved = True
+            if time.time() - self._saved >= CHECKPOINT_INTERVAL:
+                self.save_checkpoint()
         return sim_model
 
+    def save_checkpoint(self):
+        '''
+        Save the best params to the checkpoint, if they improved since the last save.
+        '''
+        if self.checkpoint is not None and self._unsaved:
+            _save_checkpoint(self.checkpoint, {"params": self.params, "ll": self.ll})
+        self._saved = time.time()
+        self._unsaved = False
+
+    def score(self, params, pts):
+        '''
+        Return (sim_model, ll, theta) for params, only simulating the model if
+        params is not the best point seen during the optimization.
+        '''
+        if self.params is not None and np.array_equal(self.params, params):
+            sim_model, ll = self.sim_model, self.ll
+        else:
+            sim_model = self.func_exec(params, self.fs.sample_sizes, pts)
+            ll = dadi.Inference.ll_multinom(sim_model, self.fs)
+        theta = dadi.Inference.optimal_sfs_scaling(sim_model, self.fs)
+        return sim_model, ll, theta
+
+
+def is_fixed(model):
+    '''
+    True if the model has nothing to optimize: no parameters, or lower and upper
+    bounds that pin every parameter to a single value.
+    '''
+    return not model.param_names or list(model.lower_bound) == list(model.upper_bound)
+
+
+def _param_set(model):
+    if not model.param_names:
+        return "parameter set = [none]"
+    return "parameter set = [{}]".format(", ".join(model.param_names))
 
-    elif model_name == "vic_sec_contact_asym_mig":
-        #####################################
-        #Vicariance and secondary contact with asymmetric migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Vicariance and secondary contact with asymmetric migration",'\n','\n'
 
-        #first call a predefined model
-        model_call = Models_2D.vic_sec_contact_asym_mig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-        print "base parameters = ", params
+#======================================================================================
+#======================================================================================
+#======================================================================================
+#======================================================================================
+#Output functions
+
+# ResultsWriter(outname, flush_every=1, shard=None)
+
+# Every round writes its rows through one ResultsWriter, which keeps a single handle open
+# for the whole round and writes each row with a single write call. Rows are flushed to
+# disk every flush_every rows (and when the writer is closed).
+# A writer locks its file ("<path>.lock") for as long as it is open, so a second copy of
+# the script writing the same round stops with an error instead of mixing its rows in.
+# To run several copies of a script on the same round at once (ex. on NFS or a cluster),
+# give each copy its own shard (index, count), ex. set_writer_options(shard=(2, 4)) or
+# --shard 2/4: copy i then runs replicates i, i+count, i+2*count, ... and writes them to
+# "<outname>.shard_<i>". The last copy to finish the round merges the shards into outname
+# (see merge_shards), and every copy waits for that before it goes on to the next round.
+# A copy that fails or is interrupted marks its shard stopped, and the copies waiting for it
+# (or for a shard whose process died on the same host) stop with an error instead of waiting
+# forever. A shard that died on another machine can't be seen: restart it with the same
+# shard, it resumes its replicates and the waiting copies carry on.
+
+HEADER = "Model"+'\t'+"param_set"+'\t'+"Replicate"+'\t'+"log-likelihood"+'\t'+"theta"+'\t'+"AIC"+'\t'+"optimized_params"+'\n'
+
+class ResultsWriter(object):
+    '''
+    Single-handle, buffered writer for the rows of one round output file.
+    '''
+    def __init__(self, outname, flush_every=1, shard=None, store=None, outfile=None, round_num=None, model_name=None):
+        self.outname = outname
+        self.flush_every = max(int(flush_every), 1)
+        self.shard = shard
+        #rows are also recorded in the ResultsStore, if there is one
+        self.store = store
+        self.record = {"outfile": outfile, "round_num": round_num, "model_name": model_name}
+        if shard is None:
+            self.path = outname
+        else:
+            self.path = shard_path(outname, shard[0])
+        #only cut off a partial row once the file is ours
+        self._lock = _lock_output(self.path)
+        _drop_partial_row(self.path)
+        if shard is not None:
+            for marker in (self.path + ".done", self.path + ".stopped"):
+                if os.path.exists(marker):
+                    os.remove(marker)
+        self._new = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+        self._fh = open(self.path, 'a')
+        self._unflushed = 0
+
+    def write_header(self):
+        #shards are merged under the header of the main file, and a file that
+        #already has rows (a resumed round) already has its header
+        if self.shard is None and self._new:
+            self._write(HEADER)
+
+    def completed_replicates(self):
+        '''
+        Replicate numbers that already have a row in the output file (or one of its shards).
+        '''
+        done = set()
+        for path in [self.outname] + _shard_files(self.outname):
+            if not os.path.exists(path):
+                continue
+            fh_in = open(path)
+            for line in fh_in:
+                fields = line.split('\t')
+                if line.endswith('\n') and len(fields) > 3 and fields[2].isdigit():
+                    done.add(int(fields[2]))
+            fh_in.close()
+        return done
+
+    def owns(self, replicate):
+        '''
+        Whether this copy of the script runs replicate (always, unless it is a shard).
+        '''
+        return self.shard is None or (int(replicate) - 1) % self.shard[1] == self.shard[0] - 1
+
+    def checkpoint_path(self, replicate):
+        return "{0}.ckpt_{1}".format(self.path, replicate)
+
+    @property
+    def failure_path(self):
+        if self.path.endswith("_optimized.txt"):
+            return self.path[:-len("_optimized.txt")] + "_failed.txt"
+        return self.path + ".failed"
+
+    def write_failure(self, model, replicate, error, elapsed, params, seed=None):
+        '''
+        Record a replicate that raised or timed out in the failures file next to the output.
+        '''
+        if self.store is not None:
+            self.store.insert(replicate=replicate, params=params, seed=seed, elapsed=elapsed, error=error, **self.record)
+        new = not os.path.exists(self.failure_path)
+        fh_fail = open(self.failure_path, 'a')
+        if new:
+            fh_fail.write("Model"+'\t'+"Replicate"+'\t'+"error"+'\t'+"elapsed_seconds"+'\t'+"params_tried"+'\n')
+        fields = [model.label, replicate, " ".join(str(error).split()), np.around(elapsed, 1)]
+        fields.extend(np.around(p, 4) for p in params)
+        fh_fail.write("".join("{}\t".format(f) for f in fields) + '\n')
+        fh_fail.close()
+
+    def write_row(self, model, replicate, ll, theta, aic, params, seed=None, elapsed=None, cache_hits=None, cache_misses=None):
+        if self.store is not None:
+            self.store.insert(replicate=replicate, ll=ll, theta=theta, aic=aic, params=params, seed=seed, elapsed=elapsed,
+                              cache_hits=cache_hits, cache_misses=cache_misses, **self.record)
+        fields = [model.label, _param_set(model), replicate, ll, theta, aic]
+        fields.extend(np.around(p, 4) for p in params)
+        self._write("".join("{}\t".format(f) for f in fields) + '\n')
+
+    def _write(self, text):
+        self._fh.write(text)
+        self._unflushed += 1
+        if self._unflushed >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+        self._unflushed = 0
+
+    def close(self):
+        if not self._fh.closed:
+            self.flush()
+            self._fh.close()
+        if self._lock is not None:
+            _unlock_output(self._lock)
+            self._lock = None
+
+    def finish(self):
+        '''
+        Close the writer at the end of a round that ran to completion. A shard marks
+        itself done, merges the shards if it is the last one, and waits for the merge.
+        '''
+        self.close()
+        if self.shard is None:
+            return
+        open(self.path + ".done", 'w').close()
+        _wait_for_shards(self.outname, self.shard[1])
+
+    def stop(self):
+        '''
+        Close the writer of a round that failed or was interrupted. A shard marks itself
+        stopped, so the other shards don't wait for it to finish the round.
+        '''
+        self.close()
+        if self.shard is not None:
+            open(self.path + ".stopped", 'w').close()
+
+
+def _drop_partial_row(path):
+    #a crash while writing can leave half a row at the end of a file, cut it off
+    #so rows appended when resuming start on a new line
+    if not os.path.exists(path):
+        return
+    fh = open(path, 'rb+')
+    data = fh.read()
+    if data and not data.endswith('\n'):
+        fh.truncate(data.rfind('\n') + 1)
+    fh.close()
+
+
+def _save_checkpoint(path, state):
+    #write to a temporary file first so a crash never leaves a half written checkpoint
+    tmp = "{0}.{1}.tmp".format(path, os.getpid())
+    fh = open(tmp, 'wb')
+    cPickle.dump(state, fh, 2)
+    fh.close()
+    os.rename(tmp, path)
+
+
+def _load_checkpoint(path):
+    if path is None or not os.path.exists(path):
+        return None
+    try:
+        fh = open(path, 'rb')
+        state = cPickle.load(fh)
+        fh.close()
+    except (IOError, EOFError, cPickle.UnpicklingError):
+        return None
+    return state
+
+
+def _lock_output(path):
+    #create "<path>.lock" holding our host and pid, taking over the lock of a process that
+    #died on this host; a live (or remote) owner means another copy is writing the file
+    lock = path + ".lock"
+    host = socket.gethostname()
+    while True:
+        try:
+            fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+            owner = _lock_owner(lock)
+            if owner is not None and owner[0] == host and not _pid_alive(owner[1]):
+                _unlock_output(lock)
+                continue
+            raise RuntimeError("{0} is being written by another process ({1}). Give concurrent copies of the script "
+                               "their own shard (set_writer_options(shard=(i, n)) or --shard i/n), or delete {2} if that "
+                               "process is gone".format(path, "unknown" if owner is None else "{0}, pid {1}".format(*owner), lock))
+        os.write(fd, "{0}\t{1}\n".format(host, os.getpid()))
+        os.close(fd)
+        return lock
+
+
+def _lock_owner(lock):
+    try:
+        fh = open(lock)
+        fields = fh.read().split()
+        fh.close()
+        return fields[0], int(fields[1])
+    except (IOError, IndexError, ValueError):
+        return None
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except OSError as e:
+        return e.errno == errno.EPERM
+    return True
+
+
+def _unlock_output(lock):
+    try:
+        os.remove(lock)
+    except OSError:
+        pass
+
+
+def shard_path(outname, index):
+    return "{0}.shard_{1}".format(outname, index)
+
+
+def _shard_files(outname):
+    #row files of the shards of outname (not their locks, checkpoints or done markers)
+    directory = os.path.dirname(outname) or "."
+    pattern = re.compile(re.escape(os.path.basename(outname)) + r"\.shard_\d+$")
+    if not os.path.isdir(directory):
+        return []
+    return sorted(os.path.join(directory, f) for f in os.listdir(directory) if pattern.match(f))
+
+
+#seconds between checks whether the other shards of a round are done
+SHARD_POLL = 10
+
+def _wait_for_shards(outname, count):
+    #merge the shards once all count of them are done, or wait for the copy that does.
+    #A shard that stopped (or whose process died on this host) before finishing the
+    #round is never going to, stop waiting for it with an error
+    waiting = False
+    while True:
+        markers = [shard_path(outname, i) + ".done" for i in range(1, count + 1)]
+        if all(os.path.exists(marker) for marker in markers):
+            merge_shards(outname, count)
+        if not any(os.path.exists(marker) for marker in markers):
+            return
+        stopped = _stopped_shards(outname, count)
+        if stopped:
+            raise RuntimeError("Shard {0} of {1} stopped before finishing the round ({2}). Restart the copies with the same "
+                               "shard options (--shard i/{3}), the replicates already in the shard files are not run again".format(
+                               ", ".join(str(i) for i, reason in stopped), outname, "; ".join(reason for i, reason in stopped), count))
+        if not waiting:
+            print "Waiting for the other shards of {0} to finish ({1} of {2} done). A shard that died on another machine " \
+                  "has to be restarted with its --shard i/{2}".format(outname, sum(1 for marker in markers if os.path.exists(marker)), count)
+            waiting = True
+        time.sleep(SHARD_POLL)
+
+
+def _stopped_shards(outname, count):
+    #(index, reason) of the unfinished shards that stopped with an error, or whose lock
+    #belongs to a process of this host that is gone; shards on other hosts can't be checked
+    stopped = []
+    host = socket.gethostname()
+    for i in range(1, count + 1):
+        path = shard_path(outname, i)
+        if os.path.exists(path + ".done"):
+            continue
+        if os.path.exists(path + ".stopped"):
+            stopped.append((i, "it failed or was interrupted"))
+            continue
+        owner = _lock_owner(path + ".lock")
+        if owner is not None and owner[0] == host and not _pid_alive(owner[1]):
+            stopped.append((i, "process {} is gone".format(owner[1])))
+    return stopped
+
+
+def merge_shards(outname, count=None):
+    '''
+    Append the rows of every "<outname>.shard_*" file to outname (writing the header
+    first if outname is new, and skipping replicates outname already has), their failed
+    replicates to the failures file, and remove the shards. Only one process merges at
+    a time; with count, the done markers of shards 1..count are removed as well.
+    Returns the number of rows merged (None if another process is merging).
+    '''
+    merging = outname + ".merging"
+    try:
+        os.mkdir(merging)
+    except OSError as e:
+        if e.errno != errno.EEXIST:
+            raise
+        return None
+    try:
+        shards = _shard_files(outname)
+        n = 0
+        if shards:
+            writer = ResultsWriter(outname, flush_every=1000)
+            try:
+                writer.write_header()
+                done = set(row["replicate"] for row in iter_results(outname, shards=False))
+                for shard in shards:
+                    fh_in = open(shard)
+                    for line in fh_in:
+                        fields = line.split('\t')
+                        if line.endswith('\n') and len(fields) > 3 and fields[2].isdigit() and int(fields[2]) not in done:
+                            writer._write(line)
+                            n += 1
+                    fh_in.close()
+                    _merge_failures(shard + ".failed", writer.failure_path)
+            finally:
+                writer.close()
+            for shard in shards:
+                os.remove(shard)
+        for i in range(1, (count or 0) + 1):
+            if os.path.exists(shard_path(outname, i) + ".done"):
+                os.remove(shard_path(outname, i) + ".done")
+    finally:
+        os.rmdir(merging)
+    return n
+
+
+def _merge_failures(path, failure_path):
+    if not os.path.exists(path):
+        return
+    fh_in = open(path)
+    lines = fh_in.readlines()
+    fh_in.close()
+    new = not os.path.exists(failure_path)
+    fh_fail = open(failure_path, 'a')
+    fh_fail.write("".join(lines if new else lines[1:]))
+    fh_fail.close()
+    os.remove(path)
+
+
+def round_outname(round_num, outfile, model_name):
+    return "Round{0}_{1}_{2}_optimized.txt".format(round_num, outfile, model_name)
+
+
+def read_results(outname):
+    '''
+    Finished rows of a round output file as a list of dicts with the replicate,
+    log-likelihood, theta, AIC and optimized params of each replicate.
+    '''
+    return list(iter_results(outname))
+
+
+def iter_results(outname, shards=True):
+    '''
+    The rows of read_results, one at a time as the file is read, followed by the rows
+    of any shards of the round that have not been merged yet.
+    '''
+    paths = [outname] + (_shard_files(outname) if shards else [])
+    for path in paths:
+        if not os.path.exists(path):
+            continue
+        fh_in = open(path)
+        try:
+            for line in fh_in:
+                fields = line.rstrip('\n').rstrip('\t').split('\t')
+                if not line.endswith('\n') or len(fields) < 6 or not fields[2].isdigit():
+                    continue
+                yield {"replicate": int(fields[2]), "ll": float(fields[3]), "theta": float(fields[4]),
+                       "aic": float(fields[5]), "params": [float(p) for p in fields[6:]]}
+        finally:
+            fh_in.close()
+
+
+def best_replicate(outname):
+    '''
+    Row (see read_results) with the highest log-likelihood in a round output file,
+    or None if the file has no finished rows.
+    '''
+    rows = [row for row in read_results(outname) if not math.isnan(row["ll"])]
+    if not rows:
+        return None
+    return max(rows, key=lambda row: row["ll"])
+
+
+#options used for the ResultsWriter of every round, see set_writer_options
+_writer_options = {"flush_every": 1, "shard": None}
+
+def set_writer_options(flush_every=1, shard=None):
+    '''
+    Set how often round outputs are flushed (every flush_every rows) and, for several
+    concurrent copies of a script, the shard (index, count) this process runs, with
+    index from 1 to count.
+    '''
+    if shard is not None:
+        index, count = int(shard[0]), int(shard[1])
+        if not 1 <= index <= count:
+            raise ValueError("shard must be (index, count) with 1 <= index <= count, got {0!r}".format(shard))
+        shard = (index, count)
+    _writer_options["flush_every"] = flush_every
+    _writer_options["shard"] = shard
 
-        #simulate the model with the optimized parameters
-        sim_model = func_exec(params, fs.sample_sizes, pts)
 
-        #calculate likelihood
-        ll = dadi.Inference.ll_multinom(sim_model, fs)
-        ll = np.around(ll, 2)
-        print "likelihood = ", ll
+#======================================================================================
+#======================================================================================
+#======================================================================================
+#======================================================================================
+#Result store (SQLite database next to the output files)
+
+# set_result_store("results.sqlite") records every row written to the round output files
+# (and every failed replicate) in one database as well, with typed columns:
+# results:  outfile, round, model, label, replicate, ll, theta, aic, k, seed, elapsed,
+#        cache_hits, cache_misses, error (NULL unless the replicate failed), created
+# params:  the optimized (or, for failures, last tried) params of a result by name
+# Several processes (ex. shards of a round) can write to the same database at once: each
+# write takes SQLite's file lock, waiting up to timeout seconds for the others. The database
+# keeps SQLite's default rollback journal, which (unlike WAL mode, that needs memory shared
+# between the processes) also works for copies on several machines sharing the folder, as
+# long as the shared filesystem supports file locks (ex. NFS with lockd).
+
+_RESULTS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    outfile TEXT NOT NULL,
+    round INTEGER NOT NULL,
+    model TEXT NOT NULL,
+    label TEXT,
+    replicate INTEGER NOT NULL,
+    ll REAL,
+    theta REAL,
+    aic REAL,
+    k INTEGER,
+    seed INTEGER,
+    elapsed REAL,
+    cache_hits INTEGER,
+    cache_misses INTEGER,
+    error TEXT,
+    created REAL,
+    UNIQUE (outfile, round, model, replicate)
+);
+CREATE INDEX IF NOT EXISTS results_model ON results (outfile, round, model, aic);
+CREATE TABLE IF NOT EXISTS params (
+    result_id INTEGER NOT NULL REFERENCES results (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    value REAL,
+    PRIMARY KEY (result_id, position)
+);
+"""
+
+class ResultsStore(object):
+    '''
+    SQLite database of round results, see set_result_store.
+    '''
+    def __init__(self, path, timeout=60):
+        self.path = path
+        self.timeout = timeout
+        self._conn = None
+        self._pid = None
+
+    @property
+    def conn(self):
+        #a connection must not be shared with forked processes, each one opens its own
+        if self._conn is None or self._pid != os.getpid():
+            self._conn = sqlite3.connect(self.path, timeout=self.timeout)
+            #the journal mode is stored in the database, switch one created in WAL mode back
+            self._conn.execute("PRAGMA journal_mode=DELETE")
+            self._conn.execute("PRAGMA foreign_keys=ON")
+            self._conn.executescript(_RESULTS_SCHEMA)
+            self._pid = os.getpid()
+        return self._conn
+
+    def insert(self, outfile, round_num, model_name, replicate, ll=None, theta=None, aic=None, params=(),
+               seed=None, elapsed=None, cache_hits=None, cache_misses=None, error=None):
+        '''
+        Record one replicate, replacing an earlier row of the same replicate.
+        '''
+        model = _registry(model_name)
+        values = [outfile, int(round_num), model_name, model.label, int(replicate), _sql_float(ll), _sql_float(theta),
+                  _sql_float(aic), model.k, None if seed is None else int(seed), _sql_float(elapsed),
+                  None if cache_hits is None else int(cache_hits), None if cache_misses is None else int(cache_misses),
+                  None if error is None else str(error), time.time()]
+        with self.conn:
+            #deleting the old row deletes its params as well
+            self.conn.execute("DELETE FROM results WHERE outfile = ? AND round = ? AND model = ? AND replicate = ?", values[:3] + values[4:5])
+            cursor = self.conn.execute("INSERT INTO results (outfile, round, model, label, replicate, ll, theta, aic, k, "
+                                       "seed, elapsed, cache_hits, cache_misses, error, created) "
+                                       "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", values)
+            names = model.param_names or []
+            self.conn.executemany("INSERT INTO params (result_id, position, name, value) VALUES (?, ?, ?, ?)",
+                                  [(cursor.lastrowid, n, names[n] if n < len(names) else "p{}".format(n), _sql_float(value))
+                                   for n, value in enumerate(params)])
+
+    def params(self, result_id):
+        '''
+        {param name: value} of a result, in the order the model takes them.
+        '''
+        rows = self.conn.execute("SELECT name, value FROM params WHERE result_id = ? ORDER BY position", (result_id,))
+        return collections.OrderedDict(rows)
+
+    def best_per_model(self, outfile=None, round_num=None):
+        '''
+        Replicate with the lowest AIC of every (outfile, round, model), as a list of dicts
+        ordered by outfile, round and AIC. outfile and round_num narrow down the search.
+        '''
+        where, args = ["error IS NULL", "aic IS NOT NULL"], []
+        if outfile is not None:
+            where.append("outfile = ?")
+            args.append(outfile)
+        if round_num is not None:
+            where.append("round = ?")
+            args.append(int(round_num))
+        #SQLite takes the other columns from the row with the MIN(aic)
+        query = ("SELECT id, outfile, round, model, replicate, ll, theta, MIN(aic), k FROM results WHERE {} "
+                 "GROUP BY outfile, round, model ORDER BY outfile, round, MIN(aic)").format(" AND ".join(where))
+        keys = ["id", "outfile", "round", "model", "replicate", "ll", "theta", "aic", "k"]
+        best = [dict(zip(keys, row)) for row in self.conn.execute(query, args).fetchall()]
+        for row in best:
+            row["params"] = self.params(row["id"])
+        return best
+
+    def import_file(self, outname, outfile, round_num, model_name):
+        '''
+        Record the rows of an existing round output file. Returns the number of rows.
+        '''
+        rows = read_results(outname)
+        for row in rows:
+            self.insert(outfile, round_num, model_name, row["replicate"], ll=row["ll"], theta=row["theta"], aic=row["aic"], params=row["params"])
+        return len(rows)
+
+    def export_parquet(self, path):
+        '''
+        Write the results, one column per param name, to a Parquet file (needs pandas
+        with pyarrow or fastparquet).
+        '''
+        try:
+            import pandas
+        except ImportError:
+            raise ImportError("export_parquet needs pandas (and pyarrow or fastparquet)")
+        results = pandas.read_sql_query("SELECT * FROM results", self.conn)
+        params = pandas.read_sql_query("SELECT result_id, name, value FROM params", self.conn)
+        params = params.pivot(index="result_id", columns="name", values="value").add_prefix("param_")
+        results.join(params, on="id").to_parquet(path)
+
+    def close(self):
+        if self._conn is not None and self._pid == os.getpid():
+            self._conn.close()
+        self._conn = None
+
+
+def _sql_float(value):
+    #sqlite has no nan, store NULL instead
+    if value is None:
+        return None
+    value = float(value)
+    return None if math.isnan(value) else value
+
+
+_result_store = None
+
+def set_result_store(path=None):
+    '''
+    Record the rows of every round in the SQLite database at path as well (None stops
+    recording). Returns the ResultsStore.
+    '''
+    global _result_store
+    if _result_store is not None:
+        _result_store.close()
+    _result_store = None if path is None else ResultsStore(path)
+    return _result_store
 
-        #calculate theta
-        theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-        theta = np.around(theta, 2)
-        print "Theta = ", theta
 
-        #calculate AIC 
-        aic = ( -2*( float(ll))) + (2*8)
-        print "AIC = ", aic, '\n', '\n'
-        return sim_model
+#======================================================================================
+#======================================================================================
+#======================================================================================
+#======================================================================================
+#Observed spectrum shared with the worker processes
+
+# With workers > 1 the jobs sent to the workers don't carry the spectrum itself: its data
+# and mask are written once to memory-mapped .npy files and the jobs only carry their
+# paths, so every worker maps the same pages read-only instead of unpickling its own copy
+# with every replicate.
+
+class SharedSpectrum(object):
+    '''
+    Picklable handle to a spectrum stored in memory-mapped files under directory.
+    '''
+    def __init__(self, fs, directory):
+        data = np.ascontiguousarray(np.ma.getdata(fs), dtype=float)
+        mask = np.ascontiguousarray(np.ma.getmaskarray(fs))
+        self.key = hashlib.sha1(repr(data.shape) + data.tostring() + mask.tostring()).hexdigest()
+        self.data_path = os.path.join(directory, self.key + "_data.npy")
+        self.mask_path = os.path.join(directory, self.key + "_mask.npy")
+        self.folded = getattr(fs, "folded", False)
+        self.pop_ids = getattr(fs, "pop_ids", None)
+        for path, values in ((self.data_path, data), (self.mask_path, mask)):
+            if not os.path.exists(path):
+                fh_tmp = open(path + ".tmp", 'wb')
+                np.save(fh_tmp, values)
+                fh_tmp.close()
+                os.rename(path + ".tmp", path)
+
+    def load(self):
+        '''
+        The spectrum, backed by the read-only memory-mapped files.
+        '''
+        data = np.load(self.data_path, mmap_mode='r')
+        mask = np.load(self.mask_path, mmap_mode='r')
+        return dadi.Spectrum(data, mask=mask, mask_corners=False, data_folded=self.folded, check_folding=False,
+                             copy=False, pop_ids=self.pop_ids)
+
+
+_shared_dir = None
+_shared_handles = {}
+_shared_spectra = {}
+
+def _share_spectrum(fs):
+    #handle for fs, the files are only written the first time a spectrum is shared
+    global _shared_dir
+    if _shared_dir is None:
+        _shared_dir = tempfile.mkdtemp(prefix="dadi_spectrum_")
+        atexit.register(shutil.rmtree, _shared_dir, True)
+    key = id(fs)
+    if key not in _shared_handles or _shared_handles[key][0] is not fs:
+        _shared_handles[key] = (fs, SharedSpectrum(fs, _shared_dir))
+    return _shared_handles[key][1]
+
+
+def _job_spectrum(fs):
+    #the spectrum of a job, mapped once per process if it was shared
+    if not isinstance(fs, SharedSpectrum):
+        return fs
+    if fs.key not in _shared_spectra:
+        _shared_spectra[fs.key] = fs.load()
+    return _shared_spectra[fs.key]
 
 
-    elif model_name == "founder_sym":
-        #####################################
-        #Founder event and symmetric migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Founder event and symmetric migration",'\n','\n'
+#======================================================================================
+#======================================================================================
+#======================================================================================
+#======================================================================================
+# Optimizer backends
+
+# An optimizer takes (params, fs, func_exec, pts, model, maxiter, job) and returns the
+# optimized params, staying within model.lower_bound/model.upper_bound (job is the
+# replicate's job, see _replicate_jobs). All of them work on the log of the parameters
+# like dadi's own optimize_log functions. Add a function to OPTIMIZERS to make it
+# available to the rounds and to dadi_pipeline.py.
+
+def _log_fmin(params, fs, func_exec, pts, model, maxiter, job):
+    return dadi.Inference.optimize_log_fmin(params, fs, func_exec, pts, lower_bound=model.lower_bound,
+                                            upper_bound=model.upper_bound, verbose=1, maxiter=maxiter)
+
+
+def _log_lbfgsb(params, fs, func_exec, pts, model, maxiter, job):
+    return dadi.Inference.optimize_log_lbfgsb(params, fs, func_exec, pts, lower_bound=model.lower_bound,
+                                              upper_bound=model.upper_bound, verbose=1, maxiter=maxiter)
+
+
+def _log_bfgs(params, fs, func_exec, pts, model, maxiter, job):
+    #BFGS with finite difference gradients, dadi clips the params to the bounds
+    return dadi.Inference.optimize_log(params, fs, func_exec, pts, lower_bound=model.lower_bound,
+                                       upper_bound=model.upper_bound, verbose=1, maxiter=maxiter)
+
+
+def _log_bounds(model):
+    #log of the bounds, a lower bound of 0 is taken as 1/1000 of the upper bound
+    upper = np.array(model.upper_bound, dtype=float)
+    lower = np.array([l if l > 0 else u * 1e-3 for l, u in zip(model.lower_bound, upper)], dtype=float)
+    return np.log(lower), np.log(upper)
+
+
+def _cma(params, fs, func_exec, pts, model, maxiter, job):
+    #CMA-ES from the cma package, on the log params scaled to [0, 10] within the bounds
+    import cma
+    lower, upper = _log_bounds(model)
+    span = upper - lower
+    x0 = np.clip((np.log(params) - lower) / span * 10, 0, 10)
+
+    def neg_ll(x):
+        p = np.exp(lower + np.asarray(x) / 10. * span)
+        sim_model = func_exec(p, fs.sample_sizes, pts)
+        return -dadi.Inference.ll_multinom(sim_model, fs)
+
+    result = cma.fmin(neg_ll, x0, 2.0, options={"bounds": [0, 10], "maxiter": maxiter, "verbose": -1})
+    return np.exp(lower + np.asarray(result[0]) / 10. * span)
+
+
+class ParallelGradient(object):
+    '''
+    -log-likelihood of model_name and its forward difference gradient, both in log
+    parameter space. The k perturbed evaluations of a gradient are spread over a pool of
+    workers processes, and the value at the point itself is reused from the objective
+    (the optimizers always ask for it first), so with k workers a gradient costs about one
+    model evaluation of wall time. Where the model fails just past the point the difference
+    is taken backwards, and where it fails on both sides FloatingPointError is raised (the
+    replicate is then recorded as failed). func_exec (normally a _BestSpectrum) evaluates the
+    objective in this process; fs may be a SharedSpectrum handle.
+    '''
+    def __init__(self, model_name, fs, pts, func_exec, workers, epsilon=1e-3):
+        self.model_name = model_name
+        self.model = get_model(model_name)
+        self.fs = fs
+        self.pts = pts
+        self.func_exec = func_exec
+        self.workers = max(1, int(workers))
+        self.epsilon = epsilon
+        self._values = collections.OrderedDict()
+        if self.workers > 1 and not isinstance(fs, SharedSpectrum):
+            self.fs = _share_spectrum(fs)
+
+    def params(self, x):
+        return np.clip(np.exp(x), self.model.lower_bound, self.model.upper_bound)
+
+    def objective(self, x):
+        key = tuple(x)
+        if key not in self._values:
+            fs = _job_spectrum(self.fs)
+            sim_model = self.func_exec(self.params(x), fs.sample_sizes, self.pts)
+            self._values[key] = -dadi.Inference.ll_multinom(sim_model, fs)
+            #the line search only comes back to the last few points
+            while len(self._values) > 8:
+                self._values.popitem(last=False)
+        return self._values[key]
+
+    def gradient(self, x):
+        x = np.asarray(x, dtype=float)
+        f0 = self.objective(x)
+        if not np.isfinite(f0):
+            raise FloatingPointError("log-likelihood {0} at {1}, no gradient".format(-f0, list(self.params(x))))
+        steps = self.epsilon * np.eye(len(x))
+        grad = (-self._lls([self.params(x + step) for step in steps]) - f0) / self.epsilon
+        #where the model fails (nan) or gives an infinite likelihood just past the point,
+        #take the difference on the other side instead
+        bad = np.flatnonzero(~np.isfinite(grad))
+        if len(bad):
+            grad[bad] = (f0 + self._lls([self.params(x - steps[i]) for i in bad])) / self.epsilon
+        if not np.all(np.isfinite(grad)):
+            names = [self.model.param_names[i] for i in np.flatnonzero(~np.isfinite(grad))]
+            raise FloatingPointError("the model fails on both sides of {0} along {1}, no gradient".format(list(self.params(x)), ", ".join(names)))
+        return grad
+
+    def _lls(self, rows):
+        #log-likelihoods of rows, spread over the workers
+        rows = np.array(rows)
+        jobs = [{"model_name": self.model_name, "params": part, "fs": self.fs, "pts": self.pts}
+                for part in np.array_split(rows, min(self.workers, len(rows)))]
+        if self.workers > 1:
+            #map_async().get() with a timeout so a replicate timeout can interrupt it
+            results = _get_pool(self.workers).map_async(_evaluate_rows, jobs).get(1e9)
+        else:
+            results = [_evaluate_rows(job) for job in jobs]
+        _BestSpectrum.evaluations += len(rows)
+        return np.concatenate([r[0] for r in results])
+
+
+def _log_bfgs_parallel(params, fs, func_exec, pts, model, maxiter, job):
+    #BFGS like log_bfgs, with the gradients computed by the worker pool
+    gradient = ParallelGradient(job["model_name"], job["fs"], pts, func_exec, job.get("gradient_workers", 1))
+    x_opt = scipy.optimize.fmin_bfgs(gradient.objective, np.log(params), fprime=gradient.gradient, gtol=1e-5,
+                                     maxiter=maxiter, disp=False)
+    return gradient.params(x_opt)
+
+
+OPTIMIZERS = collections.OrderedDict([
+    ("log_fmin", _log_fmin),
+    ("log_lbfgsb", _log_lbfgsb),
+    ("log_bfgs", _log_bfgs),
+    ("log_bfgs_parallel", _log_bfgs_parallel),
+    ("cma", _cma),
+])
+
+#optimizers that use the worker pool themselves, their replicates run one at a time
+POOL_OPTIMIZERS = set(["log_bfgs_parallel"])
+
+
+def get_optimizer(name):
+    if name not in OPTIMIZERS:
+        raise ValueError("Unknown optimizer '{0}', choose from: {1}".format(name, ", ".join(OPTIMIZERS)))
+    return OPTIMIZERS[name]
+
+
+def _model_optimizer(optimizer, model_name):
+    #optimizer is one name for all models or a dict {model_name: name}
+    if isinstance(optimizer, dict):
+        optimizer = optimizer.get(model_name, "log_fmin")
+    get_optimizer(optimizer)
+    if optimizer == "cma":
+        try:
+            import cma
+        except ImportError:
+            raise ImportError("The cma optimizer needs the cma package (pip install cma)")
+    return optimizer
 
-        #first call a predefined model
-        model_call = Models_2D.founder_sym
 
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-        print "base parameters = ", params
+#======================================================================================
+#======================================================================================
+#======================================================================================
+#======================================================================================
+#Replicate functions shared by the optimization rounds
+
+# _run_jobs(jobs, writers, workers)
+
+# Runs replicates (perturb -> optimize -> rescore) and writes one row per replicate
+# through the writer of its model. With workers > 1 the replicates are farmed out to a
+# process pool, but rows are still written by the calling process only and always
+# in replicate order, so the output files look the same as a serial run.
+
+class ReplicateTimeout(Exception):
+    pass
+
+
+def _raise_timeout(signum, frame):
+    raise ReplicateTimeout("replicate exceeded its time limit")
+
+
+def _optimize_replicate(job):
+    '''
+    Run a single replicate and return a dict with its replicate number, optimized
+    params, ll, theta, elapsed seconds, the model cache hits/misses it caused and
+    the number of model evaluations the optimizer asked for.
+    A replicate that raises or runs past job["timeout"] seconds returns an "error"
+    (with the params it was trying) instead of stopping the round. Kept at module
+    level so it can be sent to worker processes.
+    '''
+    start = time.time()
+    hits, misses, evaluations = _model_cache.hits, _model_cache.misses, _BestSpectrum.evaluations
+    tried = {"params": job["params"]}
+
+    #forked workers share the parent's random state, reseed so perturbations differ; a
+    #replicate run in the parent (log_bfgs_parallel) gives the caller its random state back
+    random_state = np.random.get_state() if job["seed"] is not None else None
+    #the alarm interrupts the optimization from within this process, worker or not
+    if job["timeout"]:
+        previous = signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.alarm(int(math.ceil(job["timeout"])))
+    try:
+        if random_state is not None:
+            np.random.seed(job["seed"])
+        result = _optimize(job, tried)
+    except Exception as e:
+        print '\n', "Replicate {0} failed after {1:.1f}s: {2}: {3}".format(job["replicate"], time.time() - start, type(e).__name__, e)
+        result = {"replicate": job["replicate"], "params": tried["params"], "error": "{0}: {1}".format(type(e).__name__, e)}
+    finally:
+        if job["timeout"]:
+            signal.alarm(0)
+            signal.signal(signal.SIGALRM, previous)
+        if random_state is not None:
+            np.random.set_state(random_state)
+    result["elapsed"] = time.time() - start
+    result["cache_hits"] = _model_cache.hits - hits
+    result["cache_misses"] = _model_cache.misses - misses
+    result["evaluations"] = _BestSpectrum.evaluations - evaluations
+    return result
+
+
+#with coarse_pts, share of maxiter the optimization on pts gets after the coarse one: it
+#starts next to the optimum and only has to correct for the difference between the grids
+FINE_FRACTION = 0.25
+
+def _fine_maxiter(maxiter):
+    return max(int(math.ceil(maxiter * FINE_FRACTION)), 1)
+
+
+def _optimize_coarse(job, params, tried):
+    model_name, fs, coarse_pts = job["model_name"], _job_spectrum(job["fs"]), job["coarse_pts"]
+    model = get_model(model_name)
+    func_exec = _BestSpectrum(_model_cache.wrap(model_name, get_func_exec(model_name, coarse_pts)), fs)
+    print "coarse optimization on grid", coarse_pts
+    try:
+        params_opt = get_optimizer(job["optimizer"])(params, fs, func_exec, coarse_pts, model, job["maxiter"], job)
+    finally:
+        if func_exec.params is not None:
+            tried["params"] = func_exec.params
+    print "coarse optimized parameters = ", params_opt, "(ll = {}), continuing on grid".format(np.around(func_exec.ll, 2)), job["pts"], \
+        "with maxiter", _fine_maxiter(job["maxiter"])
+    return params_opt
+
+
+def _optimize(job, tried):
+    #tried["params"] is kept up to date so a failure can report where it happened
+    i, model_name, params, fs, pts, y = job["replicate"], job["model_name"], job["params"], _job_spectrum(job["fs"]), job["pts"], job["maxiter"]
+    model = get_model(model_name)
+    print '\n', "{0} replicate {1}:".format(model_name, i)
+
+    #get the (cached) extrapolating function, put the model cache in front of it and
+    #remember (and checkpoint) the best spectrum
+    func_exec = _BestSpectrum(_model_cache.wrap(model_name, get_func_exec(model_name, pts)), fs, checkpoint=job["checkpoint"])
+
+    state = _load_checkpoint(job["checkpoint"]) if job["resume"] else None
+    if state is not None:
+        #an earlier run was interrupted during this replicate, carry on from its best params
+        params_perturbed = state["params"]
+        print "resuming from checkpoint, best parameters so far = ", params_perturbed, "(ll = {})".format(state["ll"])
+    elif job.get("start") is not None:
+        #this replicate's point of the Latin hypercube
+        params_perturbed = job["start"]
+        print "Latin hypercube start = ", params_perturbed
+        tried["params"] = params_perturbed
+    else:
+        #perturb initial guesses
+        params_perturbed = dadi.Misc.perturb_params(params, fold=job["fold"], upper_bound=model.upper_bound, lower_bound=model.lower_bound)
+        tried["params"] = params_perturbed
+    if job.get("coarse_pts"):
+        #get close to the optimum on the cheap grid first, then finish on pts with a smaller
+        #budget (a checkpoint is only saved on pts, so a resumed replicate is past the coarse stage)
+        if state is None:
+            params_perturbed = _optimize_coarse(job, params_perturbed, tried)
+        y = _fine_maxiter(y)
+    tried["params"] = params_perturbed
+
+    #run optimization 
+    try:
+        params_opt = get_optimizer(job["optimizer"])(params_perturbed, fs, func_exec, pts, model, y, job)
+    except BaseException:
+        #timed out, failed or interrupted: keep the latest best params to resume from
+        func_exec.save_checkpoint()
+        raise
+    finally:
+        if func_exec.params is not None:
+            tried["params"] = func_exec.params
+    print '\n',"optimized parameters = ", params_opt
+    tried["params"] = params_opt
+
+    #likelihood and theta of the optimized parameters, the optimum was already
+    #simulated during the optimization so this is normally a lookup
+    sim_model, ll, theta = func_exec.score(params_opt, pts)
+    ll = np.around(ll, 2)
+    theta = np.around(theta, 2)
+    return {"replicate": i, "params": params_opt, "ll": ll, "theta": theta}
+
+
+def _replicate_jobs(writer, model_name, params, fold, fs, pts, y, reps, workers, resume, timeout, coarse_pts=None, lhs=False, optimizer="log_fmin",
+                    warm=None):
+    #variable to control number of loops per model (1 to x)
+    x = int(reps) + int(1)
 
-        #simulate the model with the optimized parameters
+    #skip replicates that already have a row from an earlier (interrupted) run
+    done = writer.completed_replicates() if resume else set()
+    todo = [i for i in range(1,x) if i not in done]
+    if done:
+        print "Resuming {0}: {1} of {2} replicates already done, running the {3} left (resume=False or --no-resume reruns them all)".format(
+            writer.outname, x - 1 - len(todo), reps, len(todo))
+    #a shard only runs its own share of the replicates
+    if writer.shard is not None:
+        todo = [i for i in todo if writer.owns(i)]
+        print "Shard {0} of {1}: running {2} of the replicates left".format(writer.shard[0], writer.shard[1], len(todo))
+
+    #one seed per replicate, drawn up front so each worker perturbs differently
+    if int(workers) > 1:
+        seeds = list(np.random.randint(0, 2**31 - 1, size=int(reps)))
+    else:
+        seeds = [None] * int(reps)
+    if int(workers) > 1:
+        fs = _share_spectrum(fs)
+
+    #with warm starts the replicates take turns perturbing each of them and params
+    starts = list(warm or []) + [params]
+    #with Latin hypercube starts, the replicates whose turn it is to start from params each
+    #get a point of a design over just them, so no point is left unused. Replicate i always
+    #gets the same point (seeded by the output name), so a resumed round carries on with
+    #the same design, and the shards of a round, which run different replicates, take
+    #different points of one design
+    points = {}
+    if lhs:
+        own = [i for i in range(1, x) if (i - 1) % len(starts) == len(starts) - 1]
+        design = latin_hypercube(model_name, len(own), seed=int(hashlib.sha1(writer.outname).hexdigest()[:8], 16))
+        points = dict(zip(own, design))
+        print "Starting {0} of the {1} replicates from a Latin hypercube over the parameter bounds".format(len(own), reps)
+    return [{"replicate": i, "model_name": model_name, "params": starts[(i-1) % len(starts)], "fold": fold, "fs": fs, "pts": pts,
+             "maxiter": y, "seed": seeds[i-1], "checkpoint": writer.checkpoint_path(i), "resume": resume,
+             "timeout": timeout, "coarse_pts": coarse_pts, "start": points.get(i), "optimizer": optimizer,
+             "gradient_workers": int(workers) if optimizer in POOL_OPTIMIZERS else None} for i in todo]
+
+
+def latin_hypercube(model_name, n, seed=None):
+    '''
+    n starting params for model_name spread over its bounds by Latin hypercube sampling
+    in log space (every parameter's range is cut in n slices and each slice is used once).
+    A lower bound of 0 is taken as 1/1000 of the upper bound.
+    '''
+    lower, upper = _log_bounds(get_model(model_name))
+    random = np.random.RandomState(seed)
+    k = len(upper)
+    slices = np.array([random.permutation(int(n)) for j in range(k)]).T.reshape(int(n), k)
+    u = (slices + random.uniform(size=(int(n), k))) / float(n)
+    return np.exp(lower + u * (upper - lower))
+
+
+#one pool is kept for the whole process so workers (and the extrapolation functions
+#and model cache they build up) are reused by every round and model
+_pool = None
+_pool_workers = 0
+
+def _get_pool(workers):
+    global _pool, _pool_workers
+    if _pool is not None and _pool_workers != workers:
+        close_pool()
+    if _pool is None:
+        _pool = multiprocessing.Pool(processes=workers)
+        _pool_workers = workers
+    return _pool
+
+
+def close_pool(terminate=False):
+    '''
+    Shut down the worker processes kept between rounds (they are started again
+    when needed). Called at exit, call it yourself to free the cores earlier.
+    '''
+    global _pool, _pool_workers
+    if _pool is not None:
+        if terminate:
+            _pool.terminate()
+        else:
+            _pool.close()
+        _pool.join()
+    _pool, _pool_workers = None, 0
+
+atexit.register(close_pool)
+
+
+#tolerances used to decide that replicates found the same optimum, see set_convergence
+_convergence = {"ll_tol": 0.1, "param_tol": 0.05}
+
+def set_convergence(ll_tol=0.1, param_tol=0.05):
+    '''
+    Set when two replicates count as the same optimum for converge=K: log-likelihoods
+    at most ll_tol apart and every param within a relative difference of param_tol.
+    '''
+    _convergence["ll_tol"] = ll_tol
+    _convergence["param_tol"] = param_tol
+
+
+class _Convergence(object):
+    '''
+    Finished replicates of one model, converged once k of them (the best one
+    included) agree with the best one.
+    '''
+    def __init__(self, k, rows=()):
+        self.k = k
+        self.lls = []
+        self.params = []
+        for row in rows:
+            self.add(row["ll"], row["params"])
+
+    def add(self, ll, params):
+        if not math.isnan(float(ll)):
+            self.lls.append(float(ll))
+            self.params.append(np.asarray(params, dtype=float))
+
+    def agreeing(self):
+        if not self.lls:
+            return 0
+        best = int(np.argmax(self.lls))
+        return sum(1 for ll, params in zip(self.lls, self.params) if _same_optimum(ll, params, self.lls[best], self.params[best]))
+
+    def distinct(self):
+        '''
+        Number of different optima the replicates found (best first, each replicate is
+        counted with the first better optimum it agrees with).
+        '''
+        optima = []
+        for n in np.argsort(self.lls)[::-1]:
+            if not any(_same_optimum(self.lls[n], self.params[n], ll, params) for ll, params in optima):
+                optima.append((self.lls[n], self.params[n]))
+        return len(optima)
+
+    @property
+    def converged(self):
+        return self.k is not None and self.agreeing() >= self.k
+
+
+def _same_optimum(ll, params, best_ll, best_params):
+    #params are written with 4 decimals, so don't ask for more than that near 0
+    return (abs(ll - best_ll) <= _convergence["ll_tol"] and params.shape == best_params.shape
+            and np.allclose(params, best_params, rtol=_convergence["param_tol"], atol=1e-3))
+
+
+def _iter_results(jobs, workers, skip):
+    #yields (job, result) in job order; skip(job) is asked just before a job is started,
+    #so jobs of a model that converged in the meantime are never run
+    pending = collections.deque(jobs)
+
+    def take():
+        while pending:
+            job = pending.popleft()
+            if not skip(job):
+                return job
+        return None
+
+    if workers <= 1:
+        job = take()
+        while job is not None:
+            yield job, _optimize_replicate(job)
+            job = take()
+        return
+
+    #keep a couple of jobs per worker queued so the pool stays busy, but no more
+    window = collections.deque()
+    while True:
+        while len(window) < 2 * workers:
+            job = take()
+            if job is None:
+                break
+            if job.get("gradient_workers"):
+                #this replicate spreads its gradients over the pool, run it here once
+                #the replicates ahead of it are done
+                while window:
+                    yield _next_result(window, workers)
+                yield job, _optimize_replicate(job)
+                continue
+            window.append((job, _get_pool(workers).apply_async(_optimize_replicate, (job,))))
+        if not window:
+            return
+        yield _next_result(window, workers)
+
+
+#seconds to wait for a replicate past its timeout before giving up on its worker
+RESULT_MARGIN = 60
+
+def _next_result(window, workers):
+    #(job, result) of the first job in window. A worker that was killed (ex. out of memory)
+    #never returns its replicate, so with a timeout stop waiting RESULT_MARGIN seconds after
+    #it, record the replicate as failed and rerun the rest of the window on a fresh pool
+    job, result = window.popleft()
+    if not job["timeout"]:
+        return job, result.get()
+    start = time.time()
+    try:
+        return job, result.get(job["timeout"] + RESULT_MARGIN)
+    except multiprocessing.TimeoutError:
+        error = "no result {0:g}s after the timeout, the worker was killed or is stuck".format(RESULT_MARGIN)
+        print '\n', "Replicate {0} failed: {1}".format(job["replicate"], error)
+        state = _load_checkpoint(job["checkpoint"]) if job["resume"] else None
+        close_pool(terminate=True)
+        rerun = [queued for queued, lost in window]
+        window.clear()
+        window.extend((queued, _get_pool(workers).apply_async(_optimize_replicate, (queued,))) for queued in rerun)
+        return job, {"replicate": job["replicate"], "params": job["params"] if state is None else state["params"],
+                     "error": "ReplicateTimeout: " + error, "elapsed": time.time() - start,
+                     "cache_hits": 0, "cache_misses": 0, "evaluations": 0}
+
+
+def _run_jobs(jobs, writers, workers, trackers=None):
+    workers = int(workers)
+    trackers = trackers or {}
+    if not jobs:
+        return
+
+    if workers > 1:
+        print "Running {0} replicates on {1} worker processes".format(len(jobs), workers)
+
+    #ran, failed, cache hits, cache misses, replicates not run and model evaluations per model
+    stats = collections.OrderedDict((job["model_name"], [0, 0, 0, 0, 0, 0]) for job in jobs)
+
+    def skip(job):
+        tracker = trackers.get(job["model_name"])
+        if tracker is not None and tracker.converged:
+            stats[job["model_name"]][4] += 1
+            return True
+        return False
+
+    try:
+        #results come back in job order, so rows are written in replicate order
+        for job, result in _iter_results(jobs, workers, skip):
+            model_name = job["model_name"]
+            model, writer, counts = get_model(model_name), writers[model_name], stats[model_name]
+            i, params_opt = result["replicate"], result["params"]
+            counts[0] += 1
+            counts[2] += result["cache_hits"]
+            counts[3] += result["cache_misses"]
+            counts[5] += result["evaluations"]
+            if "error" in result:
+                #keep going with the other replicates, the failure gets its own row
+                counts[1] += 1
+                writer.write_failure(model, i, result["error"], result["elapsed"], params_opt, seed=job["seed"])
+                continue
+            ll, theta = result["ll"], result["theta"]
+            print "{0} replicate {1} ({2:.1f}s):".format(model_name, i, result["elapsed"]), "likelihood = ", ll
+            print "Theta = ", theta
+
+            #calculate AIC 
+            aic = ( -2*( float(ll))) + (2*model.k)
+            print "AIC = ", aic, '\n', '\n'
+            writer.write_row(model, i, ll, theta, aic, params_opt, seed=job["seed"], elapsed=result["elapsed"],
+                             cache_hits=result["cache_hits"], cache_misses=result["cache_misses"])
+            if model_name in trackers:
+                trackers[model_name].add(ll, params_opt)
+
+            #the row is written, the replicate no longer needs its checkpoint
+            if os.path.exists(writer.checkpoint_path(i)):
+                os.remove(writer.checkpoint_path(i))
+    except BaseException:
+        #don't leave workers running replicates nobody will write
+        if workers > 1:
+            close_pool(terminate=True)
+        raise
+
+    optimizers = dict((job["model_name"], job["optimizer"]) for job in jobs)
+    for model_name, (ran, failed, hits, misses, saved, evaluations) in stats.items():
+        if ran:
+            print "{0}: {1} optimizer, {2:.0f} model evaluations per replicate".format(model_name, optimizers[model_name], evaluations / float(ran))
+        if saved:
+            print "{0}: {1} replicates agree on the optimum, stopped early and saved {2} of {3} replicates".format(model_name, trackers[model_name].agreeing(), saved, ran + saved)
+        if model_name in trackers and trackers[model_name].lls:
+            #replicates that ended in an optimum found before added nothing new
+            tracker = trackers[model_name]
+            print "{0}: {1} distinct optima among {2} replicates, {3} agree with the best".format(model_name, tracker.distinct(), len(tracker.lls), tracker.agreeing())
+        if failed:
+            print "{0}: {1} of {2} replicates failed, see {3}".format(model_name, failed, ran, writers[model_name].failure_path)
+        if _model_cache.enabled and hits + misses:
+            print "{0}: model cache {1} hits, {2} misses ({3:.1f}% of model evaluations reused, tol {4:g})".format(
+                model_name, hits, misses, 100.0 * hits / (hits + misses), _model_cache.tol)
+    print ''
+
+
+def _score_fixed(writer, model_name, params, fs, pts, reps, resume):
+    #nothing to optimize, every replicate would give the same result: score the
+    #model once and write that as replicate 1, the only row of the round
+    model = get_model(model_name)
+    if params is None or not model.param_names:
+        params = model.start
+    if not writer.owns(1):
+        #another shard scores it
+        return
+    if resume and 1 in writer.completed_replicates():
+        print "Resuming {0}: the model is already scored (resume=False or --no-resume scores it again)".format(writer.outname)
+        return
+    print "No free parameters, scoring the model once instead of {} replicates".format(reps)
+    func_exec = _model_cache.wrap(model_name, get_func_exec(model_name, pts))
+
+    #simulate the model, a failure is recorded (once) instead of stopping the script
+    start = time.time()
+    try:
         sim_model = func_exec(params, fs.sample_sizes, pts)
+    except Exception as e:
+        print "Model failed: {0}: {1}".format(type(e).__name__, e)
+        writer.write_failure(model, 1, "{0}: {1}".format(type(e).__name__, e), time.time() - start, params)
+        return
 
-        #calculate likelihood
-        ll = dadi.Inference.ll_multinom(sim_model, fs)
-        ll = np.around(ll, 2)
-        print "likelihood = ", ll
-
-        #calculate theta
-        theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-        theta = np.around(theta, 2)
-        print "Theta = ", theta
-
-        #calculate AIC 
-        aic = ( -2*( float(ll))) + (2*6)
-        print "AIC = ", aic, '\n', '\n'
-        return sim_model
-
-        
-    elif model_name == "founder_asym":
-        #####################################
-        #Founder event and asymmetric migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Founder event and asymmetric migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.founder_asym
+    #calculate likelihood
+    ll = dadi.Inference.ll_multinom(sim_model, fs)
+    ll = np.around(ll, 2)
+    print "likelihood = ", ll
 
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-        print "base parameters = ", params
+    #calculate theta
+    theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
+    theta = np.around(theta, 2)
+    print "Theta = ", theta
 
-        #simulate the model with the optimized parameters
-        sim_model = func_exec(params, fs.sample_sizes, pts)
-
-        #calculate likelihood
-        ll = dadi.Inference.ll_multinom(sim_model, fs)
-        ll = np.around(ll, 2)
-        print "likelihood = ", ll
+    #calculate AIC 
+    aic = ( -2*( float(ll))) + (2*model.k)
+    print "AIC = ", aic, '\n', '\n'
 
-        #calculate theta
-        theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-        theta = np.around(theta, 2)
-        print "Theta = ", theta
-
-        #calculate AIC 
-        aic = ( -2*( float(ll))) + (2*7)
-        print "AIC = ", aic, '\n', '\n'
-        return sim_model
+    writer.write_row(model, 1, ll, theta, aic, params, elapsed=time.time() - start)
 
 
-    elif model_name == "founder_nomig":
-        #####################################
-        #Founder event and no migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Founder event and no migration",'\n','\n'
+#======================================================================================
+#======================================================================================
+#======================================================================================
+#======================================================================================
+#Optimize several models in one round
 
-        #first call a predefined model
-        model_call = Models_2D.founder_nomig
+# Optimize_Models(round_num, pts, fs, outfile, reps, maxiter, models, workers=1, resume=True, timeout=None, fold=None,
+#                 converge=None, coarse_pts=None, lhs=False, optimizer="log_fmin", warm_start=None)
 
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-        print "base parameters = ", params
+# Argument definitions:
+# round_num:  1, 2 or 3, used for output naming -> "Round{0}_{1}_{2}_optimized.txt".format(round_num,outfile,model_name)
+# pts, fs, outfile, reps, maxiter, workers, resume, timeout:  as for Optimize_Round1 below
+# models:  list of (model_name, params) pairs, params is the list of values to perturb
+#        or None to start from the basic starting params in MODELS
+# fold:  how much to perturb the starting params, by default 3, 2 and 1 for rounds 1, 2 and 3
+# converge, coarse_pts, lhs, optimizer, warm_start:  as for Optimize_Round1 below
+
+# The replicates of all the models go into the same queue, so with workers > 1 the
+# pool stays busy until the last replicate of the last model instead of running down
+# at the end of every model.
+
+ROUND_FOLDS = {1: 3, 2: 2, 3: 1}
+
+def Optimize_Models(round_num, pts, fs, outfile, reps, y, models, workers=1, resume=True, timeout=None, fold=None, converge=None, coarse_pts=None,
+                    lhs=False, optimizer="log_fmin", warm_start=None):
+    #catch a params list passed to Optimize_Round1, whose 7th argument is workers
+    if isinstance(workers, bool) or not isinstance(workers, numbers.Integral):
+        raise TypeError("workers must be an integer, got {0!r} (round 1 starts from the basic params of the "
+                        "model, use Optimize_Round2 to start from given params)".format(workers))
+    if fold is None:
+        fold = ROUND_FOLDS[int(round_num)]
+    #check the optimizers (and that they can be imported) before any file is opened
+    optimizers = dict((model_name, _model_optimizer(optimizer, model_name)) for model_name, params in models)
+
+    writers = {}
+    trackers = {}
+    jobs = []
+    try:
+        for model_name, params in models:
+            model = get_model(model_name)
+            print '\n',"============================================================================"
+            print "Beginning analysis of {}".format(model_name)
+            print "============================================================================"
+
+            #create output file, held open for the whole round
+            outname = round_outname(round_num, outfile, model_name)
+            writer = writers[model_name] = ResultsWriter(outname, store=_result_store, outfile=outfile, round_num=round_num,
+                                                         model_name=model_name, **_writer_options)
+            writer.write_header()
+
+            print "---------------------------------------------------"
+            print model.label,'\n','\n'
+            print _param_set(model)
+
+            if is_fixed(model):
+                _score_fixed(writer, model_name, params, fs, pts, reps, resume)
+                print "---------------------------------------------------", '\n'
+                continue
+            if params is None:
+                params = model.start
+            if len(params) != len(model.param_names):
+                raise ValueError("{0} takes {1} parameters, got {2}".format(model_name, len(model.param_names), len(params)))
+            print "starting parameters = ", params
+            print "optimizer = ", optimizers[model_name]
+            #the cheap rounds of a race start from the fits of other pairs like the pair itself
+            run_name = outfile[:-len(RACE_SUFFIX)] if outfile.endswith(RACE_SUFFIX) else outfile
+            warm = Warm_Starts(run_name, model_name, warm_start) if warm_start is not None else []
+            for start in warm:
+                print "warm start = ", start
+            model_jobs = _replicate_jobs(writer, model_name, params, fold, fs, pts, y, reps, workers, resume, timeout, coarse_pts, lhs,
+                                         optimizers[model_name], warm)
+            #replicates finished by an earlier (interrupted) run count towards convergence
+            rows = read_results(writer.outname) if resume else []
+            trackers[model_name] = _Convergence(int(converge) if converge else None, rows)
+            if trackers[model_name].converged and model_jobs:
+                print "{0} replicates already agree on the optimum, skipping the other {1}".format(trackers[model_name].agreeing(), len(model_jobs))
+                model_jobs = []
+            jobs.extend(model_jobs)
+            print "---------------------------------------------------", '\n'
+
+        #run the replicates (in parallel when workers > 1), rows are written in replicate order
+        _run_jobs(jobs, writers, workers, trackers)
+    except BaseException:
+        #with shards, tell the other copies this one won't finish the round
+        for writer in writers.values():
+            writer.stop()
+        raise
+    finally:
+        for writer in writers.values():
+            writer.close()
+    #the round ran to completion, with shards this waits for (or does) the merge
+    for model_name, params in models:
+        writers[model_name].finish()
 
-        #simulate the model with the optimized parameters
-        sim_model = func_exec(params, fs.sample_sizes, pts)
 
-        #calculate likelihood
-        ll = dadi.Inference.ll_multinom(sim_model, fs)
-        ll = np.around(ll, 2)
-        print "likelihood = ", ll
+#======================================================================================
+#======================================================================================
+#======================================================================================
+#======================================================================================
+#Run several rounds back to back, each round starting from the best replicate of the last
 
-        #calculate theta
-        theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-        theta = np.around(theta, 2)
-        print "Theta = ", theta
+# Optimize_Pipeline(pts, fs, outfile, reps, maxiter, models, rounds=[1,2,3], workers=1, resume=True, timeout=None, converge=None,
+#                   coarse_pts=None, lhs=False, optimizer="log_fmin", warm_start=None)
 
-        #calculate AIC 
-        aic = ( -2*( float(ll))) + (2*5)
-        print "AIC = ", aic, '\n', '\n'
-        return sim_model
+# Argument definitions:
+# pts, fs, outfile, workers, resume, timeout, converge, coarse_pts, optimizer:  as for Optimize_Round1 below
+# lhs, warm_start:  start round 1 from a Latin hypercube or from the fits of other pairs
+#        (see Optimize_Round1), later rounds always perturb the best params of the round before
+# reps, maxiter:  one integer for all rounds, or a list with one integer per round
+# models:  list of (model_name, params) pairs, params is what the first round starts from
+#        (None for the basic starting params in round 1, or to take the best replicate
+#        of an earlier run of the previous round from its output file)
+# rounds:  rounds to run, in order
+
+# Returns {model_name: best row} of the last round (see read_results). A model whose
+# previous round has no finished replicate is left out of the following rounds.
+
+def Optimize_Pipeline(pts, fs, outfile, reps, y, models, rounds=(1, 2, 3), workers=1, resume=True, timeout=None, converge=None, coarse_pts=None,
+                      lhs=False, optimizer="log_fmin", warm_start=None):
+    rounds = list(rounds)
+    reps, y = _per_round(reps, rounds), _per_round(y, rounds)
+
+    starts = collections.OrderedDict(models)
+    for n, round_num in enumerate(rounds):
+        round_models = _chain_models(round_num, outfile, starts)
+        _round_banner(round_num, len(round_models), reps[n], y[n])
+        Optimize_Models(round_num, pts, fs, outfile, reps[n], y[n], round_models, workers=workers, resume=resume, timeout=timeout, converge=converge, coarse_pts=coarse_pts,
+                        lhs=lhs and round_num == 1, optimizer=optimizer, warm_start=warm_start if round_num == 1 else None)
+
+        #the next round starts from the best replicates of this one
+        starts = collections.OrderedDict((model_name, None) for model_name, params in round_models)
+
+    return _best_rows(rounds[-1], outfile, starts)
+
+
+def _per_round(values, rounds):
+    if not isinstance(values, (list, tuple)):
+        return [values] * len(rounds)
+    return list(values)
+
+
+def _chain_models(round_num, outfile, starts):
+    #(model_name, params) for a round, params None are taken from the previous round
+    #(whose output files have the prefix outfile)
+    round_models = []
+    for model_name, params in starts.items():
+        if params is None and round_num > 1 and not is_fixed(get_model(model_name)):
+            #no params given (or a later round), carry on from the best replicate so far
+            best = best_replicate(round_outname(round_num - 1, outfile, model_name))
+            if best is None:
+                print "Skipping {0} in round {1}: no finished replicates in {2}".format(model_name, round_num, round_outname(round_num - 1, outfile, model_name))
+                continue
+            print "{0}: round {1} starts from replicate {2} of round {3} (likelihood = {4})".format(model_name, round_num, best["replicate"], round_num - 1, best["ll"])
+            params = best["params"]
+        round_models.append((model_name, params))
+    return round_models
+
+
+def _round_banner(round_num, n_models, reps, y, pts=None):
+    print '\n', "#####################################################################################"
+    print "Round {0}: {1} models, {2} replicates, maxiter {3}".format(round_num, n_models, reps, y) + ("" if pts is None else ", grid {}".format(pts))
+    print "#####################################################################################"
+
+
+def _best_rows(round_num, outfile, model_names):
+    best = collections.OrderedDict()
+    for model_name in model_names:
+        best[model_name] = best_replicate(round_outname(round_num, outfile, model_name))
+    return best
 
 
-        
-    ###########################################################################
-    #ISLAND Discrete admixture models
-    ###########################################################################
+#======================================================================================
+#======================================================================================
+#======================================================================================
+#======================================================================================
+#Race the models against each other, dropping the ones that fall behind after every round
 
-    
-    elif model_name == "vic_no_mig_admix_early":
-        #####################################
-        #Vicariance with early discrete admixture
-        #####################################
-        print "---------------------------------------------------"
-        print "Vicariance with early discrete admixture",'\n','\n'
+# Optimize_Race(pts, fs, outfile, reps, maxiter, models, rounds=[1,2,3], eta=2, aic_margin=10,
+#               cheap_pts=None, workers=1, resume=True, timeout=None, converge=None, coarse_pts=None, lhs=False,
+#               optimizer="log_fmin", warm_start=None)
 
-        #first call a predefined model
-        model_call = Models_2D.vic_no_mig_admix_early
+# Argument definitions:
+# pts, fs, outfile, reps, maxiter, models, rounds, workers, resume, timeout, converge, coarse_pts, lhs, optimizer,
+# warm_start:  as for Optimize_Pipeline above
+# eta:  after every round only the best 1/eta of the models (by AIC) go on to the next
+# aic_margin:  models whose best AIC is more than this behind the leader are dropped as well
+# cheap_pts:  grid for every round but the last, which uses pts (default: about 60% of pts,
+#        but at least a bit larger than the largest sample size)
+
+# Runs the rounds like Optimize_Pipeline, but the early rounds are a cheap screen of every
+# model, and the replicates saved on dropped models go to the ones left: a model that
+# survives n pruning steps gets up to eta**n times reps, keeping each round's total
+# near reps times the number of models. Returns {model_name: best row} of the last round
+# for the models that made it there.
+# The cheap rounds write to their own files, "Round{0}_{1}_race_{2}_optimized.txt".format(round_num,outfile,model_name),
+# so their cheap grid likelihoods never mix with (or resume) runs on pts; only the last round
+# writes the usual output files. Before pruning, the best params of every model are scored
+# again on pts, and the models are ranked by that AIC.
+
+RACE_SUFFIX = "_race"
+
+def Optimize_Race(pts, fs, outfile, reps, y, models, rounds=(1, 2, 3), eta=2, aic_margin=10, cheap_pts=None,
+                  workers=1, resume=True, timeout=None, converge=None, coarse_pts=None, lhs=False, optimizer="log_fmin",
+                  warm_start=None):
+    rounds = list(rounds)
+    reps, y = _per_round(reps, rounds), _per_round(y, rounds)
+    if cheap_pts is None:
+        cheap_pts = _cheap_grid(pts, fs)
+
+    starts = collections.OrderedDict(models)
+    for n, round_num in enumerate(rounds):
+        last = n == len(rounds) - 1
+        round_pts = pts if last else cheap_pts
+        #the cheap rounds are kept apart from the output files of runs on pts
+        round_outfile = outfile if last else outfile + RACE_SUFFIX
+        round_models = _chain_models(round_num, outfile + RACE_SUFFIX if n > 0 else outfile, starts)
+        if not round_models:
+            break
+        #share this round's budget among the models left, at most eta times more per pruning step
+        round_reps = min(reps[n] * len(models) // len(round_models), reps[n] * int(eta) ** n)
+        _round_banner(round_num, len(round_models), round_reps, y[n], round_pts)
+        Optimize_Models(round_num, round_pts, fs, round_outfile, round_reps, y[n], round_models, workers=workers, resume=resume, timeout=timeout,
+                        converge=converge, coarse_pts=coarse_pts, lhs=lhs and round_num == 1, optimizer=optimizer,
+                        warm_start=warm_start if round_num == 1 else None)
+
+        model_names = [model_name for model_name, params in round_models]
+        if last:
+            return _best_rows(round_num, outfile, model_names)
+        starts = collections.OrderedDict((model_name, None) for model_name in _prune(round_num, round_outfile, model_names, eta, aic_margin, fs, pts))
+    return collections.OrderedDict()
+
+
+def _cheap_grid(pts, fs):
+    #dadi needs the grid to be larger than the sample sizes, keep it a few points above
+    largest = max(fs.sample_sizes)
+    return [max(int(p * 0.6), largest + 2 + 2 * i) for i, p in enumerate(pts)]
+
+
+def _prune(round_num, outfile, model_names, eta, aic_margin, fs, pts):
+    #models going on to the next round, best AIC first. Likelihoods on the cheap grid are
+    #biased by a different amount for every model, so the best params are scored on pts
+    best = _best_rows(round_num, outfile, model_names)
+    aics = {}
+    for model_name, row in best.items():
+        if row is not None:
+            aics[model_name] = _score_aic(model_name, row["params"], fs, pts)
+    ranked = sorted((aic, model_name) for model_name, aic in aics.items() if aic is not None)
+    keep = int(math.ceil(len(model_names) / float(eta)))
+    survivors = [model_name for aic, model_name in ranked[:keep] if aic - ranked[0][0] <= aic_margin]
+
+    print '\n', "Round {0} race standings (best params scored on grid {1}):".format(round_num, pts)
+    for model_name, row in best.items():
+        if row is None:
+            print "{0:<28} no finished replicates, dropped".format(model_name)
+        elif aics[model_name] is None:
+            print "{0:<28} failed on grid {1}, dropped".format(model_name, pts)
+    for aic, model_name in ranked:
+        print "{0:<28} AIC = {1:<12} delta AIC = {2:<10.2f} (cheap grid AIC = {3}) {4}".format(
+            model_name, aic, aic - ranked[0][0], best[model_name]["aic"], "kept" if model_name in survivors else "dropped")
+    print ''
+    return survivors
+
+
+def _score_aic(model_name, params, fs, pts):
+    #AIC of params on grid pts, None if the model fails there
+    model = get_model(model_name)
+    func_exec = _model_cache.wrap(model_name, get_func_exec(model_name, pts))
+    try:
+        sim_model = func_exec(params, fs.sample_sizes, pts)
+    except Exception as e:
+        print "{0} failed on grid {1}: {2}: {3}".format(model_name, pts, type(e).__name__, e)
+        return None
+    ll = np.around(dadi.Inference.ll_multinom(sim_model, fs), 2)
+    return ( -2*( float(ll))) + (2*model.k)
 
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-        print "base parameters = ", params
 
-        #simulate the model with the optimized parameters
-        sim_model = func_exec(params, fs.sample_sizes, pts)
+#======================================================================================
+#======================================================================================
+#======================================================================================
+#======================================================================================
+#Optimizations Round 1 function (run models with basic starting params)
 
-        #calculate likelihood
-        ll = dadi.Inference.ll_multinom(sim_model, fs)
-        ll = np.around(ll, 2)
-        print "likelihood = ", ll
+# Optimize_Round1(pts, fs, outfile, reps, maxiter, model_name, workers=1, resume=True, timeout=None, converge=None,
+#                 coarse_pts=None, lhs=False, optimizer="log_fmin", warm_start=None)
 
-        #calculate theta
-        theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-        theta = np.around(theta, 2)
-        print "Theta = ", theta
+# Argument definitions:
+# pts:  grid choice (list of three numbers, ex. [20,30,40]
+# fs:  spectrum object name
+# outfile:  prefix for output naming -> "Round1_{0}_{1}_optimized.txt".format(outfile,model_name)
+# reps:  integer to control number of replicates, ex. 10 (the maximum with converge; a model
+#        without free parameters, like no_divergence, is scored once and has a single row)
+# maxiter:  max number of iterations per optimization step (not intuitive! see dadi user group)
+# model_name:  any model in MODELS, ex. "no_divergence", "no_mig", "sym_mig", "asym_mig",
+#        "anc_sym_mig", "sec_contact_asym_mig", "split_nomig", "split_asymmig_all"
+# workers:  number of processes to run replicates in parallel (default 1 runs them serially)
+# resume:  if the output file already has rows (ex. the script crashed), only run the missing
+#        replicates, continuing interrupted ones from their last checkpoint (saved every
+#        CHECKPOINT_INTERVAL seconds); how many replicates were already done is printed, so
+#        rerunning a finished script does nothing but say so (default True)
+# timeout:  max seconds per replicate (default None, no limit); replicates that time out or
+#        raise are written to "Round1_{0}_{1}_failed.txt" and the round carries on
+#        (a replicate whose worker process dies is given up RESULT_MARGIN seconds after the timeout)
+# converge:  stop the model early once this many replicates agree with the best one (ll within
+#        0.1 and params within 5%, see set_convergence), reps is then the maximum (default None
+#        always runs all reps)
+# coarse_pts:  grid to optimize on first, ex. [20,24,28], or [20] for a single grid without
+#        extrapolation; each replicate runs up to maxiter iterations there and then continues
+#        from that optimum on pts with FINE_FRACTION (a quarter) of maxiter, so most model
+#        evaluations are cheap (default None optimizes on pts only, with maxiter)
+# lhs:  instead of perturbing the basic starting params (which clusters the starts around
+#        the same point), start the replicates from a Latin hypercube over the parameter bounds
+#        in log space, so they cover the space evenly (default False)
+# warm_start:  folder or list of folders with the round output files of other pairs (ex.
+#        "." or ["../2D", "."] for the triplet), the replicates then take turns starting
+#        around the best optimum of the same model for every other pair (and, for the 3D
+#        split models, around a start built from the 2D fits of the pairs), and around the
+#        basic starting params, see Warm_Starts; with lhs, the turns of the basic starting
+#        params go to the points of a Latin hypercube instead (default None)
+# optimizer:  "log_fmin" (dadi's Nelder-Mead, the default), "log_lbfgsb", "log_bfgs",
+#        "log_bfgs_parallel" or "cma" (needs the cma package), see OPTIMIZERS; or a dict
+#        {model_name: optimizer} to pick one per model (models not in it use "log_fmin").
+#        "log_bfgs_parallel" runs its replicates one at a time and spreads the k evaluations
+#        of every gradient over the workers instead, for models with many parameters
+
+def Optimize_Round1(pts, fs, outfile, reps, y, model_name, workers=1, resume=True, timeout=None, converge=None, coarse_pts=None, lhs=False,
+                    optimizer="log_fmin", warm_start=None):
+    Optimize_Models(1, pts, fs, outfile, reps, y, [(model_name, None)], workers=workers, resume=resume, timeout=timeout,
+                    converge=converge, coarse_pts=coarse_pts, lhs=lhs, optimizer=optimizer, warm_start=warm_start)
 
-        #calculate AIC 
-        aic = ( -2*( float(ll))) + (2*6)
-        print "AIC = ", aic, '\n', '\n'
-        return sim_model
 
-    
-    elif model_name == "vic_no_mig_admix_late":
-        #####################################
-        #Divergence with late discrete admixture
-        #####################################
-        print "---------------------------------------------------"
-        print "Vicariance with late discrete admixture",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.vic_no_mig_admix_late
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-        print "base parameters = ", params
-            
-        #simulate the model with the optimized parameters
-        sim_model = func_exec(params, fs.sample_sizes, pts)
+#======================================================================================
+#======================================================================================
+#======================================================================================
+#======================================================================================
+#Optimizations Round 2 function (run models with user input parameters, presumably from best runs)
 
-        #calculate likelihood
-        ll = dadi.Inference.ll_multinom(sim_model, fs)
-        ll = np.around(ll, 2)
-        print "likelihood = ", ll
+# Optimize_Round2(pts, fs, outfile, reps, maxiter, model_name, params, workers=1, resume=True, timeout=None, converge=None,
+#                 coarse_pts=None, optimizer="log_fmin")
 
-        #calculate theta
-        theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-        theta = np.around(theta, 2)
-        print "Theta = ", theta
+# Argument definitions:
+# pts:  grid choice (list of three numbers, ex. [20,30,40]
+# fs:  spectrum object name
+# outfile:  prefix for output naming -> "Round2_{0}_{1}_optimized.txt".format(outfile,model_name)
+# reps:  integer to control number of replicates, ex. 10 (the maximum with converge; a model
+#        without free parameters, like no_divergence, is scored once and has a single row)
+# maxiter:  max number of iterations per optimization step (not intuitive! see dadi user group)
+# model_name:  any model in MODELS, ex. "no_divergence", "no_mig", "sym_mig", "asym_mig",
+#        "anc_sym_mig", "sec_contact_asym_mig", "split_nomig", "split_asymmig_all"
+# params:  list of best parameter values to perturb to start the optimizations from
+# workers:  number of processes to run replicates in parallel (default 1 runs them serially)
+# resume:  if the output file already has rows (ex. the script crashed), only run the missing
+#        replicates, continuing interrupted ones from their last checkpoint (saved every
+#        CHECKPOINT_INTERVAL seconds); how many replicates were already done is printed, so
+#        rerunning a finished script does nothing but say so (default True)
+# timeout:  max seconds per replicate (default None, no limit); replicates that time out or
+#        raise are written to "Round2_{0}_{1}_failed.txt" and the round carries on
+#        (a replicate whose worker process dies is given up RESULT_MARGIN seconds after the timeout)
+# converge:  stop the model early once this many replicates agree with the best one (ll within
+#        0.1 and params within 5%, see set_convergence), reps is then the maximum (default None
+#        always runs all reps)
+# coarse_pts:  grid to optimize on first, ex. [20,24,28], or [20] for a single grid without
+#        extrapolation; each replicate runs up to maxiter iterations there and then continues
+#        from that optimum on pts with FINE_FRACTION (a quarter) of maxiter, so most model
+#        evaluations are cheap (default None optimizes on pts only, with maxiter)
+# optimizer:  "log_fmin" (dadi's Nelder-Mead, the default), "log_lbfgsb", "log_bfgs",
+#        "log_bfgs_parallel" or "cma" (needs the cma package), see OPTIMIZERS; or a dict
+#        {model_name: optimizer} to pick one per model (models not in it use "log_fmin").
+#        "log_bfgs_parallel" runs its replicates one at a time and spreads the k evaluations
+#        of every gradient over the workers instead, for models with many parameters
+
+def Optimize_Round2(pts, fs, outfile, reps, y, model_name, params, workers=1, resume=True, timeout=None, converge=None, coarse_pts=None,
+                    optimizer="log_fmin"):
+    Optimize_Models(2, pts, fs, outfile, reps, y, [(model_name, params)], workers=workers, resume=resume, timeout=timeout,
+                    converge=converge, coarse_pts=coarse_pts, optimizer=optimizer)
 
-        #calculate AIC 
-        aic = ( -2*( float(ll))) + (2*6)
-        print "AIC = ", aic, '\n', '\n'
-        return sim_model
 
+#======================================================================================
+#======================================================================================
+#======================================================================================
+#======================================================================================
+#Optimizations Round 3 function (run models with user input parameters, presumably from best runs)
 
-    elif model_name == "vic_two_epoch_admix":
-        #####################################
-        #Vicariance with discrete admixture, two epoch
-        #####################################
-        print "---------------------------------------------------"
-        print "Vicariance with discrete admixture, two epoch",'\n','\n'
+# Optimize_Round3(pts, fs, outfile, reps, maxiter, model_name, params, workers=1, resume=True, timeout=None, converge=None,
+#                 coarse_pts=None, optimizer="log_fmin")
 
-        #first call a predefined model
-        model_call = Models_2D.vic_two_epoch_admix
+# Argument definitions:
+# pts:  grid choice (list of three numbers, ex. [20,30,40]
+# fs:  spectrum object name
+# outfile:  prefix for output naming -> "Round3_{0}_{1}_optimized.txt".format(outfile,model_name)
+# reps:  integer to control number of replicates, ex. 10 (the maximum with converge; a model
+#        without free parameters, like no_divergence, is scored once and has a single row)
+# maxiter:  max number of iterations per optimization step (not intuitive! see dadi user group)
+# model_name:  any model in MODELS, ex. "no_divergence", "no_mig", "sym_mig", "asym_mig",
+#        "anc_sym_mig", "sec_contact_asym_mig", "split_nomig", "split_asymmig_all"
+# params:  list of best parameter values to perturb to start the optimizations from
+# workers:  number of processes to run replicates in parallel (default 1 runs them serially)
+# resume:  if the output file already has rows (ex. the script crashed), only run the missing
+#        replicates, continuing interrupted ones from their last checkpoint (saved every
+#        CHECKPOINT_INTERVAL seconds); how many replicates were already done is printed, so
+#        rerunning a finished script does nothing but say so (default True)
+# timeout:  max seconds per replicate (default None, no limit); replicates that time out or
+#        raise are written to "Round3_{0}_{1}_failed.txt" and the round carries on
+#        (a replicate whose worker process dies is given up RESULT_MARGIN seconds after the timeout)
+# converge:  stop the model early once this many replicates agree with the best one (ll within
+#        0.1 and params within 5%, see set_convergence), reps is then the maximum (default None
+#        always runs all reps)
+# coarse_pts:  grid to optimize on first, ex. [20,24,28], or [20] for a single grid without
+#        extrapolation; each replicate runs up to maxiter iterations there and then continues
+#        from that optimum on pts with FINE_FRACTION (a quarter) of maxiter, so most model
+#        evaluations are cheap (default None optimizes on pts only, with maxiter)
+# optimizer:  "log_fmin" (dadi's Nelder-Mead, the default), "log_lbfgsb", "log_bfgs",
+#        "log_bfgs_parallel" or "cma" (needs the cma package), see OPTIMIZERS; or a dict
+#        {model_name: optimizer} to pick one per model (models not in it use "log_fmin").
+#        "log_bfgs_parallel" runs its replicates one at a time and spreads the k evaluations
+#        of every gradient over the workers instead, for models with many parameters
+
+def Optimize_Round3(pts, fs, outfile, reps, y, model_name, params, workers=1, resume=True, timeout=None, converge=None, coarse_pts=None,
+                    optimizer="log_fmin"):
+    Optimize_Models(3, pts, fs, outfile, reps, y, [(model_name, params)], workers=workers, resume=resume, timeout=timeout,
+                    converge=converge, coarse_pts=coarse_pts, optimizer=optimizer)
 
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-        print "base parameters = ", params
 
-        #simulate the model with the optimized parameters
-        sim_model = func_exec(params, fs.sample_sizes, pts)
+#======================================================================================
+#======================================================================================
+#======================================================================================
+#======================================================================================        
+#Run models for plotting function (only runs once per model with exact input params)
 
-        #calculate likelihood
-        ll = dadi.Inference.ll_multinom(sim_model, fs)
-        ll = np.around(ll, 2)
-        print "likelihood = ", ll
+# Function usage:
+# returned_model_name = Optimize_Single(pts, fs, model_name, params)
 
-        #calculate theta
-        theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-        theta = np.around(theta, 2)
-        print "Theta = ", theta
+# Argument definitions:
+# pts:  grid choice (list of three numbers, ex. [20,30,40]
+# fs:  spectrum object name
+# model_name:  any model in MODELS, ex. "no_divergence", "no_mig", "sym_mig", "asym_mig",
+#        "anc_sym_mig", "sec_contact_asym_mig", "split_nomig", "split_asymmig_all"
+# params:  list of best parameter values to optimize with
 
-        #calculate AIC 
-        aic = ( -2*( float(ll))) + (2*7)
-        print "AIC = ", aic, '\n', '\n'
-        return sim_model
+def Optimize_Single(pts, fs, model_name, params):
+    model = get_model(model_name)
+    print "---------------------------------------------------"
+    print model.label,'\n'
 
+    if not model.param_names:
+        params = []
+    print _param_set(model)
+    print "base parameters = ", params
 
-    elif model_name == "founder_nomig_admix_early":
-        #####################################
-        #Founder event and discrete early admixture
-        #####################################
-        print "---------------------------------------------------"
-        print "Founder event and discrete early admixture",'\n','\n'
+    #get the (cached) extrapolating function
+    func_exec = get_func_exec(model_name, pts)
 
-        #first call a predefined model
-        model_call = Models_2D.founder_nomig_admix_early
+    #simulate the model with the optimized parameters
+    sim_model = func_exec(params, fs.sample_sizes, pts)
 
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-        print "base parameters = ", params
+    #calculate likelihood
+    ll = dadi.Inference.ll_multinom(sim_model, fs)
+    ll = np.around(ll, 2)
+    print "likelihood = ", ll
 
-        #simulate the model with the optimized parameters
-        sim_model = func_exec(params, fs.sample_sizes, pts)
+    #calculate theta
+    theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
+    theta = np.around(theta, 2)
+    print "Theta = ", theta
 
-        #calculate likelihood
-        ll = dadi.Inference.ll_multinom(sim_model, fs)
-        ll = np.around(ll, 2)
-        print "likelihood = ", ll
+    #calculate AIC 
+    aic = ( -2*( float(ll))) + (2*model.k)
+    print "AIC = ", aic, '\n', '\n'
+    return sim_model
 
-        #calculate theta
-        theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-        theta = np.around(theta, 2)
-        print "Theta = ", theta
 
-        #calculate AIC 
-        aic = ( -2*( float(ll))) + (2*6)
-        print "AIC = ", aic, '\n', '\n'
-        return sim_model
-    
-    elif model_name == "founder_nomig_admix_late":
-        #####################################
-        #Founder event and discrete late admixture
-        #####################################
-        print "---------------------------------------------------"
-        print "Founder event and discrete late admixture",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_2D.founder_nomig_admix_late
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-        print "base parameters = ", params
-
-        #simulate the model with the optimized parameters
-        sim_model = func_exec(params, fs.sample_sizes, pts)
+#======================================================================================
+#======================================================================================
+#======================================================================================
+#======================================================================================
+#Evaluate many parameter sets of one model at once
 
-        #calculate likelihood
-        ll = dadi.Inference.ll_multinom(sim_model, fs)
-        ll = np.around(ll, 2)
-        print "likelihood = ", ll
+# Function usage:
+# lls, thetas = Evaluate_Batch(pts, fs, model_name, params, workers=1)
 
-        #calculate theta
-        theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-        theta = np.around(theta, 2)
-        print "Theta = ", theta
+# Argument definitions:
+# pts:  grid choice (list of three numbers, ex. [20,30,40]
+# fs:  spectrum object name
+# model_name:  any model in MODELS
+# params:  (N, k) array (or list of N lists) of parameter values, one row per evaluation, or
+#        a single list of k values (ex. [] for "no_divergence") for one evaluation
+# workers:  number of processes to split the rows over (default 1)
+
+# Returns two arrays of length N with the log-likelihood and theta of every row (nan for
+# rows where the model failed). The extrapolating function, grids and model cache are set
+# up once per process and shared by all rows, and rows that were already simulated (or
+# repeat) are served from the model cache, so scans and population-based searches pay
+# far less per point than calling Optimize_Single in a loop.
+
+def Evaluate_Batch(pts, fs, model_name, params, workers=1):
+    model = get_model(model_name)
+    params = np.asarray(params, dtype=float)
+    if params.ndim == 1:
+        #a single parameter set ([] for a model without parameters)
+        params = params.reshape(1, -1)
+    if params.ndim != 2 or params.shape[1] != len(model.param_names):
+        raise ValueError("{0} takes {1} parameters, params has shape {2}".format(model_name, len(model.param_names), params.shape))
+    if len(params) == 0:
+        return np.zeros(0), np.zeros(0)
+    if not model.param_names:
+        #every row is the same model, score it once
+        ll, theta = _evaluate_rows({"model_name": model_name, "params": params[:1], "fs": fs, "pts": pts})
+        return np.repeat(ll, len(params)), np.repeat(theta, len(params))
+
+    #fewer rows than workers only makes fewer jobs, the pool is kept at its size
+    workers = max(1, int(workers))
+    n_jobs = min(workers, len(params))
+    if n_jobs > 1:
+        fs = _share_spectrum(fs)
+    jobs = [{"model_name": model_name, "params": rows, "fs": fs, "pts": pts} for rows in np.array_split(params, n_jobs)]
+    if n_jobs > 1:
+        results = _get_pool(workers).map(_evaluate_rows, jobs)
+    else:
+        results = [_evaluate_rows(job) for job in jobs]
+    return np.concatenate([r[0] for r in results]), np.concatenate([r[1] for r in results])
+
+
+def _evaluate_rows(job):
+    #kept at module level so it can be sent to worker processes
+    model_name, fs, pts = job["model_name"], _job_spectrum(job["fs"]), job["pts"]
+    func_exec = _model_cache.wrap(model_name, get_func_exec(model_name, pts))
+    lls = np.empty(len(job["params"]))
+    thetas = np.empty(len(job["params"]))
+    for n, params in enumerate(job["params"]):
+        try:
+            sim_model = func_exec(params if len(params) else [], fs.sample_sizes, pts)
+            lls[n] = dadi.Inference.ll_multinom(sim_model, fs)
+            thetas[n] = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
+        except Exception as e:
+            print "{0} failed for params {1}: {2}: {3}".format(model_name, list(params), type(e).__name__, e)
+            lls[n], thetas[n] = np.nan, np.nan
+    return lls, thetas
 
-        #calculate AIC 
-        aic = ( -2*( float(ll))) + (2*6)
-        print "AIC = ", aic, '\n', '\n'
-        return sim_model
 
-    elif model_name == "founder_nomig_admix_two_epoch":
-        #####################################
-        #Founder event and discrete admixture, two epoch
-        #####################################
-        print "---------------------------------------------------"
-        print "Founder event and discrete admixture, two epoch",'\n','\n'
+#======================================================================================
+#======================================================================================
+#======================================================================================
+#======================================================================================
+#Grid diagnostics (how large does pts have to be for a model and spectrum)
 
-        #first call a predefined model
-        model_call = Models_2D.founder_nomig_admix_two_epoch
+# Function usage:
+# pts = Grid_Diagnostics(fs, model_name, params, grids=None, tol=0.1)
 
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-        print "base parameters = ", params
+# Argument definitions:
+# fs:  spectrum object name
+# model_name:  any model in MODELS
+# params:  parameter values to simulate, ideally the best ones found so far
+# grids:  list of grid choices to compare, smallest first (default: sets of three grids
+#        starting just above the largest sample size, see DIAGNOSTIC_GRIDS)
+# tol:  largest log-likelihood difference to the largest grid choice that is acceptable
+
+# Simulates the model once on every grid choice and prints the extrapolated log-likelihood,
+# its difference to the largest grid choice, the extrapolation correction (difference to the
+# log-likelihood on the largest single grid of the set) and the time it took. Returns the
+# smallest grid choice within tol of the largest one.
+
+#default grid choices by number of populations: (number of sets, points between grids).
+#A 3D simulation costs about pts**3, so the triplets compare fewer sets that are closer
+#together (up to the largest sample size + 27 instead of + 62)
+DIAGNOSTIC_GRIDS = {2: (5, 10), 3: (4, 5)}
+
+def Grid_Diagnostics(fs, model_name, params, grids=None, tol=0.1):
+    model = get_model(model_name)
+    if not model.param_names:
+        params = []
+    if grids is None:
+        largest = max(fs.sample_sizes)
+        sets, step = DIAGNOSTIC_GRIDS.get(len(fs.sample_sizes), DIAGNOSTIC_GRIDS[3])
+        grids = [[b, b + step, b + 2 * step] for b in range(largest + 2, largest + 2 + sets * step, step)]
+    grids = [list(g) for g in grids]
+
+    print "---------------------------------------------------"
+    print model.label, '\n'
+    print _param_set(model)
+    print "parameters = ", params, '\n'
+
+    rows = []
+    for pts in grids:
+        start = time.time()
+        try:
+            ll = dadi.Inference.ll_multinom(get_func_exec(model_name, pts)(params, fs.sample_sizes, pts), fs)
+            elapsed = time.time() - start
+            ll_single = dadi.Inference.ll_multinom(get_func_exec(model_name, pts[-1:])(params, fs.sample_sizes, pts[-1:]), fs)
+        except Exception as e:
+            print "grid {0} failed: {1}: {2}".format(pts, type(e).__name__, e)
+            continue
+        rows.append((pts, ll, ll_single, elapsed))
+    if not rows:
+        raise ValueError("the model failed on every grid choice")
+
+    reference = rows[-1][1]
+    print "{0:<20}{1:>16}{2:>14}{3:>18}{4:>10}".format("grid", "log-likelihood", "difference", "extrapolation", "seconds")
+    for pts, ll, ll_single, elapsed in rows:
+        print "{0:<20}{1:>16.4f}{2:>14.4f}{3:>18.4f}{4:>10.2f}".format(str(pts), ll, ll - reference, ll - ll_single, elapsed)
+    print ''
+
+    #the smallest grid choice from which on every larger one is within tol as well
+    recommended = None
+    for pts, ll, ll_single, elapsed in reversed(rows):
+        if math.isnan(ll) or abs(ll - reference) > tol:
+            break
+        recommended = pts
+    if recommended is None or recommended == rows[-1][0]:
+        print "No grid choice is within {0} of the largest one {1}, try larger grids".format(tol, rows[-1][0]), '\n'
+        return rows[-1][0]
+    print "Smallest grid choice within {0} log-likelihood units of {1}: {2}".format(tol, rows[-1][0], recommended), '\n'
+    return recommended
 
-        #simulate the model with the optimized parameters
-        sim_model = func_exec(params, fs.sample_sizes, pts)
 
-        #calculate likelihood
-        ll = dadi.Inference.ll_multinom(sim_model, fs)
-        ll = np.around(ll, 2)
-        print "likelihood = ", ll
+#======================================================================================
+#======================================================================================
+#======================================================================================
+#======================================================================================
+#Summarize round outputs: best replicate, delta AIC and Akaike weight of every model
 
-        #calculate theta
-        theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-        theta = np.around(theta, 2)
-        print "Theta = ", theta
+# Function usage:
+# tables = Summarize_Rounds(directory=".", round_num=None, outfile=None, ll_tol=0.1, write=True)
 
-        #calculate AIC 
-        aic = ( -2*( float(ll))) + (2*7)
-        print "AIC = ", aic, '\n', '\n'
-        return sim_model
+# Argument definitions:
+# directory:  folder with the "Round{N}_{outfile}_{model}_optimized.txt" files
+# round_num:  only summarize this round (default: every round found)
+# outfile:  only summarize this population set, ex. "C-O" (default: every one found)
+# ll_tol:  replicates within this many log-likelihood units of the best one count as
+#        having found the same optimum (the "near_best" column)
+# write:  also write each table to "Summary_Round{N}_{outfile}.txt"
+
+# Makes one table per population set and round, models ordered by AIC, with the number of
+# finished replicates, how many of them are near the best one, the best replicate's
+# log-likelihood, AIC, delta AIC and Akaike weight, and its params. Files are read line by
+# line and only the best row and the log-likelihoods are kept, so thousands of outputs are
+# summarized quickly. Returns {(outfile, round_num): list of rows}.
+
+SUMMARY_HEADER = "Model"+'\t'+"label"+'\t'+"replicates"+'\t'+"near_best"+'\t'+"best_replicate"+'\t'+"log-likelihood"+'\t'+"AIC"+'\t'+"delta_AIC"+'\t'+"Akaike_weight"+'\t'+"optimized_params"+'\n'
+
+def _round_files(directory):
+    #(round_num, outfile, model_name, path) of every round output file in directory, a round
+    #only written to shards so far is given by the path of its main file (see iter_results)
+    #longest names first, so "Round1_C-O_sec_contact_asym_mig" is not read as model "asym_mig"
+    names = "|".join(re.escape(m) for m in sorted(MODELS, key=len, reverse=True))
+    pattern = re.compile(r"^(Round(\d+)_(.+?)_({})_optimized\.txt)(\.shard_\d+)?$".format(names))
+    seen = set()
+    for filename in sorted(os.listdir(directory)):
+        match = pattern.match(filename)
+        if match is not None and match.group(1) not in seen:
+            seen.add(match.group(1))
+            yield int(match.group(2)), match.group(3), match.group(4), os.path.join(directory, match.group(1))
+
+
+def Summarize_Rounds(directory=".", round_num=None, outfile=None, ll_tol=0.1, write=True):
+    tables = collections.defaultdict(list)
+    for file_round, file_outfile, model_name, path in _round_files(directory):
+        if (round_num is not None and file_round != int(round_num)) or (outfile is not None and file_outfile != outfile):
+            continue
+        best, lls = None, []
+        for row in iter_results(path):
+            if math.isnan(row["ll"]):
+                continue
+            lls.append(row["ll"])
+            if best is None or row["ll"] > best["ll"]:
+                best = row
+        if best is None:
+            continue
+        best["model"] = model_name
+        best["replicates"] = len(lls)
+        best["near_best"] = sum(1 for ll in lls if ll >= best["ll"] - ll_tol)
+        tables[(file_outfile, file_round)].append(best)
+
+    for key in sorted(tables):
+        rows = sorted(tables[key], key=lambda row: row["aic"])
+        min_aic = rows[0]["aic"]
+        weights = [math.exp(-0.5 * (row["aic"] - min_aic)) for row in rows]
+        for row, weight in zip(rows, weights):
+            row["delta_aic"] = row["aic"] - min_aic
+            row["weight"] = weight / sum(weights)
+        tables[key] = rows
+        _print_summary(key, rows)
+        if write:
+            fh_out = open(os.path.join(directory, "Summary_Round{0}_{1}.txt".format(key[1], key[0])), 'w')
+            fh_out.write(SUMMARY_HEADER)
+            for row in rows:
+                fields = [row["model"], _registry(row["model"]).label, row["replicates"], row["near_best"], row["replicate"],
+                          row["ll"], row["aic"], np.around(row["delta_aic"], 2), np.around(row["weight"], 4)]
+                fields.extend(row["params"])
+                fh_out.write("".join("{}\t".format(f) for f in fields) + '\n')
+            fh_out.close()
+    return dict(tables)
+
+
+def _print_summary(key, rows):
+    print '\n', "============================================================================"
+    print "{0}, round {1}: {2} models".format(key[0], key[1], len(rows))
+    print "============================================================================"
+    print "{0:<28}{1:>12}{2:>11}{3:>16}{4:>12}{5:>11}{6:>9}".format("model", "replicates", "near best", "log-likelihood", "AIC", "delta AIC", "weight")
+    for row in rows:
+        print "{0:<28}{1:>12}{2:>11}{3:>16}{4:>12}{5:>11.2f}{6:>9.4f}".format(row["model"], row["replicates"], row["near_best"], row["ll"], row["aic"], row["delta_aic"], row["weight"])
+    print ''
 
 
 #======================================================================================
 #======================================================================================
 #======================================================================================
 #======================================================================================
+#Warm starts from the fits of related population pairs
+
+# Function usage:
+# starts = Warm_Starts(outfile, model_name, directories=".")
+
+# Argument definitions:
+# outfile:  prefix of the run to start, the population names separated by "-" (ex. "C-O" or "C-D-O")
+# model_name:  any model in MODELS
+# directories:  folder or list of folders with the round output files of other runs (ex. ["../2D", "."])
+
+# Returns a list of starting params for model_name: the best optimum of the same model
+# for every other pair (or triplet) found, from its latest round, and for the models in
+# TRIPLET_STARTS one start put together from the best 2D fits of the three pairs within
+# the triplet (ex. C-D, C-O and D-O for C-D-O, a pair may also be named the other way
+# round). Every start is clipped to the bounds of the model. Optimize_Round1 takes the
+# folders as warm_start and cycles its replicates over these starts and its own params.
+
+#quantities the params of the 3D models are started from, see _triplet_values
+TRIPLET_STARTS = {
+    "split_nomig": ["nu1", "nuA", "nu2", "nu3", "T1", "T2"],
+    "split_symmig_all": ["nu1", "nuA", "nu2", "nu3", "m_1A", "m_12", "m_23", "m_13", "T1", "T2"],
+    "split_asymmig_all": ["nu1", "nuA", "nu2", "nu3", "m1A", "mA1", "m12", "m21", "m13", "m31", "m_23", "T1", "T2"],
+    "split_symmig_adjacent": ["nu1", "nuA", "nu2", "nu3", "m_1A", "m_12", "m_23", "T1", "T2"],
+    "starsplit": ["nu1", "nu2", "nu3", "m12", "m21", "m13", "m31", "m_23", "T"],
+}
+
+def Warm_Starts(outfile, model_name, directories="."):
+    model = get_model(model_name)
+    if isinstance(directories, basestring):
+        directories = [directories]
+    fits = _best_fits(directories)
+
+    starts = []
+    for other in sorted(fits):
+        row = fits[other].get(model_name)
+        if other != outfile and row is not None and len(row["params"]) == len(model.param_names):
+            starts.append(row["params"])
+
+    pops = outfile.split("-")
+    if model_name in TRIPLET_STARTS and len(pops) == 3:
+        pairs = [_pair_values(fits, pops[a], pops[b]) for a, b in ((0, 1), (0, 2), (1, 2))]
+        if any(pairs):
+            values = _triplet_values(*pairs)
+            starts.append([values.get(name, start) for name, start in zip(TRIPLET_STARTS[model_name], model.start)])
+
+    lower = [l if l > 0 else u * 1e-3 for l, u in zip(model.lower_bound, model.upper_bound)]
+    return [list(np.clip(np.array(params, dtype=float), lower, model.upper_bound)) for params in starts]
+
+
+def _best_fits(directories):
+    #{outfile: {model_name: best row of its latest round}} of all round output files
+    #(but not the cheap grid rounds of Optimize_Race)
+    fits = collections.defaultdict(dict)
+    rounds = {}
+    for directory in directories:
+        for file_round, outfile, model_name, path in _round_files(directory):
+            if outfile.endswith(RACE_SUFFIX) or rounds.get((outfile, model_name), 0) > file_round:
+                continue
+            row = best_replicate(path)
+            if row is not None:
+                rounds[(outfile, model_name)] = file_round
+                fits[outfile][model_name] = row
+    return fits
+
+
+def _pair_values(fits, pop1, pop2):
+    #nu1, nu2, m12, m21 and T of the best (by AIC) 2D divergence fit of a pair, or None
+    #the fits of pair "D-C" are read as those of "C-D" with the populations swapped
+    for outfile, swap in (("{0}-{1}".format(pop1, pop2), False), ("{0}-{1}".format(pop2, pop1), True)):
+        rows = []
+        for model_name, row in fits.get(outfile, {}).items():
+            names = _registry(model_name).param_names
+            if "T" in names and set(names) <= set(["nu1", "nu2", "m", "m12", "m21", "T"]) and len(row["params"]) == len(names):
+                rows.append((row["aic"], names, row["params"]))
+        if rows:
+            aic, names, params = min(rows)
+            values = dict(zip(names, params))
+            #no migration parameter means no migration, clipped to the lower bound later
+            m = values.get("m", 0)
+            values = {"nu1": values["nu1"], "nu2": values["nu2"], "m12": values.get("m12", m), "m21": values.get("m21", m), "T": values["T"]}
+            if swap:
+                values = {"nu1": values["nu2"], "nu2": values["nu1"], "m12": values["m21"], "m21": values["m12"], "T": values["T"]}
+            return values
+    return None
+
+
+def _mean(values):
+    values = [v for v in values if v is not None]
+    return float(np.mean(values)) if values else None
+
+
+def _triplet_values(p12, p13, p23):
+    #quantities of TRIPLET_STARTS from the pair fits of populations 1-2, 1-3 and 2-3 (any
+    #may be None): mij is migration into i from j as in dadi, m_ij the mean of both
+    #directions and A the ancestor of 2 and 3, which is taken to behave like 2 and 3
+    get = lambda pair, name: pair[name] if pair is not None else None
+    v = {}
+    v["nu1"] = _mean([get(p12, "nu1"), get(p13, "nu1")])
+    v["nu2"] = _mean([get(p12, "nu2"), get(p23, "nu1")])
+    v["nu3"] = _mean([get(p13, "nu2"), get(p23, "nu2")])
+    v["nuA"] = _mean([v["nu2"], v["nu3"]])
+    for i, j, pair in (("1", "2", p12), ("1", "3", p13), ("2", "3", p23)):
+        v["m" + i + j] = get(pair, "m12")
+        v["m" + j + i] = get(pair, "m21")
+        v["m_" + i + j] = _mean([v["m" + i + j], v["m" + j + i]])
+    v["m1A"] = _mean([v["m12"], v["m13"]])
+    v["mA1"] = _mean([v["m21"], v["m31"]])
+    v["m_1A"] = _mean([v["m_12"], v["m_13"]])
+    #the 2-3 split is the younger one, 1 split from their ancestor T1 before it
+    v["T"] = _mean([get(p12, "T"), get(p13, "T"), get(p23, "T")])
+    v["T2"] = get(p23, "T")
+    older = _mean([get(p12, "T"), get(p13, "T")])
+    if older is not None and v["T2"] is not None:
+        v["T1"] = max(older - v["T2"], 0.1 * older)
+    return dict((name, value) for name, value in v.items() if value is not None)
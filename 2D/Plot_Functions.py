@@ -0,0 +1,64 @@
+import os
+#dadi 1.x imports matplotlib (dadi.Plotting imports pylab) as soon as it is imported,
+#pick the non-interactive backend before that so no display is needed
+os.environ.setdefault("MPLBACKEND", "Agg")
+import dadi
+try:
+    import Optimize_Functions
+except ImportError:
+    #the 2D folder has it as Optimization_Functions.py
+    import Optimization_Functions as Optimize_Functions
+
+'''
+Plot the fit of a model to the data (data, model and residuals), as in Dan Portik's pipeline.
+
+dadi 1.x imports matplotlib itself (dadi.Plotting imports pylab), so it is loaded by
+anything that imports dadi. This module, Optimize_Functions.py (Optimization_Functions.py
+in 2D) and dadi_pipeline.py set MPLBACKEND to the non-interactive Agg backend (unless it
+is set already) before they import dadi, so plots can be made on nodes without a display.
+A script that imports dadi before any of them should set MPLBACKEND=Agg itself.
+
+usage (after an optimization round):
+    import Plot_Functions
+    Plot_Functions.Plot_Model(pts, fs, "C-O", "asym_mig", best_params)
+
+Requires the Models_2D.py/Models_3D.py and Optimize_Functions.py scripts to be in same working directory.
+'''
+
+def _pyplot():
+    #the backend was chosen through MPLBACKEND before dadi loaded matplotlib
+    import matplotlib.pyplot as plt
+    return plt
+
+
+#======================================================================================
+# Plot_Model(pts, fs, outfile, model_name, params, vmin=1e-3, resid_range=3, pop_ids=None)
+
+# Argument definitions:
+# pts:  grid choice (list of three numbers, ex. [20,30,40]
+# fs:  spectrum object name (of a pair or a triplet)
+# outfile:  prefix for output naming -> "{0}_{1}.pdf".format(outfile,model_name)
+# model_name:  any model in MODELS of Optimize_Functions.py
+# params:  list of parameter values to simulate, presumably from the best run
+# vmin:  smallest value shown in the spectrum plots
+# resid_range:  range of the residual colour scale
+# pop_ids:  population names for the axes (default: the ones of the spectrum)
+
+def Plot_Model(pts, fs, outfile, model_name, params, vmin=1e-3, resid_range=3, pop_ids=None):
+    plt = _pyplot()
+    import dadi.Plotting
+
+    #simulate the model with the given parameters
+    sim_model = Optimize_Functions.Optimize_Single(pts, fs, model_name, params)
+
+    fig = plt.figure(figsize=(10, 8))
+    if len(fs.sample_sizes) == 2:
+        dadi.Plotting.plot_2d_comp_multinom(sim_model, fs, vmin=vmin, resid_range=resid_range, pop_ids=pop_ids, show=False)
+    else:
+        dadi.Plotting.plot_3d_comp_multinom(sim_model, fs, vmin=vmin, resid_range=resid_range, pop_ids=pop_ids, show=False)
+
+    outname = "{0}_{1}.pdf".format(outfile, model_name)
+    fig.savefig(outname, bbox_inches='tight')
+    plt.close(fig)
+    print "Saved plot to", outname, '\n'
+    return outname
@@ -11,6 +11,36 @@ Patricia Wepfer
 August, 2018
 '''
 
+#grids are identical for every model and parameter set with the same number of points,
+#so they are built once per process and shared
+_grids = {}
+
+def _default_grid(pts):
+    """
+    Numerics.default_grid(pts), computed once per number of grid points.
+    """
+    if pts not in _grids:
+        _grids[pts] = Numerics.default_grid(pts)
+    return _grids[pts]
+
+
+#the equilibrium phi every model starts from only depends on the grid as well: it is
+#computed once per number of grid points and kept read-only, so forked worker processes
+#keep sharing its memory, and each model evaluation integrates its own copy
+_phis = {}
+
+def _equilibrium_phi(pts):
+    """
+    Copy of PhiManip.phi_1D_to_2D(xx, PhiManip.phi_1D(xx)), computed once per number of grid points.
+    """
+    if pts not in _phis:
+        xx = _default_grid(pts)
+        phi = PhiManip.phi_1D_to_2D(xx, PhiManip.phi_1D(xx))
+        phi.setflags(write=False)
+        _phis[pts] = phi
+    return _phis[pts].copy()
+
+
 ##########################################################################################
 #Basic models of (no gene flow / gene flow) between (all / some) population pairs
 ##########################################################################################
@@ -23,9 +53,8 @@ def split_nomig(params, ns, pts):
     #6 parameters	
     nu1, nuA, nu2, nu3, T1, T2 = params
 
-    xx = Numerics.default_grid(pts)
-    phi = PhiManip.phi_1D(xx)
-    phi = PhiManip.phi_1D_to_2D(xx, phi)
+    xx = _default_grid(pts)
+    phi = _equilibrium_phi(pts)
 
     phi = Integration.two_pops(phi, xx, T1, nu1=nu1, nu2=nuA, m12=0, m21=0)
 
@@ -45,9 +74,8 @@ def split_symmig_all(params, ns, pts):
     #10 parameters
     nu1, nuA, nu2, nu3, mA, m1, m2, m3, T1, T2 = params
 
-    xx = Numerics.default_grid(pts)
-    phi = PhiManip.phi_1D(xx)
-    phi = PhiManip.phi_1D_to_2D(xx, phi)
+    xx = _default_grid(pts)
+    phi = _equilibrium_phi(pts)
 
     phi = Integration.two_pops(phi, xx, T1, nu1=nu1, nu2=nuA, m12=mA, m21=mA)
 
@@ -67,9 +95,8 @@ def split_asymmig_all(params, ns, pts):
     #13 parameters
     nu1, nuA, nu2, nu3, mA1, mA2, m12, m21, m13, m31, m3, T1, T2 = params
 
-    xx = Numerics.default_grid(pts)
-    phi = PhiManip.phi_1D(xx)
-    phi = PhiManip.phi_1D_to_2D(xx, phi)
+    xx = _default_grid(pts)
+    phi = _equilibrium_phi(pts)
 
     phi = Integration.two_pops(phi, xx, T1, nu1=nu1, nu2=nuA, m12=mA1, m21=mA2)
 
@@ -91,9 +118,8 @@ def split_symmig_adjacent(params, ns, pts):
     #9 parameters
     nu1, nuA, nu2, nu3, mA, m1, m2, T1, T2 = params
 
-    xx = Numerics.default_grid(pts)
-    phi = PhiManip.phi_1D(xx)
-    phi = PhiManip.phi_1D_to_2D(xx, phi)
+    xx = _default_grid(pts)
+    phi = _equilibrium_phi(pts)
 
     phi = Integration.two_pops(phi, xx, T1, nu1=nu1, nu2=nuA, m12=mA, m21=mA)
 
@@ -112,9 +138,8 @@ def starsplit(params, ns, pts):
     #9 parameters
     nu1, nu2, nu3, m12, m21, m13, m31, m3, T = params
 
-    xx = Numerics.default_grid(pts)
-    phi = PhiManip.phi_1D(xx)
-    phi = PhiManip.phi_1D_to_2D(xx, phi)
+    xx = _default_grid(pts)
+    phi = _equilibrium_phi(pts)
 
     #phi = Integration.two_pops(phi, xx, T1, nu1=nu1, nu2=nuA, m12=mA1, m21=mA2)
 
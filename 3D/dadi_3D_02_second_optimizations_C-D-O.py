@@ -1,10 +1,13 @@
 import sys
 import os
 import numpy as np
+#dadi 1.x imports matplotlib (dadi.Plotting imports pylab) as soon as it is imported,
+#pick the non-interactive backend before that so no display is needed
+os.environ.setdefault("MPLBACKEND", "Agg")
 import dadi
-import matplotlib
 from datetime import datetime
 import Models_3D
+import Optimize_Functions
 '''
 Optimization functions used in Wepfer et al., "The oceanographic isolation of the Ogasawara Islands and genetic divergence in a reef-building coral".
 
@@ -12,7 +15,7 @@ Script taken from Dan Portik's pipeline: https://github.com/dportik/dadi_pipelin
 CITE: https://github.com/dportik/dadi_pipeline/blob/master/README.md#V
 
 usage: python dadi_3D_02_second_optimizations_C-D-O.py
-Requires the Models_3D.py script to be in same working directory.
+Requires the Models_3D.py and Optimize_Functions.py scripts to be in same working directory.
 
 ############################################
 Written for Python 2.7
@@ -52,343 +55,11 @@ print "Segregating sites",fs_1.S(), '\n', '\n'
 #write output of parameter optimizations, theta, likelihood, and AIC for each replicate for 
 #each model to file
 
-def Three_Pop_Models(pts, fs, outfile, reps, y, model_name, params):
-    print '\n',"============================================================================"
-    print "Beginning analysis of {}".format(model_name)
-    print "============================================================================"
-
-    #create output file
-    outname = "Round2_{0}_{1}_optimized.txt".format(outfile,model_name)
-    fh_out = open(outname, 'a')
-    fh_out.write("Model"+'\t'+"param_set"+'\t'+"Replicate"+'\t'+"log-likelihood"+'\t'+"theta"+'\t'+"AIC"+'\t'+"optimized_params"+'\n')
-    fh_out.close()
-    
-    #variable to control number of loops per model (1 to x)
-    x = int(reps) + int(1)
-    
-    ######################################################################################################################
-    #Basic models
-    ######################################################################################################################
-    
-    if model_name == "split_nomig":
-        
-        #####################################
-        #Split with no migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Split with No Migration",'\n','\n'
-        
-        #first call a predefined model
-        model_call = Models_3D.split_nomig
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 30, 30, 10, 10]
-        print "parameter set = [nu1, nuA, nu2, nu3, T1, T2]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Split with No Migration"+'\t')
-            fh_out.write("parameter set = [nu1, nuA, nu2, nu3, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "starting parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-            
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*6)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-
-        print "---------------------------------------------------", '\n'
-
-
-    elif model_name == "split_asymmig_all":
-
-        #####################################
-        #Split with asymmetric migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Split with asymmetric Migration",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_3D.split_asymmig_all
-
-        #create an extrapolating function
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 30, 30, 20, 20, 20, 20, 20, 20, 20, 10, 10]
-        print "parameter set = [nu1, nuA, nu2, nu3, mA1, mA2, m12, m21, m13, m31, m3, T1, T2]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Split with Asymmetric Migration"+'\t')
-            fh_out.write("parameter set = [nu1, nuA, nu2, nu3, mA1, mA2, m12, m21, m13, m31, m3, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "starting parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC
-            aic = ( -2*( float(ll))) + (2*10)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-
-        print "---------------------------------------------------", '\n'
-
-
-
-
-    elif model_name == "starsplit":
-
-        #####################################
-        #Split between 3 pops at same time
-        #####################################
-        print "---------------------------------------------------"
-        print "Starsplit between 3 populations, 2nd Optimization",'\n','\n'
-
-        #first call a predefined model
-        model_call = Models_3D.starsplit
-
-        #create an extrapolating function
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01,  0.01, 0.01, 0.01, 0.01, 0]
-        upper_bound = [30, 30, 30, 20, 20, 20, 20, 20, 10]
-        params=[1,1,1,1,1,1,1,1,1]
-        print "parameter set = [nu1, nu2, nu3, m12, m21, m13, m31, m3, T]"
-
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Starsplit"+'\t')
-            fh_out.write("parameter set = [nu1, nu2, nu3, m12, m21, m13, m31, m3, T]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC
-            aic = ( -2*( float(ll))) + (2*10)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-
-        print "---------------------------------------------------", '\n'
-
-
-    elif model_name == "split_symmig_all":
-        
-        #####################################
-        #Split with symmetric migration
-        #####################################
-        print "---------------------------------------------------"
-        print "Split with Symmetric Migration",'\n','\n'
-        
-        #first call a predefined model
-        model_call = Models_3D.split_symmig_all
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 30, 30, 20, 20, 20, 20, 10, 10]
-        print "parameter set = [nu1, nuA, nu2, nu3, mA, m1, m2, m3, T1, T2]"
-        
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Split with Symmetric Migration"+'\t')
-            fh_out.write("parameter set = [nu1, nuA, nu2, nu3, mA, m1, m2, m3, T1, T2]"+'\t') 
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "starting parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*10)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-
-        print "---------------------------------------------------", '\n'
-
-
-    elif model_name == "split_symmig_adjacent":
-        
-        #####################################
-        #Split with adjacent symmetric migration 
-        #####################################
-        print "---------------------------------------------------"
-        print "Split with Adjacent Symmetric Migration",'\n','\n'
-        
-        #first call a predefined model
-        model_call = Models_3D.split_symmig_adjacent
-
-        #create an extrapolating function 
-        func_exec = dadi.Numerics.make_extrap_log_func(model_call)
-
-        #create parameter list for optimization, set bounds for search
-        lower_bound = [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0, 0]
-        upper_bound = [30, 30, 30, 30, 20, 20, 20, 10, 10]
-        print "parameter set = [nu1, nuA, nu2, nu3, mA, m1, m2, T1, T2]"
-        
-        for i in range(1,x):
-            fh_out = open(outname, 'a')
-            fh_out.write("Split with Adjacent Symmetric Migration"+'\t')
-            fh_out.write("parameter set = [nu1, nuA, nu2, nu3, mA, m1, m2, T1, T2]"+'\t')
-            fh_out.write("{}\t".format(i))
-            print '\n', "Replicate {}:".format(i)
-            print "starting parameters = ", params
-
-            #perturb initial guesses
-            params_perturbed = dadi.Misc.perturb_params(params, fold=2, upper_bound=upper_bound, lower_bound=lower_bound)
-
-            #run optimization 
-            params_opt = dadi.Inference.optimize_log_fmin(params_perturbed, fs, func_exec, pts,lower_bound=lower_bound, upper_bound=upper_bound, verbose=1, maxiter=y)
-            print '\n',"optimized parameters = ", params_opt
-
-            #simulate the model with the optimized parameters
-            sim_model = func_exec(params_opt, fs.sample_sizes, pts)
-
-            #calculate likelihood
-            ll = dadi.Inference.ll_multinom(sim_model, fs)
-            ll = np.around(ll, 2)
-            print "likelihood = ", ll
-            fh_out.write("{}\t".format(ll))
-
-            #calculate theta
-            theta = dadi.Inference.optimal_sfs_scaling(sim_model, fs)
-            theta = np.around(theta, 2)
-            print "Theta = ", theta
-            fh_out.write("{}\t".format(theta))
-
-            #calculate AIC 
-            aic = ( -2*( float(ll))) + (2*9)
-            print "AIC = ", aic, '\n', '\n'
-            fh_out.write("{}\t".format(aic))
-
-            for p in params_opt:
-                p = np.around(p, 4)
-                fh_out.write("{}\t".format(p))
-            fh_out.write('\n')
-            fh_out.close()
-
-        print "---------------------------------------------------", '\n'
-
-    
-
-        
+def Three_Pop_Models(pts, fs, outfile, reps, y, model_name, params, workers=1):
+    #model function and bounds come from the model registry in Optimize_Functions.py
+    Optimize_Functions.Optimize_Round2(pts, fs, outfile, reps, y, model_name, params, workers=workers)
+
+
 #======================================================================================
 # Finally, execute model with appropriate arguments
 # Three_Pop_Models(pts, fs, outfile, reps, maxiter, model_name, model_params):
@@ -441,21 +112,21 @@ fs = fs_1
 outfile = "C-D-O"
 reps = int(50)
 maxiter = int(20)
+#number of processes to run replicates in parallel (1 runs them serially)
+workers = int(1)
 
 #**************
-# Here it is set up to call each model one by one sequentially, but this will take a very long time.
-# I recommend blocking out all models except one (use a hash or delete), make several
-# copies of the script and execute one model version for every core you have available.
-# It will greatly speed up these steps, and sometimes if extrapolations fail the
-# script will crash too.
+# Here it is set up to call each model one by one sequentially. The replicates of each model
+# are run in parallel on 'workers' processes, so set workers to the number of cores you
+# have available instead of making one copy of the script per core.
 # There are 20 models to test here. 
 
 #Models from the Models_3D.py script 
-#Three_Pop_Models(pts, fs, outfile, reps, maxiter, "split_nomig", split_nomig_params)
-#Three_Pop_Models(pts, fs, outfile, reps, maxiter, "split_symmig_all", split_symmig_all_params)
-Three_Pop_Models(pts, fs, outfile, reps, maxiter, "split_asymmig_all", split_asymmig_all_params)
-#Three_Pop_Models(pts, fs, outfile, reps, maxiter, "starsplit", starsplit_params)
-#Three_Pop_Models(pts, fs, outfile, reps, maxiter, "split_symmig_adjacent", split_symmig_adjacent_params)
+#Three_Pop_Models(pts, fs, outfile, reps, maxiter, "split_nomig", split_nomig_params, workers=workers)
+#Three_Pop_Models(pts, fs, outfile, reps, maxiter, "split_symmig_all", split_symmig_all_params, workers=workers)
+Three_Pop_Models(pts, fs, outfile, reps, maxiter, "split_asymmig_all", split_asymmig_all_params, workers=workers)
+#Three_Pop_Models(pts, fs, outfile, reps, maxiter, "starsplit", starsplit_params, workers=workers)
+#Three_Pop_Models(pts, fs, outfile, reps, maxiter, "split_symmig_adjacent", split_symmig_adjacent_params, workers=workers)
 
 
 
@@ -0,0 +1,344 @@
+import argparse
+import os
+#dadi 1.x imports matplotlib (dadi.Plotting imports pylab) as soon as it is imported,
+#pick the non-interactive backend before that so no display is needed
+os.environ.setdefault("MPLBACKEND", "Agg")
+import dadi
+from datetime import datetime
+try:
+    import Optimize_Functions
+except ImportError:
+    #the 2D folder has it as Optimization_Functions.py
+    import Optimization_Functions as Optimize_Functions
+
+'''
+Run the optimization rounds for a pair or triplet of populations from the command line,
+instead of editing and running one copy of the 01/02/03 scripts per round.
+
+The spectrum is loaded once and all rounds and models are run in the same process, so
+the grids, extrapolating functions, model cache and worker processes are reused, and the
+replicates of all models of a round share one pool (--workers). Every round starts from the
+best replicate of the round before, read from its output file.
+
+usage: python dadi_pipeline.py run C-O.sfs --rounds 1 --reps 30 --maxiter 20
+       python dadi_pipeline.py run C-D-O.sfs --models split_symmig_all --rounds 3 --reps 50 --maxiter 100 \
+           --params split_symmig_all=0.6047,1.8755,2.7982,0.1294,1.1115,0.4329,1.9536,0.5993,1.5957,0.3824
+       python dadi_pipeline.py run C-O.sfs --workers 8     (all three rounds, chained)
+       python dadi_pipeline.py grids C-D-O.sfs split_symmig_all     (which pts is large enough?)
+       python dadi_pipeline.py plot C-O.sfs asym_mig     (data, model and residuals of the best run)
+
+Requires the Models_2D.py (or 2D_Models.py)/Models_3D.py and Optimize_Functions.py scripts to be in same working directory.
+
+Patricia Wepfer
+'''
+
+#======================================================================================
+# Models run when --models is not given, by number of populations in the spectrum
+
+DEFAULT_MODELS = {
+    2: ["no_divergence", "no_mig", "sym_mig", "asym_mig"],
+    3: ["split_nomig", "split_symmig_all", "split_symmig_adjacent", "split_asymmig_all", "starsplit"],
+}
+
+#module the models for a pair/triplet live in
+MODEL_MODULES = {2: "Models_2D", 3: "Models_3D"}
+
+
+#======================================================================================
+# Argument helpers
+
+def _ints(text):
+    return [int(v) for v in text.split(",")]
+
+
+def _model_params(text):
+    #"model_name=v1,v2,..."
+    if "=" not in text:
+        raise argparse.ArgumentTypeError("expected model_name=v1,v2,... got '{}'".format(text))
+    model_name, values = text.split("=", 1)
+    try:
+        return model_name.strip(), [float(v) for v in values.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError("parameter values for {} must be numbers".format(model_name))
+
+
+def _shard(text):
+    #"i/n", this copy is shard i of n copies running at once
+    try:
+        index, count = [int(v) for v in text.split("/")]
+    except ValueError:
+        raise argparse.ArgumentTypeError("expected i/n, ex. 2/4, got '{}'".format(text))
+    if not 1 <= index <= count:
+        raise argparse.ArgumentTypeError("shard {} must be between 1 and n".format(text))
+    return index, count
+
+
+def _optimizers(values, models):
+    #"name" for all models and/or "model_name=name" for one model, the last one given wins
+    optimizers = dict((model_name, "log_fmin") for model_name in models)
+    for value in values:
+        model_name, name = value.split("=", 1) if "=" in value else (None, value)
+        if name not in Optimize_Functions.OPTIMIZERS:
+            raise SystemExit("Unknown optimizer '{0}', choose from: {1}".format(name, ", ".join(Optimize_Functions.OPTIMIZERS)))
+        if model_name is None:
+            optimizers = dict((m, name) for m in models)
+        elif model_name not in models:
+            raise SystemExit("--optimizer given for {}, which is not in --models".format(model_name))
+        else:
+            optimizers[model_name] = name
+    return optimizers
+
+
+def _per_round(values, rounds, name):
+    #one value for all rounds, one value per round run, or one for each of rounds 1 2 3
+    if len(values) == 1:
+        return dict((r, values[0]) for r in rounds)
+    if len(values) == len(rounds):
+        return dict(zip(rounds, values))
+    if len(values) == 3:
+        return dict((r, values[r - 1]) for r in rounds)
+    raise SystemExit("--{0} takes one value or one per round ({1} rounds), got {2}".format(name, len(rounds), len(values)))
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Optimize dadi demographic models for a pair or triplet of populations.")
+    commands = parser.add_subparsers(dest="command")
+
+    run = commands.add_parser("run", help="run optimization rounds")
+    run.add_argument("spectrum", help="frequency spectrum file (.sfs) of a pair or triplet")
+    run.add_argument("--outfile", help="prefix for output naming (default: spectrum file name, ex. C-O)")
+    run.add_argument("--proj", type=_ints, help="project the spectrum down to these sample sizes, in ALLELES (ex. 26,26)")
+    run.add_argument("--models", nargs="+", help="models to run (default: all models of Models_2D.py or Models_3D.py used in the paper)")
+    run.add_argument("--rounds", nargs="+", type=int, default=[1, 2, 3], choices=[1, 2, 3], help="rounds to run (default: 1 2 3)")
+    run.add_argument("--reps", nargs="+", type=int, default=[30, 50, 50], help="replicates per model, one value or one per round (default: 30 50 50)")
+    run.add_argument("--maxiter", nargs="+", type=int, default=[20, 50, 100], help="max iterations per optimization, one value or one per round (default: 20 50 100)")
+    run.add_argument("--pts", type=_ints, default=[30, 40, 50], help="grid choice (default: 30,40,50)")
+    run.add_argument("--params", type=_model_params, action="append", default=[],
+                     help="starting params of a model for the first round run (default: the basic ones in round 1, the best replicate of the previous round otherwise), model_name=v1,v2,...")
+    run.add_argument("--workers", type=int, default=1, help="processes to run replicates in parallel (default: 1)")
+    run.add_argument("--timeout", type=float, help="max seconds per replicate (default: no limit)")
+    run.add_argument("--lhs", action="store_true", help="start round 1 from a Latin hypercube over the parameter bounds instead of perturbing the basic starting params")
+    run.add_argument("--warm-start", nargs="*", metavar="FOLDER",
+                     help="also start round 1 from the best fits of the other pairs (and the 3D split models from the 2D fits of the pairs) "
+                          "found in these folders (default: the current folder), ex. --warm-start ../2D .")
+    run.add_argument("--coarse-pts", type=_ints, help="optimize each replicate on this cheaper grid first (ex. 20,24,28, or 20 without extrapolation) and finish on --pts with a quarter of --maxiter")
+    run.add_argument("--optimizer", nargs="+", default=[],
+                     help="optimizer for all models and/or per model: log_fmin (default), log_lbfgsb, log_bfgs, log_bfgs_parallel "
+                          "(gradients spread over --workers) or cma, ex. log_lbfgsb asym_mig=cma")
+    run.add_argument("--race", action="store_true", help="race the models: run every round but the last on a cheap grid and drop the models that fall behind after each round")
+    run.add_argument("--eta", type=int, default=2, help="with --race, keep the best 1/eta of the models after each round (default: 2)")
+    run.add_argument("--aic-margin", type=float, default=10, help="with --race, also drop models more than this many AIC units behind (default: 10)")
+    run.add_argument("--cheap-pts", type=_ints, help="with --race, grid for all but the last round (default: about 60%% of --pts)")
+    run.add_argument("--converge", type=int, help="stop a model once this many replicates agree on the best optimum, --reps is then the maximum")
+    run.add_argument("--ll-tol", type=float, default=0.1, help="log-likelihood difference for replicates to agree (default: 0.1)")
+    run.add_argument("--param-tol", type=float, default=0.05, help="relative parameter difference for replicates to agree (default: 0.05)")
+    run.add_argument("--store", help="also record every replicate in this SQLite database (ex. results.sqlite)")
+    run.add_argument("--no-resume", dest="resume", action="store_false", help="rerun replicates already in the output files")
+    run.add_argument("--shard", type=_shard, help="run this copy as shard i of n copies of the same command (ex. 2/4, on several "
+                     "machines sharing the folder): each copy runs every n-th replicate and the rounds are merged when all copies finish them")
+
+    grids = commands.add_parser("grids", help="compare grid choices for a model and recommend the smallest adequate one")
+    grids.add_argument("spectrum", help="frequency spectrum file (.sfs) of a pair or triplet")
+    grids.add_argument("model", help="model to simulate")
+    grids.add_argument("--outfile", help="prefix of the round output files to take the best params from (default: spectrum file name)")
+    grids.add_argument("--proj", type=_ints, help="project the spectrum down to these sample sizes, in ALLELES (ex. 26,26)")
+    grids.add_argument("--params", type=lambda text: [float(v) for v in text.split(",")],
+                       help="params to simulate, v1,v2,... (default: best replicate of the latest round output, or the basic starting params)")
+    grids.add_argument("--grids", type=_ints, nargs="+", help="grid choices to compare, smallest first, ex. 20,30,40 30,40,50")
+    grids.add_argument("--tol", type=float, default=0.1, help="acceptable log-likelihood difference to the largest grid choice (default: 0.1)")
+
+    plot = commands.add_parser("plot", help="plot data, model and residuals of a model to <outfile>_<model>.pdf")
+    plot.add_argument("spectrum", help="frequency spectrum file (.sfs) of a pair or triplet")
+    plot.add_argument("model", help="model to plot")
+    plot.add_argument("--outfile", help="prefix of the round output files to take the best params from, and of the plot (default: spectrum file name)")
+    plot.add_argument("--proj", type=_ints, help="project the spectrum down to these sample sizes, in ALLELES (ex. 26,26)")
+    plot.add_argument("--params", type=lambda text: [float(v) for v in text.split(",")],
+                      help="params to simulate, v1,v2,... (default: best replicate of the latest round output, or the basic starting params)")
+    plot.add_argument("--pts", type=_ints, default=[30, 40, 50], help="grid choice (default: 30,40,50)")
+    plot.add_argument("--vmin", type=float, default=1e-3, help="smallest value shown in the spectrum plots (default: 0.001)")
+    plot.add_argument("--resid-range", type=float, default=3, help="range of the residual colour scale (default: 3)")
+
+    summary = commands.add_parser("summary", help="rank the models of every population set and round by AIC, from the round output files")
+    summary.add_argument("directory", nargs="?", default=".", help="folder with the round output files (default: current folder)")
+    summary.add_argument("--outfile", help="only this outfile prefix (ex. C-O)")
+    summary.add_argument("--round", type=int, choices=[1, 2, 3], help="only this round")
+    summary.add_argument("--ll-tol", type=float, default=0.1, help="replicates within this many log-likelihood units of the best count as near best (default: 0.1)")
+    summary.add_argument("--no-write", dest="write", action="store_false", help="only print the tables, don't write Summary_Round<N>_<outfile>.txt")
+
+    best = commands.add_parser("best", help="best replicate (lowest AIC) per model, round and outfile in a --store database")
+    best.add_argument("store", help="SQLite database written by run --store")
+    best.add_argument("--outfile", help="only this outfile prefix (ex. C-O)")
+    best.add_argument("--round", type=int, choices=[1, 2, 3], help="only this round")
+    return parser
+
+
+#======================================================================================
+# Run the rounds
+
+def load_spectrum(args):
+    fs = dadi.Spectrum.from_file(args.spectrum)
+    if args.proj:
+        fs = fs.project(args.proj)
+    npop = len(fs.sample_sizes)
+    if npop not in DEFAULT_MODELS:
+        raise SystemExit("{0} has {1} populations, only pairs and triplets are supported".format(args.spectrum, npop))
+    outfile = args.outfile or os.path.splitext(os.path.basename(args.spectrum))[0]
+
+    print '\n', '\n', "Data for spectrum:", args.spectrum
+    print "sample sizes", fs.sample_sizes
+    print "Segregating sites",fs.S(), '\n', '\n'
+    return fs, npop, outfile
+
+
+def run(args):
+    #keep track of start time
+    t_begin = datetime.now()
+
+    fs, npop, outfile = load_spectrum(args)
+
+    #check everything before starting hours of optimizations
+    rounds = sorted(set(args.rounds))
+    reps = _per_round(args.reps, rounds, "reps")
+    maxiter = _per_round(args.maxiter, rounds, "maxiter")
+    params = dict(args.params)
+    models = args.models or DEFAULT_MODELS[npop]
+    for model_name in models:
+        model = check_model(model_name, npop)
+        if model_name in params and len(params[model_name]) != len(model.param_names):
+            raise SystemExit("{0} takes {1} parameters, got {2}".format(model_name, len(model.param_names), len(params[model_name])))
+        #a run starting at round 2 or 3 carries on from the output of the round before
+        previous = Optimize_Functions.round_outname(rounds[0] - 1, outfile, model_name)
+        if rounds[0] > 1 and model_name not in params and not Optimize_Functions.is_fixed(model) and not os.path.exists(previous):
+            raise SystemExit("{0} not found, run round {1} first or give the starting params with --params {2}=v1,v2,...".format(previous, rounds[0] - 1, model_name))
+    for model_name in params:
+        if model_name not in models:
+            raise SystemExit("--params given for {}, which is not in --models".format(model_name))
+    optimizers = _optimizers(args.optimizer, models)
+    #--warm-start without folders looks in the current folder
+    warm_start = (args.warm_start or ["."]) if args.warm_start is not None else None
+    for folder in warm_start or []:
+        if not os.path.isdir(folder):
+            raise SystemExit("--warm-start folder {} not found".format(folder))
+    if "cma" in optimizers.values():
+        try:
+            import cma
+        except ImportError:
+            raise SystemExit("--optimizer cma needs the cma package (pip install cma)")
+
+    Optimize_Functions.set_convergence(ll_tol=args.ll_tol, param_tol=args.param_tol)
+    Optimize_Functions.set_writer_options(shard=args.shard)
+    if args.store:
+        Optimize_Functions.set_result_store(args.store)
+
+    #each round starts from the best replicate of the round before
+    starts = [(model_name, params.get(model_name)) for model_name in models]
+    options = dict(rounds=rounds, workers=args.workers, resume=args.resume, timeout=args.timeout, converge=args.converge,
+                   coarse_pts=args.coarse_pts, lhs=args.lhs, optimizer=optimizers, warm_start=warm_start)
+    if args.race:
+        best = Optimize_Functions.Optimize_Race(args.pts, fs, outfile, [reps[r] for r in rounds], [maxiter[r] for r in rounds], starts,
+                                                eta=args.eta, aic_margin=args.aic_margin, cheap_pts=args.cheap_pts, **options)
+    else:
+        best = Optimize_Functions.Optimize_Pipeline(args.pts, fs, outfile, [reps[r] for r in rounds], [maxiter[r] for r in rounds], starts,
+                                                    **options)
+
+    print '\n', "Best replicate of round {} per model:".format(rounds[-1])
+    for model_name, row in best.items():
+        if row is None:
+            print model_name, "no finished replicates"
+        else:
+            print model_name, "replicate", row["replicate"], "likelihood =", row["ll"], "AIC =", row["aic"], "params =", row["params"]
+
+    #clock the amount of time to complete the script
+    t_finish = datetime.now()
+    elapsed = t_finish - t_begin
+    print '\n', '\n', "-----------------------------------------------------------------------------------------------------"
+    print "Finished all analyses!"
+    print "Total time: {0} (H:M:S)".format(elapsed)
+    print "-----------------------------------------------------------------------------------------------------", '\n', '\n'
+
+
+#======================================================================================
+# Grid diagnostics
+
+def check_model(model_name, npop):
+    model = Optimize_Functions.MODELS.get(model_name)
+    if model is not None and model.module != MODEL_MODULES[npop]:
+        raise SystemExit("{0} is a {1} model, the spectrum has {2} populations".format(model_name, model.module, npop))
+    try:
+        return Optimize_Functions.get_model(model_name)
+    except ValueError as e:
+        raise SystemExit(str(e))
+
+
+def best_params(args, outfile, model):
+    #--params, or the best params found so far, or the basic starting params
+    params = args.params
+    if params is None:
+        for round_num in (3, 2, 1):
+            best = Optimize_Functions.best_replicate(Optimize_Functions.round_outname(round_num, outfile, args.model))
+            if best is not None:
+                print "Using the best replicate of round {0} (likelihood = {1})".format(round_num, best["ll"])
+                params = best["params"]
+                break
+        else:
+            print "No round output for {}, using the basic starting params".format(args.model)
+            params = model.start
+    if len(params) != len(model.param_names):
+        raise SystemExit("{0} takes {1} parameters, got {2}".format(args.model, len(model.param_names), len(params)))
+    return params
+
+
+def grids(args):
+    fs, npop, outfile = load_spectrum(args)
+    model = check_model(args.model, npop)
+
+    params = best_params(args, outfile, model)
+    pts = Optimize_Functions.Grid_Diagnostics(fs, args.model, params, grids=args.grids, tol=args.tol)
+    print "Use --pts {}".format(",".join(str(p) for p in pts))
+
+
+#======================================================================================
+# Plot the fit of a model
+
+def plot(args):
+    #only imported here, the other commands don't need it
+    import Plot_Functions
+
+    fs, npop, outfile = load_spectrum(args)
+    model = check_model(args.model, npop)
+    params = best_params(args, outfile, model)
+    Plot_Functions.Plot_Model(args.pts, fs, outfile, args.model, params, vmin=args.vmin, resid_range=args.resid_range)
+
+
+#======================================================================================
+# Query the result store
+
+def best(args):
+    if not os.path.exists(args.store):
+        raise SystemExit("{} not found".format(args.store))
+    store = Optimize_Functions.ResultsStore(args.store)
+    print "{0:<12}{1:<7}{2:<28}{3:>10}{4:>14}{5:>12}   {6}".format("outfile", "round", "model", "replicate", "likelihood", "AIC", "params")
+    for row in store.best_per_model(outfile=args.outfile, round_num=args.round):
+        params = ", ".join("{0}={1:.4f}".format(name, value) for name, value in row["params"].items())
+        print "{0:<12}{1:<7}{2:<28}{3:>10}{4:>14}{5:>12}   {6}".format(row["outfile"], row["round"], row["model"], row["replicate"], row["ll"], row["aic"], params)
+    store.close()
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command == "run":
+        run(args)
+    elif args.command == "grids":
+        grids(args)
+    elif args.command == "plot":
+        plot(args)
+    elif args.command == "best":
+        best(args)
+    elif args.command == "summary":
+        tables = Optimize_Functions.Summarize_Rounds(args.directory, round_num=args.round, outfile=args.outfile, ll_tol=args.ll_tol, write=args.write)
+        if not tables:
+            raise SystemExit("No round output files found in {}".format(args.directory))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+'''
+Stand-ins for the models of 2D/2D_Models.py: spectra with a single optimum at
+params = (1, 2, 3, ...), so the optimizers have something to find.
+'''
+import numpy as np
+from dadi import Spectrum
+
+
+def _fs(params, ns):
+    data = np.ones([n + 1 for n in ns])
+    data.flat[:] = np.arange(1, data.size + 1)
+    distance = sum((np.log(p) - np.log(i + 1)) ** 2 for i, p in enumerate(params))
+    return Spectrum(data ** (1.0 / (1.0 + distance)))
+
+
+def no_divergence(notused, ns, pts):
+    return _fs([], ns)
+
+
+def no_mig(params, ns, pts):
+    return _fs(params, ns)
+
+
+def sym_mig(params, ns, pts):
+    return _fs(params, ns)
+
+
+def asym_mig(params, ns, pts):
+    return _fs(params, ns)
@@ -0,0 +1,24 @@
+'''
+Stand-ins for the models of 3D/Models_3D.py, see Models_2D.py.
+'''
+from Models_2D import _fs
+
+
+def split_nomig(params, ns, pts):
+    return _fs(params, ns)
+
+
+def split_symmig_all(params, ns, pts):
+    return _fs(params, ns)
+
+
+def split_asymmig_all(params, ns, pts):
+    return _fs(params, ns)
+
+
+def split_symmig_adjacent(params, ns, pts):
+    return _fs(params, ns)
+
+
+def starsplit(params, ns, pts):
+    return _fs(params, ns)
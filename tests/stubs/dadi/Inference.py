@@ -0,0 +1,37 @@
+import numpy as np
+import scipy.optimize
+
+
+def ll_multinom(model, data):
+    m = np.ma.filled(np.ma.masked_array(model, np.ma.getmaskarray(data)), 0).astype(float)
+    d = np.ma.filled(data, 0).astype(float)
+    m = m / m.sum()
+    return float((d * np.log(np.where(m > 0, m, 1))).sum())
+
+
+def optimal_sfs_scaling(model, data):
+    return float(np.ma.sum(data) / np.ma.sum(model))
+
+
+def _objective(data, model_func, pts, lower_bound, upper_bound):
+    def neg_ll(log_params):
+        p = np.clip(np.exp(log_params), lower_bound, upper_bound)
+        return -ll_multinom(model_func(p, data.sample_sizes, pts), data)
+    return neg_ll
+
+
+def optimize_log_fmin(p0, data, model_func, pts, lower_bound=None, upper_bound=None, verbose=0, maxiter=None, **kwargs):
+    x = scipy.optimize.fmin(_objective(data, model_func, pts, lower_bound, upper_bound), np.log(p0), maxiter=maxiter, disp=False)
+    return np.clip(np.exp(x), lower_bound, upper_bound)
+
+
+def optimize_log_lbfgsb(p0, data, model_func, pts, lower_bound=None, upper_bound=None, verbose=0, maxiter=1e5, **kwargs):
+    x = scipy.optimize.fmin_l_bfgs_b(_objective(data, model_func, pts, lower_bound, upper_bound), np.log(p0),
+                                     approx_grad=True, maxiter=int(maxiter))[0]
+    return np.clip(np.exp(x), lower_bound, upper_bound)
+
+
+def optimize_log(p0, data, model_func, pts, lower_bound=None, upper_bound=None, verbose=0, maxiter=None, **kwargs):
+    x = scipy.optimize.fmin_bfgs(_objective(data, model_func, pts, lower_bound, upper_bound), np.log(p0),
+                                 epsilon=1e-3, maxiter=maxiter, disp=False)
+    return np.clip(np.exp(x), lower_bound, upper_bound)
@@ -0,0 +1,10 @@
+import numpy as np
+
+
+def perturb_params(params, fold=1, lower_bound=None, upper_bound=None):
+    p = np.array(params, dtype=float) * 2 ** (fold * (2 * np.random.random(len(params)) - 1))
+    if lower_bound is not None:
+        p = np.maximum(p, lower_bound)
+    if upper_bound is not None:
+        p = np.minimum(p, upper_bound)
+    return p
@@ -0,0 +1,15 @@
+import numpy as np
+
+#number of model evaluations, for tests that count them
+CALLS = [0]
+
+
+def default_grid(pts):
+    return np.linspace(0, 1, pts)
+
+
+def make_extrap_log_func(func):
+    def extrap_func(params, ns, pts_l):
+        CALLS[0] += 1
+        return func(params, ns, pts_l[-1])
+    return extrap_func
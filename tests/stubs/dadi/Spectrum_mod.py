@@ -0,0 +1,39 @@
+import numpy as np
+
+
+class Spectrum(np.ma.masked_array):
+    def __new__(cls, data, mask=np.ma.nomask, mask_corners=True, data_folded=None, check_folding=True, dtype=float,
+                copy=True, fill_value=None, keep_mask=True, shrink=True, pop_ids=None):
+        obj = np.ma.masked_array.__new__(cls, data, mask=mask, dtype=dtype, copy=copy, fill_value=fill_value,
+                                         keep_mask=keep_mask, shrink=shrink)
+        obj.folded = bool(data_folded)
+        obj.pop_ids = pop_ids
+        return obj
+
+    def __array_finalize__(self, obj):
+        np.ma.masked_array.__array_finalize__(self, obj)
+        self.folded = getattr(obj, "folded", False)
+        self.pop_ids = getattr(obj, "pop_ids", None)
+
+    @property
+    def sample_sizes(self):
+        return np.array(self.shape) - 1
+
+    def S(self):
+        return self.sum()
+
+    def to_file(self, fid):
+        #dadi's layout: sample sizes and folding, the data, then the mask
+        fid = open(fid, 'w')
+        fid.write(" ".join(str(n) for n in self.shape) + (" folded" if self.folded else " unfolded") + "\n")
+        fid.write(" ".join(repr(v) for v in self.data.ravel()) + "\n")
+        fid.write(" ".join(str(int(m)) for m in np.ma.getmaskarray(self).ravel()) + "\n")
+        fid.close()
+
+    @staticmethod
+    def from_file(fid):
+        lines = open(fid).read().splitlines()
+        shape = tuple(int(n) for n in lines[0].split()[:-1])
+        data = np.array([float(v) for v in lines[1].split()]).reshape(shape)
+        mask = np.array([bool(int(m)) for m in lines[2].split()]).reshape(shape)
+        return Spectrum(data, mask=mask, data_folded=lines[0].split()[-1] == "folded")
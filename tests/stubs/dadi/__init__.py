@@ -0,0 +1,7 @@
+'''
+Minimal stand-in for the parts of dadi used by Optimization_Functions.py, so the
+pipeline logic can be tested without dadi. Spectra are small masked arrays and the
+optimizers are scipy's, nothing here is population genetics.
+'''
+import Numerics, Misc, Inference
+from Spectrum_mod import Spectrum
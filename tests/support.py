@@ -0,0 +1,59 @@
+'''
+Shared setup of the tests: the stub dadi and model modules in tests/stubs come first
+on the path, then the 2D folder with Optimization_Functions.py.
+
+run from the repository folder with:  python -m unittest discover -s tests
+'''
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+sys.path.insert(0, os.path.join(ROOT, "2D"))
+sys.path.insert(0, os.path.join(HERE, "stubs"))
+
+import numpy as np
+import dadi
+import Optimization_Functions as OF
+
+
+def spectrum(ns=(4, 4)):
+    #spectrum of the stub models at their optimum (params 1, 2, 3, ...), corners masked
+    data = np.ones([n + 1 for n in ns])
+    data.flat[:] = np.arange(1, data.size + 1)
+    mask = np.zeros(data.shape, bool)
+    mask.flat[0] = mask.flat[-1] = True
+    return dadi.Spectrum(data, mask=mask, pop_ids=["C", "O"][:len(ns)])
+
+
+def write_round(round_num, outfile, model_name, lls, params=None):
+    #round output file with one row per log-likelihood, all with the same params
+    model = OF.get_model(model_name)
+    writer = OF.ResultsWriter(OF.round_outname(round_num, outfile, model_name))
+    writer.write_header()
+    for i, ll in enumerate(lls, 1):
+        writer.write_row(model, i, ll, 1.0, -2 * ll + 2 * model.k, params or [1.0] * len(model.param_names))
+    writer.close()
+
+
+class TempDirTestCase(unittest.TestCase):
+    '''
+    Runs every test in its own empty working folder, with the module settings reset.
+    '''
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.dir = tempfile.mkdtemp(prefix="dadi_test_")
+        os.chdir(self.dir)
+        np.random.seed(1)
+        OF.set_model_cache()
+        OF.set_writer_options()
+        OF.set_result_store(None)
+        OF.set_convergence()
+
+    def tearDown(self):
+        OF.close_pool()
+        os.chdir(self.cwd)
+        shutil.rmtree(self.dir, True)
@@ -0,0 +1,23 @@
+import numpy as np
+
+from support import OF, TempDirTestCase, spectrum
+
+
+class EvaluateBatchTests(TempDirTestCase):
+    def test_model_without_params_is_one_evaluation(self):
+        lls, thetas = OF.Evaluate_Batch([5, 6, 7], spectrum(), "no_divergence", [])
+        self.assertEqual(lls.shape, (1,))
+        self.assertFalse(np.isnan(lls[0]))
+
+    def test_rows_match_single_evaluations(self):
+        params = [[1, 2, 3], [2, 2, 2], [0.5, 1, 4]]
+        lls, thetas = OF.Evaluate_Batch([5, 6, 7], spectrum(), "no_mig", params, workers=2)
+        for row, ll in zip(params, lls):
+            self.assertAlmostEqual(ll, OF.Evaluate_Batch([5, 6, 7], spectrum(), "no_mig", row)[0][0])
+        self.assertEqual(np.argmax(lls), 0)
+
+    def test_fewer_rows_than_workers_keep_the_pool(self):
+        OF.Evaluate_Batch([5, 6, 7], spectrum(), "no_mig", [[1, 2, 3]] * 4, workers=4)
+        pool = OF._pool
+        OF.Evaluate_Batch([5, 6, 7], spectrum(), "no_mig", [[1, 2, 3]] * 2, workers=4)
+        self.assertIs(OF._pool, pool)
@@ -0,0 +1,53 @@
+import os
+import signal
+
+from support import OF, TempDirTestCase, spectrum
+
+OUTNAME = "Round1_T_no_mig_optimized.txt"
+FAILED = "Round1_T_no_mig_failed.txt"
+
+_optimize_replicate = OF._optimize_replicate
+
+
+def _killed_replicate(job):
+    #replicate 2 dies without returning, like a worker killed by the system
+    if job["replicate"] == 2:
+        os.kill(os.getpid(), signal.SIGKILL)
+    return _optimize_replicate(job)
+
+
+def _failing_optimize(job, tried):
+    raise ValueError("replicate {} failed".format(job["replicate"]))
+
+
+class FailureTests(TempDirTestCase):
+    def tearDown(self):
+        OF._optimize_replicate = _optimize_replicate
+        TempDirTestCase.tearDown(self)
+
+    def failures(self):
+        return [line.split('\t') for line in open(FAILED).readlines()[1:]]
+
+    def test_failed_replicates_get_a_failure_row(self):
+        optimize = OF._optimize
+        OF._optimize = _failing_optimize
+        try:
+            OF.Optimize_Round1([5, 6, 7], spectrum(), "T", 2, 5, "no_mig")
+        finally:
+            OF._optimize = optimize
+        self.assertEqual(OF.read_results(OUTNAME), [])
+        self.assertEqual([(f[1], f[2]) for f in self.failures()], [("1", "ValueError: replicate 1 failed"),
+                                                                  ("2", "ValueError: replicate 2 failed")])
+
+    def test_killed_worker_is_recorded_and_the_round_carries_on(self):
+        margin = OF.RESULT_MARGIN
+        OF.RESULT_MARGIN = 0.5
+        OF._optimize_replicate = _killed_replicate
+        try:
+            OF.Optimize_Round1([5, 6, 7], spectrum(), "T", 4, 5, "no_mig", workers=2, timeout=1)
+        finally:
+            OF.RESULT_MARGIN = margin
+        self.assertEqual([row["replicate"] for row in OF.read_results(OUTNAME)], [1, 3, 4])
+        failures = self.failures()
+        self.assertEqual([f[1] for f in failures], ["2"])
+        self.assertTrue(failures[0][2].startswith("ReplicateTimeout"))
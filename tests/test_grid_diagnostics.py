@@ -0,0 +1,40 @@
+from support import OF, TempDirTestCase, spectrum
+
+
+class GridDiagnosticsTests(TempDirTestCase):
+    def setUp(self):
+        TempDirTestCase.setUp(self)
+        self.get_func_exec = OF.get_func_exec
+        self.simulated = []
+        OF.get_func_exec = self.func_exec
+
+    def tearDown(self):
+        OF.get_func_exec = self.get_func_exec
+        TempDirTestCase.tearDown(self)
+
+    def func_exec(self, model_name, pts):
+        #the stub model with an error that shrinks like 1 / pts**2
+        def f(params, ns, grid):
+            self.simulated.append(list(grid))
+            sim_model = spectrum([n for n in ns])
+            sim_model[1, 1] += 2000.0 / grid[-1] ** 2
+            return sim_model
+        return f
+
+    def ll(self, pts):
+        return OF.dadi.Inference.ll_multinom(self.func_exec("no_mig", pts)([1, 2, 3], spectrum().sample_sizes, pts), spectrum())
+
+    def test_recommends_the_smallest_grid_within_tol(self):
+        grids = [[10, 12, 14], [20, 22, 24], [30, 32, 34], [40, 42, 44], [80, 82, 84]]
+        reference = self.ll(grids[-1])
+        #the differences to the largest grid are about 3.7, 0.63, 0.17 and 0.06
+        for tol, expected in ((1.0, [20, 22, 24]), (0.5, [30, 32, 34]), (0.1, [40, 42, 44]), (0.02, [80, 82, 84])):
+            self.assertTrue(all(abs(self.ll(pts) - reference) <= tol for pts in grids[grids.index(expected):]))
+            self.assertEqual(OF.Grid_Diagnostics(spectrum(), "no_mig", [1, 2, 3], grids=grids, tol=tol), expected)
+
+    def test_default_grids_stay_small_for_triplets(self):
+        OF.Grid_Diagnostics(spectrum((6, 4, 6)), "split_nomig", [1, 1, 1, 1, 1, 1])
+        self.assertEqual(max(max(pts) for pts in self.simulated), 6 + 27)
+        del self.simulated[:]
+        OF.Grid_Diagnostics(spectrum((6, 6)), "no_mig", [1, 2, 3])
+        self.assertEqual(max(max(pts) for pts in self.simulated), 6 + 62)
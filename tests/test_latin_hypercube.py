@@ -0,0 +1,38 @@
+import numpy as np
+
+from support import OF, TempDirTestCase, spectrum
+
+OUTNAME = "Round1_T_sym_mig_optimized.txt"
+
+
+class LatinHypercubeTests(TempDirTestCase):
+    def test_every_slice_is_used_once(self):
+        n = 8
+        points = OF.latin_hypercube("sym_mig", n, seed=3)
+        lower, upper = OF._log_bounds(OF.get_model("sym_mig"))
+        self.assertEqual(points.shape, (n, 4))
+        slices = np.floor((np.log(points) - lower) / (upper - lower) * n).astype(int)
+        for column in slices.T:
+            self.assertEqual(sorted(column), list(range(n)))
+
+    def test_seed_gives_the_same_design(self):
+        self.assertTrue(np.array_equal(OF.latin_hypercube("sym_mig", 5, seed=1), OF.latin_hypercube("sym_mig", 5, seed=1)))
+        self.assertFalse(np.array_equal(OF.latin_hypercube("sym_mig", 5, seed=1), OF.latin_hypercube("sym_mig", 5, seed=2)))
+
+    def starts(self, shard=None):
+        writer = OF.ResultsWriter(OUTNAME, shard=shard)
+        try:
+            jobs = OF._replicate_jobs(writer, "sym_mig", [1, 1, 1, 1], 3, spectrum(), [5, 6, 7], 5, 6, 1, True, None, lhs=True)
+        finally:
+            writer.close()
+        return dict((job["replicate"], tuple(job["start"])) for job in jobs)
+
+    def test_shards_split_one_design(self):
+        starts = self.starts()
+        self.assertEqual(len(set(starts.values())), 6)
+        shards = [self.starts((i, 2)) for i in (1, 2)]
+        self.assertEqual(sorted(shards[0]), [1, 3, 5])
+        self.assertEqual(sorted(shards[1]), [2, 4, 6])
+        #together the shards run the points of the unsharded design
+        shards[0].update(shards[1])
+        self.assertEqual(shards[0], starts)
@@ -0,0 +1,64 @@
+import os
+import sys
+from StringIO import StringIO
+
+import numpy as np
+
+from support import OF, TempDirTestCase, spectrum
+
+
+class ModelCacheTests(TempDirTestCase):
+    def test_key_tolerance(self):
+        cache = OF.ModelCache(tol=OF.FMIN_XTOL)
+        key = cache.key("no_mig", [1, 2, 3], (4, 4), [5, 6, 7])
+        #well within the optimizer's xtol (relative on the params) is the same point
+        self.assertEqual(cache.key("no_mig", [1, 2 * (1 + 1e-6), 3], (4, 4), [5, 6, 7]), key)
+        self.assertNotEqual(cache.key("no_mig", [1, 2 * (1 + 1e-3), 3], (4, 4), [5, 6, 7]), key)
+        self.assertNotEqual(cache.key("no_mig", [1, 2, 3], (4, 4), [5, 6, 8]), key)
+        self.assertNotEqual(cache.key("no_mig", [1, 2, 3], (4, 6), [5, 6, 7]), key)
+        self.assertNotEqual(cache.key("sym_mig", [1, 2, 3], (4, 4), [5, 6, 7]), key)
+
+    def test_exact_keys_by_default(self):
+        cache = OF.ModelCache()
+        self.assertNotEqual(cache.key("no_mig", [1, 2, 3], (4, 4), [5]), cache.key("no_mig", [1, 2 * (1 + 1e-9), 3], (4, 4), [5]))
+        self.assertEqual(cache.key("no_mig", [1, 2, 3], (4, 4), [5]), cache.key("no_mig", [1.0, 2.0, 3.0], (4, 4), [5]))
+
+    def test_nearby_params_are_simulated_by_default(self):
+        #a relative difference well below FMIN_XTOL still gives its own likelihood
+        lls = OF.Evaluate_Batch([5, 6, 7], spectrum(), "no_mig", [[1.5, 2, 3], [1.5 * (1 + 4e-5), 2, 3]])[0]
+        self.assertNotEqual(lls[0], lls[1])
+
+    def test_hits_misses_and_eviction(self):
+        cache = OF.ModelCache(max_size=2)
+        calls = []
+
+        def func_exec(params, ns, pts):
+            calls.append(list(params))
+            return np.array(params)
+
+        cached = cache.wrap("no_mig", func_exec)
+        for params in ([1, 1, 1], [1, 1, 1], [2, 2, 2], [3, 3, 3], [1, 1, 1]):
+            cached(params, (4, 4), [5])
+        #[1, 1, 1] was evicted by the other two before it was asked for again
+        self.assertEqual(len(calls), 4)
+        self.assertEqual((cache.hits, cache.misses), (1, 4))
+
+    def test_disk_cache_is_shared_between_caches(self):
+        first = OF.ModelCache(cache_dir="cache")
+        first.put(first.key("no_mig", [1, 2, 3], (4, 4), [5]), np.arange(3.0))
+        second = OF.ModelCache(cache_dir="cache")
+        self.assertEqual(list(second.get(second.key("no_mig", [1, 2, 3], (4, 4), [5]))), [0, 1, 2])
+        self.assertEqual(second.hits, 1)
+        self.assertEqual(len(os.listdir("cache")), 1)
+
+
+    def test_no_cache_report_when_the_cache_is_off(self):
+        OF.set_model_cache(max_size=0)
+        stdout, sys.stdout = sys.stdout, StringIO()
+        try:
+            OF.Optimize_Round1([5, 6, 7], spectrum(), "T", 1, 5, "no_mig")
+            output = sys.stdout.getvalue()
+        finally:
+            sys.stdout = stdout
+        self.assertNotIn("model cache", output)
+        self.assertIn("model evaluations per replicate", output)
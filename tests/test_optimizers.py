@@ -0,0 +1,112 @@
+import os
+import sys
+
+import numpy as np
+
+from support import OF, TempDirTestCase, spectrum
+
+PTS = [5, 6, 7]
+START = [1.3, 1.6, 3.5]
+
+
+class OptimizerTests(TempDirTestCase):
+    def setUp(self):
+        TempDirTestCase.setUp(self)
+        #every evaluation simulates, a cached optimum can't hide a backend that goes nowhere
+        OF.set_model_cache(max_size=0)
+        self.optimizers = OF.OPTIMIZERS.copy()
+        self.calls = []
+        for name, optimizer in self.optimizers.items():
+            OF.OPTIMIZERS[name] = self.recorder(name, optimizer)
+
+    def tearDown(self):
+        OF.OPTIMIZERS.update(self.optimizers)
+        TempDirTestCase.tearDown(self)
+
+    def recorder(self, name, optimizer):
+        def optimize(params, fs, func_exec, pts, model, maxiter, job):
+            self.calls.append((job["model_name"], name))
+            return optimizer(params, fs, func_exec, pts, model, maxiter, job)
+        return optimize
+
+    def test_gradient_optimizers_reach_the_optimum(self):
+        for name in ("log_lbfgsb", "log_bfgs"):
+            OF.Optimize_Round3(PTS, spectrum(), name, 2, 100, "no_mig", START, optimizer=name)
+            for row in OF.read_results(OF.round_outname(3, name, "no_mig")):
+                for value, optimum in zip(row["params"], [1, 2, 3]):
+                    self.assertAlmostEqual(value, optimum, places=1, msg=name)
+        self.assertEqual(self.calls, [("no_mig", "log_lbfgsb")] * 2 + [("no_mig", "log_bfgs")] * 2)
+
+    def test_optimizer_per_model(self):
+        OF.Optimize_Models(3, PTS, spectrum(), "T", 1, 5, [("no_mig", START), ("sym_mig", START + [1.2])],
+                           optimizer={"sym_mig": "log_lbfgsb"})
+        self.assertEqual(self.calls, [("no_mig", "log_fmin"), ("sym_mig", "log_lbfgsb")])
+
+    def test_bad_optimizer_fails_before_any_file_is_opened(self):
+        with self.assertRaises(ValueError):
+            OF.Optimize_Round1(PTS, spectrum(), "T", 2, 5, "no_mig", optimizer="log_nelder")
+        with self.assertRaises(ValueError):
+            OF.Optimize_Models(1, PTS, spectrum(), "T", 2, 5, [("no_mig", None), ("sym_mig", None)], optimizer={"sym_mig": "log_nelder"})
+        cma = sys.modules.get("cma")
+        #None in sys.modules makes 'import cma' fail, as without the package
+        sys.modules["cma"] = None
+        try:
+            with self.assertRaises(ImportError):
+                OF.Optimize_Round1(PTS, spectrum(), "T", 2, 5, "no_mig", optimizer="cma")
+        finally:
+            if cma is None:
+                del sys.modules["cma"]
+            else:
+                sys.modules["cma"] = cma
+        self.assertEqual(os.listdir("."), [])
+        self.assertEqual(self.calls, [])
+
+
+class ParallelGradientTests(TempDirTestCase):
+    def setUp(self):
+        TempDirTestCase.setUp(self)
+        self.get_func_exec = OF.get_func_exec
+
+    def tearDown(self):
+        OF.get_func_exec = self.get_func_exec
+        TempDirTestCase.tearDown(self)
+
+    def gradient(self, workers=1):
+        return OF.ParallelGradient("no_mig", spectrum(), PTS, OF.get_func_exec("no_mig", PTS), workers)
+
+    def f(self, params):
+        #-log-likelihood of a single parameter set
+        return -OF.Evaluate_Batch(PTS, spectrum(), "no_mig", params)[0][0]
+
+    def test_matches_a_serial_forward_difference(self):
+        x = np.log([1.5, 2.5, 2.0])
+        expected = [(self.f(np.exp(x + 1e-3 * e)) - self.f(np.exp(x))) / 1e-3 for e in np.eye(3)]
+        for workers in (1, 2):
+            self.assertTrue(np.allclose(self.gradient(workers).gradient(x), expected), workers)
+
+    def test_failure_past_the_point_takes_the_difference_backwards(self):
+        def failing(model_name, pts):
+            func_exec = self.get_func_exec(model_name, pts)
+            def f(params, ns, pts):
+                if params[0] > 1.5001:
+                    raise ValueError("fails above nu1 = 1.5")
+                return func_exec(params, ns, pts)
+            return f
+        OF.get_func_exec = failing
+        x = np.log([1.5, 2.5, 2.0])
+        grad = self.gradient().gradient(x)
+        backwards = (self.f(np.exp(x)) - self.f(np.exp(x - [1e-3, 0, 0]))) / 1e-3
+        self.assertAlmostEqual(grad[0], backwards)
+        self.assertTrue(np.all(np.isfinite(grad)))
+
+    def test_failure_on_both_sides_raises(self):
+        def failing(model_name, pts):
+            func_exec = self.get_func_exec(model_name, pts)
+            def f(params, ns, pts):
+                if abs(params[1] - 2.5) > 1e-6:
+                    raise ValueError("only runs at nu2 = 2.5")
+                return func_exec(params, ns, pts)
+            return f
+        OF.get_func_exec = failing
+        with self.assertRaises(FloatingPointError):
+            self.gradient().gradient(np.log([1.5, 2.5, 2.0]))
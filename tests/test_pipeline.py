@@ -0,0 +1,54 @@
+import sys
+
+from support import OF, TempDirTestCase, spectrum
+
+import dadi_pipeline
+
+
+class PipelineTests(TempDirTestCase):
+    def setUp(self):
+        TempDirTestCase.setUp(self)
+        spectrum().to_file("C-O.sfs")
+
+    def test_run_chains_the_rounds_and_best_reads_the_store(self):
+        optimize_models = OF.Optimize_Models
+        starts = {}
+        def record(round_num, pts, fs, outfile, reps, y, models, **kwargs):
+            starts[round_num] = dict(models)
+            return optimize_models(round_num, pts, fs, outfile, reps, y, models, **kwargs)
+        OF.Optimize_Models = record
+        try:
+            dadi_pipeline.main(["run", "C-O.sfs", "--models", "no_mig", "sym_mig", "--reps", "2", "--maxiter", "5",
+                                "--pts", "5,6,7", "--store", "results.sqlite"])
+        finally:
+            OF.Optimize_Models = optimize_models
+        self.assertEqual(sorted(starts), [1, 2, 3])
+        for round_num in (1, 2, 3):
+            for model_name in ("no_mig", "sym_mig"):
+                self.assertEqual(len(OF.read_results(OF.round_outname(round_num, "C-O", model_name))), 2)
+        #rounds 2 and 3 start from the best replicate of the round before
+        for round_num in (2, 3):
+            for model_name in ("no_mig", "sym_mig"):
+                best = OF.best_replicate(OF.round_outname(round_num - 1, "C-O", model_name))
+                self.assertEqual(list(starts[round_num][model_name]), list(best["params"]))
+        OF.set_result_store(None)
+        dadi_pipeline.main(["best", "results.sqlite", "--round", "3"])
+        store = OF.ResultsStore("results.sqlite")
+        try:
+            self.assertEqual(sorted(row["model"] for row in store.best_per_model(round_num=3)), ["no_mig", "sym_mig"])
+        finally:
+            store.close()
+
+    def test_models_file_is_loaded_under_the_module_name(self):
+        #like 2D_Models.py in the 2D folder, a file that can't be imported by its name
+        open("T_Models.py", 'w').write("def t_model(params, ns, pts):\n    return None\n")
+        OF.MODEL_FILES["Models_T"] = "T_Models.py"
+        try:
+            module = OF.import_models("Models_T")
+            self.assertTrue(hasattr(module, "t_model"))
+            self.assertIs(sys.modules["Models_T"], module)
+        finally:
+            del OF.MODEL_FILES["Models_T"]
+            sys.modules.pop("Models_T", None)
+        with self.assertRaises(ImportError):
+            OF.import_models("Models_T")
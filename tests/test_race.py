@@ -0,0 +1,49 @@
+import os
+
+from support import OF, TempDirTestCase, spectrum, write_round
+
+
+class RaceTests(TempDirTestCase):
+    def test_cheap_rounds_keep_to_their_own_files(self):
+        best = OF.Optimize_Race([5, 6, 7], spectrum(), "T", 2, 5, [("no_mig", None), ("sym_mig", None)], rounds=(1, 2),
+                                cheap_pts=[4, 5, 6])
+        self.assertEqual(len(best), 1)
+        model_name = list(best)[0]
+        for other in ("no_mig", "sym_mig"):
+            self.assertTrue(os.path.exists("Round1_T_race_{}_optimized.txt".format(other)))
+            self.assertFalse(os.path.exists("Round1_T_{}_optimized.txt".format(other)))
+        self.assertTrue(os.path.exists("Round2_T_{}_optimized.txt".format(model_name)))
+        self.assertFalse(os.path.exists("Round2_T_race_{}_optimized.txt".format(model_name)))
+        #the summary keeps the cheap rounds apart, and warm starts ignore them
+        self.assertEqual(sorted(OF.Summarize_Rounds(write=False)), [("T", 2), ("T_race", 1)])
+        self.assertEqual(sorted(OF._best_fits(["."])), ["T"])
+
+    def test_pruning_scores_the_best_params_on_pts(self):
+        OF.Optimize_Models(1, [4, 5, 6], spectrum(), "T_race", 1, 5, [("no_mig", [1, 2, 3]), ("sym_mig", [1, 2, 3, 4])])
+        grids = []
+        get_func_exec = OF.get_func_exec
+        OF.get_func_exec = lambda model_name, pts: grids.append(pts) or get_func_exec(model_name, pts)
+        try:
+            survivors = OF._prune(1, "T_race", ["no_mig", "sym_mig"], 2, 10, spectrum(), [5, 6, 7])
+        finally:
+            OF.get_func_exec = get_func_exec
+        self.assertEqual(grids, [[5, 6, 7], [5, 6, 7]])
+        self.assertEqual(len(survivors), 1)
+
+    def test_warm_starts_of_a_race_are_those_of_the_pair(self):
+        #an earlier production run of the pair itself, and a fit of another pair
+        write_round(1, "T-U", "no_mig", [-5.0], [7.0, 7.0, 7.0])
+        write_round(1, "V-W", "no_mig", [-5.0], [2.0, 2.0, 2.0])
+        calls = []
+        warm_starts = OF.Warm_Starts
+        def recording(outfile, model_name, directories="."):
+            starts = warm_starts(outfile, model_name, directories)
+            calls.append((outfile, starts))
+            return starts
+        OF.Warm_Starts = recording
+        try:
+            OF.Optimize_Race([5, 6, 7], spectrum(), "T-U", 2, 5, [("no_mig", None), ("sym_mig", None)], rounds=(1, 2),
+                             cheap_pts=[4, 5, 6], warm_start=".")
+        finally:
+            OF.Warm_Starts = warm_starts
+        self.assertEqual(calls, [("T-U", [[2.0, 2.0, 2.0]]), ("T-U", [])])
@@ -0,0 +1,92 @@
+import unittest
+
+from support import OF
+
+#module, parameter names, bounds and AIC parameter count of every model, as they were in
+#the per-model branches of Optimize_Round1/2/3 (and of the 3D drivers) before MODELS
+OLD_BRANCHES = {
+    "anc_asym_mig": ("Models_2D", ['nu1', 'nu2', 'm12', 'm21', 'T1', 'T2'], [0.01, 0.01, 0.01, 0.01, 0, 0], [30, 30, 20, 20, 10, 10], 6),
+    "anc_asym_mig_size": ("Models_2D", ['nu1a', 'nu2a', 'nu1b', 'nu2b', 'm12', 'm21', 'T1', 'T2'], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0, 0], [30, 30, 30, 30, 20, 20, 10, 10], 8),
+    "anc_sym_mig": ("Models_2D", ['nu1', 'nu2', 'm', 'T1', 'T2'], [0.01, 0.01, 0.01, 0, 0], [30, 30, 20, 10, 10], 5),
+    "anc_sym_mig_size": ("Models_2D", ['nu1a', 'nu2a', 'nu1b', 'nu2b', 'm', 'T1', 'T2'], [0.01, 0.01, 0.01, 0.01, 0.01, 0, 0], [30, 30, 30, 30, 20, 10, 10], 7),
+    "asym_mig": ("Models_2D", ['nu1', 'nu2', 'm12', 'm21', 'T'], [0.01, 0.01, 0.01, 0.01, 0], [30, 30, 20, 20, 10], 5),
+    "asym_mig_size": ("Models_2D", ['nu1a', 'nu2a', 'nu1b', 'nu2b', 'm12', 'm21', 'T1', 'T2'], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0, 0], [30, 30, 30, 30, 20, 20, 10, 10], 8),
+    "asym_mig_twoepoch": ("Models_2D", ['nu1', 'nu2', 'm12a', 'm21a', 'm12b', 'm21b', 'T1', 'T2'], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0, 0], [30, 30, 20, 20, 20, 20, 10, 10], 8),
+    "founder_asym": ("Models_2D", ['nuA', 'nu1', 'nu2', 'm12', 'm21', 'T', 's'], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.001], [30, 30, 30, 20, 20, 10, 0.99], 7),
+    "founder_nomig": ("Models_2D", ['nuA', 'nu1', 'nu2', 'T', 's'], [0.01, 0.01, 0.01, 0.01, 0.001], [30, 30, 30, 10, 0.99], 5),
+    "founder_nomig_admix_early": ("Models_2D", ['nuA', 'nu1', 'nu2', 'T', 's', 'f'], [0.01, 0.01, 0.01, 0.01, 0.001, 0.001], [20, 20, 10, 10, 0.99, 0.99], 6),
+    "founder_nomig_admix_late": ("Models_2D", ['nuA', 'nu1', 'nu2', 'T', 's', 'f'], [0.01, 0.01, 0.01, 0.01, 0.001, 0.001], [20, 20, 10, 10, 0.99, 0.99], 6),
+    "founder_nomig_admix_two_epoch": ("Models_2D", ['nuA', 'nu1', 'nu2', 'T1', 'T2', 's', 'f'], [0.01, 0.01, 0.01, 0.01, 0.01, 0.001, 0.001], [20, 20, 10, 10, 10, 0.99, 0.99], 7),
+    "founder_sym": ("Models_2D", ['nuA', 'nu1', 'nu2', 'm', 'T', 's'], [0.01, 0.01, 0.01, 0.01, 0.01, 0.001], [20, 20, 20, 20, 10, 0.99], 6),
+    "no_divergence": ("Models_2D", [], [], [], 3),
+    "no_mig": ("Models_2D", ['nu1', 'nu2', 'T'], [0.01, 0.01, 0], [30, 30, 10], 3),
+    "no_mig_size": ("Models_2D", ['nu1a', 'nu2a', 'nu1b', 'nu2b', 'T1', 'T2'], [0.01, 0.01, 0.01, 0.01, 0, 0], [30, 30, 30, 30, 10, 10], 6),
+    "sec_contact_asym_mig": ("Models_2D", ['nu1', 'nu2', 'm12', 'm21', 'T1', 'T2'], [0.01, 0.01, 0.01, 0.01, 0, 0], [30, 30, 20, 20, 10, 10], 6),
+    "sec_contact_asym_mig_size": ("Models_2D", ['nu1a', 'nu2a', 'nu1b', 'nu2b', 'm12', 'm21', 'T1', 'T2'], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0, 0], [30, 30, 30, 30, 20, 20, 10, 10], 8),
+    "sec_contact_asym_mig_size_three_epoch": ("Models_2D", ['nu1a', 'nu2a', 'nu1b', 'nu2b', 'm12', 'm21', 'T1', 'T2', 'T3'], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0, 0, 0], [30, 30, 30, 30, 20, 20, 10, 10, 10], 9),
+    "sec_contact_asym_mig_three_epoch": ("Models_2D", ['nu1', 'nu2', 'm12', 'm21', 'T1', 'T2', 'T3'], [0.01, 0.01, 0.01, 0.01, 0, 0, 0], [30, 30, 20, 20, 10, 10, 10], 7),
+    "sec_contact_sym_mig": ("Models_2D", ['nu1', 'nu2', 'm', 'T1', 'T2'], [0.01, 0.01, 0.01, 0, 0], [30, 30, 20, 10, 10], 5),
+    "sec_contact_sym_mig_size": ("Models_2D", ['nu1a', 'nu2a', 'nu1b', 'nu2b', 'm', 'T1', 'T2'], [0.01, 0.01, 0.01, 0.01, 0.01, 0, 0], [30, 30, 30, 30, 20, 10, 10], 7),
+    "sec_contact_sym_mig_size_three_epoch": ("Models_2D", ['nu1a', 'nu2a', 'nu1b', 'nu2b', 'm', 'T1', 'T2', 'T3'], [0.01, 0.01, 0.01, 0.01, 0.01, 0, 0, 0], [30, 30, 30, 30, 20, 10, 10, 10], 8),
+    "sec_contact_sym_mig_three_epoch": ("Models_2D", ['nu1', 'nu2', 'm', 'T1', 'T2', 'T3'], [0.01, 0.01, 0.01, 0, 0, 0], [30, 30, 20, 10, 10, 10], 6),
+    "sym_mig": ("Models_2D", ['nu1', 'nu2', 'm', 'T'], [0.01, 0.01, 0.01, 0], [30, 30, 20, 10], 4),
+    "sym_mig_size": ("Models_2D", ['nu1a', 'nu2a', 'nu1b', 'nu2b', 'm', 'T1', 'T2'], [0.01, 0.01, 0.01, 0.01, 0.01, 0, 0], [30, 30, 30, 30, 20, 10, 10], 7),
+    "sym_mig_twoepoch": ("Models_2D", ['nu1', 'nu2', 'm1', 'm2', 'T1', 'T2'], [0.01, 0.01, 0.01, 0.01, 0, 0], [30, 30, 20, 20, 10, 10], 6),
+    "vic_anc_asym_mig": ("Models_2D", ['nuA', 'nu1', 'nu2', 'm12', 'm21', 'T1', 'T2', 's'], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.001], [20, 20, 20, 10, 10, 10, 10, 0.99], 8),
+    "vic_no_mig": ("Models_2D", ['nuA', 'nu1', 'nu2', 'T', 's'], [0.01, 0.01, 0.01, 0.01, 0.001], [20, 20, 20, 10, 0.99], 5),
+    "vic_no_mig_admix_early": ("Models_2D", ['nuA', 'nu1', 'nu2', 'T', 's', 'f'], [0.01, 0.01, 0.01, 0.01, 0.001, 0.001], [20, 20, 20, 10, 0.99, 0.99], 6),
+    "vic_no_mig_admix_late": ("Models_2D", ['nuA', 'nu1', 'nu2', 'T', 's', 'f'], [0.01, 0.01, 0.01, 0.01, 0.001, 0.001], [20, 20, 20, 10, 0.99, 0.99], 6),
+    "vic_sec_contact_asym_mig": ("Models_2D", ['nuA', 'nu1', 'nu2', 'm12', 'm21', 'T1', 'T2', 's'], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.001], [20, 20, 20, 10, 10, 10, 10, 0.99], 8),
+    "vic_two_epoch_admix": ("Models_2D", ['nuA', 'nu1', 'nu2', 'T1', 'T2', 's', 'f'], [0.01, 0.01, 0.01, 0.01, 0.01, 0.001, 0.001], [20, 20, 20, 10, 10, 0.99, 0.99], 7),
+    "split_asymmig_all": ("Models_3D", ['nu1', 'nuA', 'nu2', 'nu3', 'mA1', 'mA2', 'm12', 'm21', 'm13', 'm31', 'm3', 'T1', 'T2'], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0, 0], [30, 30, 30, 30, 20, 20, 20, 20, 20, 20, 20, 10, 10], 10),
+    "split_nomig": ("Models_3D", ['nu1', 'nuA', 'nu2', 'nu3', 'T1', 'T2'], [0.01, 0.01, 0.01, 0.01, 0, 0], [30, 30, 30, 30, 10, 10], 6),
+    "split_symmig_adjacent": ("Models_3D", ['nu1', 'nuA', 'nu2', 'nu3', 'mA', 'm1', 'm2', 'T1', 'T2'], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0, 0], [30, 30, 30, 30, 20, 20, 20, 10, 10], 9),
+    "split_symmig_all": ("Models_3D", ['nu1', 'nuA', 'nu2', 'nu3', 'mA', 'm1', 'm2', 'm3', 'T1', 'T2'], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0, 0], [30, 30, 30, 30, 20, 20, 20, 20, 10, 10], 10),
+    "starsplit": ("Models_3D", ['nu1', 'nu2', 'nu3', 'm12', 'm21', 'm13', 'm31', 'm3', 'T'], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0], [30, 30, 30, 20, 20, 20, 20, 20, 10], 10),
+}
+
+#the manuscript runs counted these wrong in the AIC, MODELS uses the number of parameters
+CORRECTED_K = set(["split_asymmig_all", "starsplit"])
+
+
+class RegistryTests(unittest.TestCase):
+    def test_models_match_the_old_branches(self):
+        self.assertEqual(sorted(OF.MODELS), sorted(OLD_BRANCHES))
+        for model_name, (module, param_names, lower, upper, k) in OLD_BRANCHES.items():
+            model = OF.MODELS[model_name]
+            self.assertEqual(model.module, module, model_name)
+            self.assertEqual(model.param_names, param_names, model_name)
+            self.assertEqual(model.lower_bound, lower, model_name)
+            self.assertEqual(model.upper_bound, upper, model_name)
+            self.assertEqual(len(model.start), len(param_names), model_name)
+            if model_name in CORRECTED_K:
+                self.assertEqual(model.k, len(param_names), model_name)
+            else:
+                self.assertEqual(model.k, k, model_name)
+
+    def test_bounds_contain_the_starting_params(self):
+        for model_name, model in OF.MODELS.items():
+            for lower, start, upper in zip(model.lower_bound, model.start, model.upper_bound):
+                self.assertTrue(lower <= start <= upper, model_name)
+
+    def test_unknown_model(self):
+        with self.assertRaises(ValueError):
+            OF.get_model("no_such_model")
+
+    def test_model_without_function_in_this_folder(self):
+        #the stub Models_2D.py, like 2D/2D_Models.py, only has the four basic models
+        self.assertEqual(OF.get_model("asym_mig").k, 5)
+        with self.assertRaises(ValueError):
+            OF.get_model("anc_sym_mig")
+        self.assertNotIn("anc_sym_mig", OF.available_models())
+        self.assertIn("split_nomig", OF.available_models())
+
+    def test_model_whose_module_is_missing(self):
+        OF.MODELS["missing_module"] = OF.Model("Models_missing", "x", ["a"], [0.1], [1], [0.5], 1)
+        try:
+            with self.assertRaises(ValueError):
+                OF.get_model("missing_module")
+        finally:
+            del OF.MODELS["missing_module"]
+            OF._defined.pop("missing_module", None)
+
@@ -0,0 +1,59 @@
+import sqlite3
+
+from support import OF, TempDirTestCase, spectrum, write_round
+
+
+class ResultsStoreTests(TempDirTestCase):
+    def setUp(self):
+        TempDirTestCase.setUp(self)
+        self.store = OF.ResultsStore("results.sqlite")
+
+    def tearDown(self):
+        self.store.close()
+        TempDirTestCase.tearDown(self)
+
+    def count(self, table):
+        return self.store.conn.execute("SELECT COUNT(*) FROM {}".format(table)).fetchone()[0]
+
+    def test_insert_replaces_the_same_replicate(self):
+        self.store.insert("T", 1, "no_mig", 1, ll=-10, theta=1, aic=26, params=[1, 2, 3])
+        self.store.insert("T", 1, "no_mig", 1, ll=-8, theta=1, aic=22, params=[1.5, 2, 3])
+        self.store.insert("T", 2, "no_mig", 1, ll=-7, theta=1, aic=20, params=[1, 2, 3])
+        self.assertEqual(self.count("results"), 2)
+        self.assertEqual(self.count("params"), 6)
+        best = self.store.best_per_model(round_num=1)[0]
+        self.assertEqual((best["ll"], best["k"]), (-8, 3))
+        self.assertEqual(best["params"].items(), [("nu1", 1.5), ("nu2", 2), ("T", 3)])
+
+    def test_best_per_model_takes_the_columns_of_the_lowest_aic(self):
+        for i, ll in enumerate([-12, -9, -15, float("nan")], 1):
+            self.store.insert("T", 1, "no_mig", i, ll=ll, theta=i, aic=-2 * ll + 6, params=[i, i, i])
+        self.store.insert("T", 1, "sym_mig", 1, ll=-5, theta=1, aic=18, params=[1, 1, 1, 1])
+        self.store.insert("T", 1, "sym_mig", 2, error="ValueError: failed", params=[1, 1, 1, 1])
+        self.store.insert("U", 1, "no_mig", 1, ll=-1, theta=1, aic=8, params=[1, 1, 1])
+        best = self.store.best_per_model(outfile="T")
+        self.assertEqual([(row["model"], row["replicate"], row["ll"], row["aic"], row["theta"]) for row in best],
+                         [("sym_mig", 1, -5, 18, 1), ("no_mig", 2, -9, 24, 2)])
+        self.assertEqual(best[1]["params"].values(), [2, 2, 2])
+        self.assertEqual(len(self.store.best_per_model()), 3)
+
+    def test_import_file(self):
+        write_round(1, "T", "no_mig", [-10.0, -9.0], [1.0, 2.0, 3.0])
+        self.assertEqual(self.store.import_file("Round1_T_no_mig_optimized.txt", "T", 1, "no_mig"), 2)
+        best = self.store.best_per_model()
+        self.assertEqual([(row["replicate"], row["ll"]) for row in best], [(2, -9.0)])
+        self.assertEqual(best[0]["params"].values(), [1.0, 2.0, 3.0])
+
+    def test_rollback_journal(self):
+        connection = sqlite3.connect("results.sqlite")
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.close()
+        self.assertEqual(self.store.conn.execute("PRAGMA journal_mode").fetchone()[0], "delete")
+
+    def test_round_rows_are_recorded(self):
+        OF.set_result_store("results.sqlite")
+        try:
+            OF.Optimize_Round1([5, 6, 7], spectrum(), "T", 2, 5, "no_mig")
+        finally:
+            OF.set_result_store(None)
+        self.assertEqual(self.count("results"), 2)
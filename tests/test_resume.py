@@ -0,0 +1,43 @@
+import os
+
+from support import OF, TempDirTestCase, spectrum
+
+OUTNAME = "Round1_T_no_mig_optimized.txt"
+
+
+class ResumeTests(TempDirTestCase):
+    def test_resume_runs_only_the_missing_replicates(self):
+        OF.Optimize_Round1([5, 6, 7], spectrum(), "T", 2, 5, "no_mig")
+        first = OF.read_results(OUTNAME)
+        #a crash in the middle of writing replicate 3
+        open(OUTNAME, 'a').write("Divergence with no migration\tnu1_nu2_T\t3\t-1")
+        OF.Optimize_Round1([5, 6, 7], spectrum(), "T", 4, 5, "no_mig")
+        rows = OF.read_results(OUTNAME)
+        self.assertEqual([row["replicate"] for row in rows], [1, 2, 3, 4])
+        self.assertEqual(rows[:2], first)
+
+    def test_no_resume_reruns_the_replicates(self):
+        OF.Optimize_Round1([5, 6, 7], spectrum(), "T", 2, 5, "no_mig")
+        OF.Optimize_Round1([5, 6, 7], spectrum(), "T", 2, 5, "no_mig", resume=False)
+        self.assertEqual([row["replicate"] for row in OF.read_results(OUTNAME)], [1, 2, 1, 2])
+
+    def test_interrupted_replicate_continues_from_its_checkpoint(self):
+        OF._save_checkpoint(OUTNAME + ".ckpt_1", {"params": [1.0, 2.0, 3.0], "ll": -1.0})
+        OF.Optimize_Round1([5, 6, 7], spectrum(), "T", 1, 5, "no_mig")
+        row = OF.read_results(OUTNAME)[0]
+        for value, optimum in zip(row["params"], [1, 2, 3]):
+            self.assertAlmostEqual(value, optimum, places=1)
+        self.assertFalse(os.path.exists(OUTNAME + ".ckpt_1"))
+
+    def test_checkpoints_are_throttled(self):
+        def func_exec(params, ns, pts):
+            #one entry off by params[0] - 1, the best spectrum has params[0] closest to 1
+            sim_model = spectrum()
+            sim_model[1, 1] += 10 * abs(params[0] - 1)
+            return sim_model
+        best = OF._BestSpectrum(func_exec, spectrum(), checkpoint="ckpt")
+        for x in (3.0, 2.0, 1.5):
+            best([x], None, None)
+        self.assertFalse(os.path.exists("ckpt"))
+        best.save_checkpoint()
+        self.assertEqual(list(OF._load_checkpoint("ckpt")["params"]), [1.5])
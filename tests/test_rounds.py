@@ -0,0 +1,119 @@
+import ast
+import glob
+import os
+
+import numpy as np
+
+from support import OF, ROOT, TempDirTestCase, spectrum
+
+
+class RoundTests(TempDirTestCase):
+    def test_round1_writes_one_row_per_replicate(self):
+        OF.Optimize_Round1([5, 6, 7], spectrum(), "T", 3, 5, "no_mig")
+        rows = OF.read_results("Round1_T_no_mig_optimized.txt")
+        self.assertEqual([row["replicate"] for row in rows], [1, 2, 3])
+        for row in rows:
+            self.assertEqual(len(row["params"]), 3)
+            self.assertAlmostEqual(row["aic"], -2 * row["ll"] + 2 * 3, places=1)
+
+    def test_optimized_replicate_is_scored_without_simulating_again(self):
+        #cache off, so every model call the optimizer asks for is a simulation
+        OF.set_model_cache(max_size=0)
+        simulated = []
+        get_func_exec = OF.get_func_exec
+        def counting(model_name, pts):
+            func_exec = get_func_exec(model_name, pts)
+            def f(params, ns, pts):
+                simulated.append(list(params))
+                return func_exec(params, ns, pts)
+            return f
+        OF.get_func_exec = counting
+        evaluations = OF._BestSpectrum.evaluations
+        try:
+            OF.Optimize_Round1([5, 6, 7], spectrum(), "T", 2, 5, "no_mig")
+        finally:
+            OF.get_func_exec = get_func_exec
+        self.assertEqual(len(OF.read_results("Round1_T_no_mig_optimized.txt")), 2)
+        #all simulations were evaluations of the optimizer, the final scores added none
+        self.assertEqual(len(simulated), OF._BestSpectrum.evaluations - evaluations)
+
+    def test_model_without_params_is_simulated_once(self):
+        OF.set_model_cache(max_size=0)
+        simulated = []
+        get_func_exec = OF.get_func_exec
+        def counting(model_name, pts):
+            func_exec = get_func_exec(model_name, pts)
+            def f(params, ns, pts):
+                simulated.append(model_name)
+                return func_exec(params, ns, pts)
+            return f
+        OF.get_func_exec = counting
+        try:
+            OF.Optimize_Round1([5, 6, 7], spectrum(), "T", 5, 5, "no_divergence")
+            #resumed, it is not scored again
+            OF.Optimize_Round1([5, 6, 7], spectrum(), "T", 5, 5, "no_divergence")
+        finally:
+            OF.get_func_exec = get_func_exec
+        self.assertEqual(simulated, ["no_divergence"])
+        rows = OF.read_results("Round1_T_no_divergence_optimized.txt")
+        self.assertEqual([row["replicate"] for row in rows], [1])
+        self.assertEqual(rows[0]["params"], [])
+
+    def test_converge_stops_once_the_optimum_repeats(self):
+        OF.Optimize_Round3([5, 6, 7], spectrum(), "T", 10, 100, "no_mig", [1.3, 1.6, 3.5], converge=2)
+        rows = OF.read_results("Round3_T_no_mig_optimized.txt")
+        #every replicate finds the stub optimum, so the second one ends the round
+        self.assertEqual([row["replicate"] for row in rows], [1, 2])
+        for row in rows:
+            for value, optimum in zip(row["params"], [1, 2, 3]):
+                self.assertAlmostEqual(value, optimum, delta=0.1)
+        #and a resumed round with the same converge has nothing left to run
+        OF.Optimize_Round3([5, 6, 7], spectrum(), "T", 10, 100, "no_mig", [1.3, 1.6, 3.5], converge=2)
+        self.assertEqual(len(OF.read_results("Round3_T_no_mig_optimized.txt")), 2)
+
+    def test_coarse_grid_leaves_a_smaller_budget_on_pts(self):
+        calls = []
+        get_optimizer = OF.get_optimizer
+        def recording(name):
+            def optimizer(params, fs, func_exec, pts, model, maxiter, job):
+                calls.append((pts, maxiter))
+                return get_optimizer(name)(params, fs, func_exec, pts, model, maxiter, job)
+            return optimizer
+        OF.get_optimizer = recording
+        try:
+            OF.Optimize_Round1([5, 6, 7], spectrum(), "T", 1, 10, "no_mig", coarse_pts=[4, 5, 6])
+        finally:
+            OF.get_optimizer = get_optimizer
+        self.assertEqual(calls, [([4, 5, 6], 10), ([5, 6, 7], 3)])
+
+    def test_seeded_replicate_in_this_process_keeps_the_random_state(self):
+        #replicates of log_bfgs_parallel run in the parent with the seed drawn for them
+        writer = OF.ResultsWriter("Round1_T_no_mig_optimized.txt")
+        try:
+            job = OF._replicate_jobs(writer, "no_mig", [1, 1, 1], 3, spectrum(), [5, 6, 7], 5, 1, 2, True, None)[0]
+        finally:
+            writer.close()
+        state = np.random.get_state()
+        result = OF._optimize_replicate(job)
+        self.assertNotIn("error", result)
+        self.assertEqual(np.random.get_state()[1].tolist(), state[1].tolist())
+        self.assertEqual(np.random.get_state()[2], state[2])
+        #and the seed still decides the perturbation
+        self.assertEqual(list(OF._optimize_replicate(job)["params"]), list(result["params"]))
+
+    def test_round1_rejects_params_in_place_of_workers(self):
+        #Optimize_Round1 has no params argument, its 7th positional argument is workers
+        with self.assertRaises(TypeError):
+            OF.Optimize_Round1([5, 6, 7], spectrum(), "T", 3, 5, "no_mig", [1, 1, 1])
+        self.assertFalse(os.path.exists("Round1_T_no_mig_optimized.txt"))
+
+
+class DriverTests(TempDirTestCase):
+    def test_driver_calls_match_round_signatures(self):
+        #positional arguments before workers: pts, fs, outfile, reps, maxiter, model_name(, params)
+        positional = {"Optimize_Round1": 6, "Optimize_Round2": 7, "Optimize_Round3": 7}
+        for path in glob.glob(os.path.join(ROOT, "2D", "0*.py")) + glob.glob(os.path.join(ROOT, "3D", "dadi_3D_0*.py")):
+            for node in ast.walk(ast.parse(open(path).read())):
+                if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr in positional:
+                    self.assertEqual(len(node.args), positional[node.func.attr],
+                                     "{0}: {1} called with {2} positional arguments".format(os.path.basename(path), node.func.attr, len(node.args)))
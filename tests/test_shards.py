@@ -0,0 +1,91 @@
+import multiprocessing
+import os
+import socket
+
+from support import OF, TempDirTestCase, spectrum
+
+OUTNAME = "Round1_T_no_mig_optimized.txt"
+
+
+def _run_shard(index, count):
+    OF.set_writer_options(shard=(index, count))
+    OF.Optimize_Round1([5, 6, 7], spectrum(), "T", 6, 5, "no_mig")
+
+
+class ShardTests(TempDirTestCase):
+    def setUp(self):
+        TempDirTestCase.setUp(self)
+        self.poll = OF.SHARD_POLL
+        OF.SHARD_POLL = 0.1
+
+    def tearDown(self):
+        OF.SHARD_POLL = self.poll
+        TempDirTestCase.tearDown(self)
+
+    def test_concurrent_shards_split_the_replicates_and_merge(self):
+        copies = [multiprocessing.Process(target=_run_shard, args=(i, 3)) for i in (1, 2, 3)]
+        for copy in copies:
+            copy.start()
+        for copy in copies:
+            copy.join(60)
+            self.assertEqual(copy.exitcode, 0)
+        self.assertEqual(sorted(row["replicate"] for row in OF.read_results(OUTNAME)), [1, 2, 3, 4, 5, 6])
+        self.assertEqual(open(OUTNAME).read().count(OF.HEADER), 1)
+        self.assertEqual(sorted(os.listdir(".")), [OUTNAME])
+
+    def test_shard_runs_its_own_replicates(self):
+        writer = OF.ResultsWriter(OUTNAME, shard=(2, 3))
+        writer.close()
+        self.assertEqual([i for i in range(1, 8) if writer.owns(i)], [2, 5])
+
+    def test_unmerged_shards_are_read_with_the_round(self):
+        model = OF.get_model("no_mig")
+        for index, ll in ((1, -10.0), (2, -5.0)):
+            writer = OF.ResultsWriter(OUTNAME, shard=(index, 2))
+            writer.write_row(model, index, ll, 1.0, -2 * ll + 6, [1, 2, 3])
+            writer.close()
+        self.assertEqual(OF.best_replicate(OUTNAME)["replicate"], 2)
+        self.assertEqual([f[3] for f in OF._round_files(".")], [os.path.join(".", OUTNAME)])
+        self.assertEqual(OF.merge_shards(OUTNAME), 2)
+        self.assertEqual([row["replicate"] for row in OF.read_results(OUTNAME)], [1, 2])
+        self.assertEqual(OF._shard_files(OUTNAME), [])
+
+    def test_second_writer_leaves_the_file_alone(self):
+        writer = OF.ResultsWriter(OUTNAME)
+        writer.write_header()
+        writer._write("No migration\tnu1_nu2_T\t1\t-1")
+        writer.flush()
+        with self.assertRaises(RuntimeError):
+            OF.ResultsWriter(OUTNAME)
+        writer.close()
+        #the partial row of the first writer is only cut off once the file is free
+        self.assertTrue(open(OUTNAME).read().endswith("-1"))
+
+    def test_lock_of_a_dead_process_is_taken_over(self):
+        dead = multiprocessing.Process(target=len, args=("",))
+        dead.start()
+        dead.join()
+        open(OUTNAME + ".lock", 'w').write("{0}\t{1}\n".format(socket.gethostname(), dead.pid))
+        OF.ResultsWriter(OUTNAME).close()
+        self.assertFalse(os.path.exists(OUTNAME + ".lock"))
+
+    def test_waiting_stops_for_a_failed_shard(self):
+        OF.ResultsWriter(OUTNAME, shard=(2, 2)).stop()
+        writer = OF.ResultsWriter(OUTNAME, shard=(1, 2))
+        with self.assertRaises(RuntimeError) as raised:
+            writer.finish()
+        self.assertIn("Shard 2 of", str(raised.exception))
+
+    def test_waiting_stops_for_a_dead_shard(self):
+        dead = multiprocessing.Process(target=len, args=("",))
+        dead.start()
+        dead.join()
+        #shard 2 was killed in the middle of the round, its lock is left behind
+        open(OF.shard_path(OUTNAME, 2) + ".lock", 'w').write("{0}\t{1}\n".format(socket.gethostname(), dead.pid))
+        writer = OF.ResultsWriter(OUTNAME, shard=(1, 2))
+        with self.assertRaises(RuntimeError) as raised:
+            writer.finish()
+        self.assertIn("process {} is gone".format(dead.pid), str(raised.exception))
+        #restarted, shard 2 clears the way and merges the round
+        OF.ResultsWriter(OUTNAME, shard=(2, 2)).finish()
+        self.assertEqual(sorted(os.listdir(".")), [OUTNAME])
@@ -0,0 +1,43 @@
+import cPickle
+import os
+
+import numpy as np
+
+from support import OF, TempDirTestCase, spectrum
+
+
+class SharedSpectrumTests(TempDirTestCase):
+    def round_trip(self, fs):
+        #what a pool worker gets: the pickled handle, loaded in its own process
+        return cPickle.loads(cPickle.dumps(OF.SharedSpectrum(fs, "."), 2)).load()
+
+    def assertSameSpectrum(self, fs, loaded):
+        self.assertEqual(loaded.shape, fs.shape)
+        self.assertTrue(np.array_equal(np.ma.getdata(loaded), np.ma.getdata(fs)))
+        self.assertTrue(np.array_equal(np.ma.getmaskarray(loaded), np.ma.getmaskarray(fs)))
+        self.assertEqual(loaded.folded, fs.folded)
+        self.assertEqual(loaded.pop_ids, fs.pop_ids)
+
+    def test_round_trip_keeps_data_mask_folding_and_pop_ids(self):
+        fs = spectrum()
+        fs[2, 3] = np.ma.masked
+        self.assertSameSpectrum(fs, self.round_trip(fs))
+        folded = spectrum((4, 2, 4))
+        folded.folded = True
+        folded.pop_ids = ["C", "D", "O"]
+        loaded = self.round_trip(folded)
+        self.assertSameSpectrum(folded, loaded)
+        #and it scores like the original
+        self.assertEqual(OF.dadi.Inference.ll_multinom(spectrum((4, 2, 4)), loaded),
+                         OF.dadi.Inference.ll_multinom(spectrum((4, 2, 4)), folded))
+
+    def test_shared_spectrum_is_read_only_and_written_once(self):
+        fs = spectrum()
+        loaded = self.round_trip(fs)
+        with self.assertRaises(ValueError):
+            loaded[1, 1] = 0
+        files = sorted(os.listdir("."))
+        self.assertEqual(len(files), 2)
+        #sharing the same spectrum again reuses the files
+        self.assertSameSpectrum(fs, self.round_trip(spectrum()))
+        self.assertEqual(sorted(os.listdir(".")), files)
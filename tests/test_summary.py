@@ -0,0 +1,38 @@
+import math
+import os
+
+from support import OF, TempDirTestCase, write_round
+
+
+class SummaryTests(TempDirTestCase):
+    def setUp(self):
+        TempDirTestCase.setUp(self)
+        #best AICs: no_mig 100 (k 3), sym_mig 102 (k 4), asym_mig 110 (k 5)
+        write_round(1, "T", "no_mig", [-47.0, -47.05, -60.0])
+        write_round(1, "T", "sym_mig", [-47.0, -50.0])
+        write_round(1, "T", "asym_mig", [-50.0, float("nan")])
+        write_round(2, "T", "no_mig", [-46.0])
+
+    def test_akaike_weights(self):
+        rows = OF.Summarize_Rounds(round_num=1, write=False)[("T", 1)]
+        self.assertEqual([row["model"] for row in rows], ["no_mig", "sym_mig", "asym_mig"])
+        self.assertEqual([row["delta_aic"] for row in rows], [0, 2, 10])
+        total = 1 + math.exp(-1) + math.exp(-5)
+        for row, weight in zip(rows, [1 / total, math.exp(-1) / total, math.exp(-5) / total]):
+            self.assertAlmostEqual(row["weight"], weight)
+        self.assertAlmostEqual(sum(row["weight"] for row in rows), 1)
+
+    def test_replicate_counts(self):
+        rows = dict((row["model"], row) for row in OF.Summarize_Rounds(round_num=1, write=False)[("T", 1)])
+        self.assertEqual((rows["no_mig"]["replicates"], rows["no_mig"]["near_best"]), (3, 2))
+        #replicates without a likelihood are left out
+        self.assertEqual(rows["asym_mig"]["replicates"], 1)
+
+    def test_one_table_per_round(self):
+        tables = OF.Summarize_Rounds()
+        self.assertEqual(sorted(tables), [("T", 1), ("T", 2)])
+        self.assertEqual(tables[("T", 2)][0]["weight"], 1)
+        lines = open("Summary_Round1_T.txt").readlines()
+        self.assertEqual(lines[0], OF.SUMMARY_HEADER)
+        self.assertEqual([line.split('\t')[0] for line in lines[1:]], ["no_mig", "sym_mig", "asym_mig"])
+        self.assertTrue(os.path.exists("Summary_Round2_T.txt"))
@@ -0,0 +1,47 @@
+import numpy as np
+
+from support import OF, TempDirTestCase, spectrum, write_round
+
+
+class WarmStartTests(TempDirTestCase):
+    def test_best_fit_of_every_other_pair(self):
+        write_round(1, "C-D", "sym_mig", [-20.0, -10.0], [1.0, 2.0, 0.5, 1.5])
+        write_round(2, "C-D", "sym_mig", [-9.0], [1.1, 2.1, 0.6, 1.6])
+        write_round(1, "D-O", "sym_mig", [-30.0], [3.0, 4.0, 0.2, 2.0])
+        write_round(1, "C-O", "sym_mig", [-5.0], [9.0, 9.0, 9.0, 9.0])
+        #the latest round of each other pair, never the pair's own fit
+        self.assertEqual(OF.Warm_Starts("C-O", "sym_mig"), [[1.1, 2.1, 0.6, 1.6], [3.0, 4.0, 0.2, 2.0]])
+
+    def test_starts_are_clipped_to_the_bounds(self):
+        write_round(1, "C-D", "no_mig", [-20.0], [50.0, 1.0, 0.0])
+        self.assertEqual(OF.Warm_Starts("C-O", "no_mig"), [[30.0, 1.0, 0.01]])
+
+    def test_triplet_start_from_the_pairs(self):
+        write_round(1, "C-D", "no_mig", [-20.0], [2.0, 3.0, 4.0])
+        write_round(1, "C-O", "no_mig", [-20.0], [4.0, 5.0, 2.0])
+        #named the other way round, read as D-O with the populations swapped
+        write_round(1, "O-D", "no_mig", [-20.0], [6.0, 1.0, 1.0])
+        #nu1, nuA (mean of nu2 and nu3), nu2, nu3, T1 (older split minus T2) and T2 (D-O split)
+        self.assertEqual(OF.Warm_Starts("C-D-O", "split_nomig"), [[3.0, 3.75, 2.0, 5.5, 2.0, 1.0]])
+
+    def test_pair_values_take_the_best_divergence_model(self):
+        write_round(1, "C-D", "no_mig", [-20.0], [2.0, 3.0, 4.0])
+        write_round(1, "C-D", "asym_mig", [-10.0], [1.0, 2.0, 0.3, 0.7, 5.0])
+        values = OF._pair_values(OF._best_fits(["."]), "D", "C")
+        self.assertEqual(values, {"nu1": 2.0, "nu2": 1.0, "m12": 0.7, "m21": 0.3, "T": 5.0})
+
+    def test_latin_hypercube_fills_the_turns_of_params(self):
+        writer = OF.ResultsWriter("Round1_C-O_sym_mig_optimized.txt")
+        try:
+            jobs = OF._replicate_jobs(writer, "sym_mig", [1, 1, 1, 1], 3, spectrum(), [5, 6, 7], 5, 6, 1, True, None, lhs=True,
+                                      warm=[[2.0, 2.0, 2.0, 2.0]])
+        finally:
+            writer.close()
+        self.assertEqual([job["params"] for job in jobs[::2]], [[2.0, 2.0, 2.0, 2.0]] * 3)
+        self.assertEqual([job["start"] for job in jobs[::2]], [None] * 3)
+        #the other replicates share a three point design, one point per slice of every parameter
+        lower, upper = OF._log_bounds(OF.get_model("sym_mig"))
+        design = np.array([job["start"] for job in jobs[1::2]])
+        slices = np.floor((np.log(design) - lower) / (upper - lower) * 3).astype(int)
+        for column in slices.T:
+            self.assertEqual(sorted(column), [0, 1, 2])